@@ -3,14 +3,22 @@ Clients module for external service interactions.
 Extracted from the main __init__.py for better modularity.
 """
 
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional
 import asyncio
 import aiohttp
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from io import BytesIO
 from ..utils.logging import structured_logger
 from ..utils.metrics import MetricsCollector
 from ..exceptions import ArxivMCPError
 
+# Session opened by AsyncArxivDownloader.scoped_session; visible only to the
+# task that opened it and to tasks it starts, never to concurrent callers
+_scoped_session: ContextVar[Optional[aiohttp.ClientSession]] = ContextVar(
+    "arxiv_scoped_session", default=None
+)
+
 
 class AsyncArxivDownloader:
     """Asynchronous ArXiv paper downloader with rate limiting and error handling."""
@@ -22,6 +30,53 @@ class AsyncArxivDownloader:
         self.last_request_times = []
         self.logger = structured_logger()
         self.metrics = MetricsCollector()
+        # Shared session set by the owner of a batch; when unset each download
+        # opens its own. The owner is responsible for closing it.
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    @staticmethod
+    def create_session(max_connections: int) -> aiohttp.ClientSession:
+        """Create a keep-alive session sized for ``max_connections`` concurrent downloads."""
+        connector = aiohttp.TCPConnector(
+            limit=max_connections, limit_per_host=max_connections, ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    @asynccontextmanager
+    async def scoped_session(self, max_connections: int) -> AsyncIterator[None]:
+        """Share one keep-alive session among downloads started inside this block.
+
+        Only the current task and tasks created within the block use it, so
+        concurrent downloads elsewhere are unaffected when it closes. Reuses an
+        already open shared or scoped session instead of opening another.
+        """
+        if self._active_session() is not None:
+            yield
+            return
+        session = self.create_session(max_connections)
+        token = _scoped_session.set(session)
+        try:
+            yield
+        finally:
+            _scoped_session.reset(token)
+            await session.close()
+
+    def _active_session(self) -> Optional[aiohttp.ClientSession]:
+        """The scoped session of this task if any, else the shared session."""
+        for session in (_scoped_session.get(), self.session):
+            if session is not None and not session.closed:
+                return session
+        return None
+
+    @asynccontextmanager
+    async def _client_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the scoped or shared session if one is set, else a per-request session."""
+        session = self._active_session()
+        if session is not None:
+            yield session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
 
     async def _rate_limit(self):
         """Implement rate limiting based on requests per second."""
@@ -48,7 +103,7 @@ class AsyncArxivDownloader:
             self.logger.info(f"Downloading ArXiv paper {arxiv_id} from {url}")
 
             try:
-                async with aiohttp.ClientSession() as session:
+                async with self._client_session() as session:
                     async with session.get(
                         url, timeout=aiohttp.ClientTimeout(total=timeout)
                     ) as response:
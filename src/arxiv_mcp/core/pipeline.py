@@ -41,8 +41,14 @@ class ArxivPipeline:
         self.extraction_semaphore = asyncio.Semaphore(config.max_extractions)
         self.compilation_semaphore = asyncio.Semaphore(config.max_compilations)
 
-    async def process_paper(self, arxiv_id: str, include_pdf: bool = True) -> Dict[str, Any]:
-        """Process a single ArXiv paper through the complete pipeline."""
+    async def process_paper(
+        self, arxiv_id: str, include_pdf: bool = True, include_files: bool = False
+    ) -> Dict[str, Any]:
+        """Process a single ArXiv paper through the complete pipeline.
+
+        With ``include_files`` the extracted archive is returned under ``"files"``
+        so callers can save it without downloading and extracting it again.
+        """
         self.logger.info(f"Starting pipeline processing for {arxiv_id}")
 
         try:
@@ -81,6 +87,8 @@ class ArxivPipeline:
                 "file_count": len(files),
                 "success": True,
             }
+            if include_files:
+                result["files"] = files
 
             # Optionally compile to PDF
             if include_pdf:
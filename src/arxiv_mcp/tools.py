@@ -29,7 +29,7 @@ from .utils.citations import (
     CitationFormat,
 )
 from .utils.docs_generator import DocGenerator
-from .utils.trending_analysis import TrendingAnalyzer
+from .utils.trending_analysis import get_trending_analyzer
 from .clients.arxiv_api import ArxivAPIClient
 from .core.pipeline import ArxivPipeline
 
@@ -491,8 +491,7 @@ def handle_analyze_citation_network(
 
 def handle_get_trending_papers(category: str = None, days: int = 7) -> Dict[str, Any]:
     """Handle get_trending_papers tool with real TrendingAnalyzer."""
-    analyzer = TrendingAnalyzer()
-    report = analyzer.generate_trending_report(days=days)
+    report = get_trending_analyzer().generate_trending_report(days=days)
     return {
         "status": "success",
         "trending_report": {
@@ -420,3 +420,15 @@ class LaTeXToMarkdownConverter:
             "success": conversion_result["success"],
             "warnings": conversion_result.get("warnings"),
         }
+
+    def convert_with_metadata_bytes(
+        self, tex_bytes: bytes, arxiv_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Convert raw LaTeX bytes to Markdown and extract metadata.
+
+        Decodes as UTF-8 (ignoring invalid bytes) so callers holding the
+        archive contents never need to keep a decoded copy of their own.
+        """
+        return self.convert_with_metadata(
+            tex_bytes.decode("utf-8", errors="ignore"), arxiv_id
+        )
@@ -6,20 +6,75 @@ This module provides monitoring and notification capabilities for research paper
 including update tracking, version monitoring, and alert systems.
 """
 
+import asyncio
 import json
+import os
 import sqlite3
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime, timedelta
-import uuid
 import hashlib
 from enum import Enum
 
 from .logging import get_logger
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+_SQL_UPDATE_MONITOR_FULL = """
+    UPDATE paper_monitors
+    SET title = ?, authors = ?, version = ?, content_hash = ?,
+        metadata_hash = ?, last_check = ?
+    WHERE paper_id = ?
+"""
+
+_SQL_UPDATE_MONITOR_TOUCH = "UPDATE paper_monitors SET last_check = ? WHERE paper_id = ?"
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a JSON column value to bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_loads(raw: Any) -> Any:
+    """Deserialize a JSON column value stored as BLOB or legacy TEXT."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _new_id() -> str:
+    """Generate a random 128-bit identifier as a hex string."""
+    return os.urandom(16).hex()
+
+
+def _id_to_db(identifier: str) -> Any:
+    """Convert a hex identifier to its 16-byte BLOB storage form.
+
+    Identifiers that are not 32-char hex (legacy UUID strings, the
+    ``"system"`` rule) are stored unchanged.
+    """
+    if len(identifier) == 32:
+        try:
+            return bytes.fromhex(identifier)
+        except ValueError:
+            pass
+    return identifier
+
+
+def _id_from_db(value: Any) -> str:
+    """Convert a stored identifier back to its hex string form."""
+    return value.hex() if isinstance(value, bytes) else value
+
 
 class NotificationType(Enum):
     """Types of notifications."""
@@ -109,6 +164,7 @@ class PaperNotificationSystem:
 
     PRIORITY_LEVELS = ["low", "normal", "high", "urgent"]
     FREQUENCY_OPTIONS = ["immediate", "daily", "weekly"]
+    BULK_CHUNK_SIZE = 500  # stays below SQLITE_MAX_VARIABLE_NUMBER (999)
 
     def __init__(self, cache_dir: Optional[str] = None, db_path: Optional[str] = None):
         """Initialize the notification system.
@@ -145,15 +201,15 @@ class PaperNotificationSystem:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS notification_rules (
-                    id TEXT PRIMARY KEY,
+                    id BLOB PRIMARY KEY,
                     name TEXT NOT NULL,
                     notification_type TEXT NOT NULL,
-                    conditions TEXT NOT NULL,
+                    conditions BLOB NOT NULL,
                     is_active BOOLEAN DEFAULT 1,
                     frequency TEXT DEFAULT 'immediate',
                     last_triggered TIMESTAMP,
                     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    metadata TEXT
+                    metadata BLOB
                 )
             """
             )
@@ -162,8 +218,8 @@ class PaperNotificationSystem:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS notifications (
-                    id TEXT PRIMARY KEY,
-                    rule_id TEXT NOT NULL,
+                    id BLOB PRIMARY KEY,
+                    rule_id BLOB NOT NULL,
                     paper_id TEXT NOT NULL,
                     title TEXT NOT NULL,
                     message TEXT NOT NULL,
@@ -171,7 +227,7 @@ class PaperNotificationSystem:
                     priority TEXT DEFAULT 'normal',
                     is_read BOOLEAN DEFAULT 0,
                     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    data TEXT,
+                    data BLOB,
                     FOREIGN KEY (rule_id) REFERENCES notification_rules (id)
                 )
             """
@@ -183,7 +239,7 @@ class PaperNotificationSystem:
                 CREATE TABLE IF NOT EXISTS paper_monitors (
                     paper_id TEXT PRIMARY KEY,
                     title TEXT NOT NULL,
-                    authors TEXT,
+                    authors BLOB,
                     version TEXT,
                     last_check TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     content_hash TEXT,
@@ -222,7 +278,7 @@ class PaperNotificationSystem:
                 f"Invalid frequency: {frequency}. Must be one of {self.FREQUENCY_OPTIONS}"
             )
 
-        rule_id = str(uuid.uuid4())
+        rule_id = _new_id()
 
         rule = NotificationRule(
             id=rule_id,
@@ -240,12 +296,12 @@ class PaperNotificationSystem:
                 VALUES (?, ?, ?, ?, ?, ?)
             """,
                 (
-                    rule_id,
+                    _id_to_db(rule_id),
                     name,
                     notification_type.value,
-                    json.dumps(conditions),
+                    _json_dumps(conditions),
                     frequency,
-                    json.dumps({}),
+                    _json_dumps({}),
                 ),
             )
 
@@ -267,10 +323,10 @@ class PaperNotificationSystem:
             rules = []
             for result in results:
                 rule = NotificationRule(
-                    id=result[0],
+                    id=_id_from_db(result[0]),
                     name=result[1],
                     notification_type=NotificationType(result[2]),
-                    conditions=json.loads(result[3]),
+                    conditions=_json_loads(result[3]),
                     is_active=bool(result[4]),
                     frequency=result[5],
                     last_triggered=datetime.fromisoformat(result[6])
@@ -279,7 +335,7 @@ class PaperNotificationSystem:
                     created_date=datetime.fromisoformat(result[7])
                     if result[7]
                     else datetime.now(),
-                    metadata=json.loads(result[8]) if result[8] else {},
+                    metadata=_json_loads(result[8]) if result[8] else {},
                 )
                 rules.append(rule)
 
@@ -324,7 +380,7 @@ class PaperNotificationSystem:
                 (
                     paper_id,
                     title,
-                    json.dumps(authors),
+                    _json_dumps(authors),
                     version,
                     content_hash,
                     metadata_hash,
@@ -339,6 +395,15 @@ class PaperNotificationSystem:
         self, paper_id: str, current_data: Dict[str, Any]
     ) -> List[Notification]:
         """Check for updates to a monitored paper."""
+        notifications = self._check_paper_updates(paper_id, current_data)
+        for notification in notifications:
+            self._trigger_handlers(notification)
+        return notifications
+
+    def _check_paper_updates(
+        self, paper_id: str, current_data: Dict[str, Any]
+    ) -> List[Notification]:
+        """Store update notifications for a paper without running handlers."""
         notifications = []
 
         with sqlite3.connect(self.db_path) as conn:
@@ -361,7 +426,7 @@ class PaperNotificationSystem:
                 stored_metadata_hash,
             ) = monitor_result
             stored_authors = (
-                json.loads(stored_authors_json) if stored_authors_json else []
+                _json_loads(stored_authors_json) if stored_authors_json else []
             )
 
             # Check for version changes
@@ -378,6 +443,7 @@ class PaperNotificationSystem:
                         "new_version": current_version,
                         "change_type": "version_update",
                     },
+                    trigger=False,
                 )
                 notifications.append(notification)
 
@@ -415,20 +481,25 @@ class PaperNotificationSystem:
                                 "authors": current_authors,
                             },
                         },
+                        trigger=False,
                     )
                     notifications.append(notification)
 
-            # Update monitor record
+            # Update monitor record; unchanged papers only need last_check bumped
+            if (
+                current_version == stored_version
+                and current_metadata_hash == stored_metadata_hash
+            ):
+                conn.execute(
+                    _SQL_UPDATE_MONITOR_TOUCH, (datetime.now().isoformat(), paper_id)
+                )
+                return notifications
+
             conn.execute(
-                """
-                UPDATE paper_monitors
-                SET title = ?, authors = ?, version = ?, content_hash = ?,
-                    metadata_hash = ?, last_check = ?
-                WHERE paper_id = ?
-            """,
+                _SQL_UPDATE_MONITOR_FULL,
                 (
                     current_title or stored_title,
-                    json.dumps(current_authors),
+                    _json_dumps(current_authors),
                     current_version,
                     hashlib.md5(
                         f"{current_title}{current_authors}{current_version}".encode()
@@ -450,12 +521,13 @@ class PaperNotificationSystem:
         priority: str = "normal",
         data: Dict[str, Any] = None,
         rule_id: str = None,
+        trigger: bool = True,
     ) -> Notification:
-        """Create and store a notification."""
+        """Create and store a notification, running its handlers unless ``trigger`` is off."""
         if priority not in self.PRIORITY_LEVELS:
             priority = "normal"
 
-        notification_id = str(uuid.uuid4())
+        notification_id = _new_id()
         rule_id = rule_id or "system"
         data = data or {}
 
@@ -478,19 +550,20 @@ class PaperNotificationSystem:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
                 (
-                    notification_id,
-                    rule_id,
+                    _id_to_db(notification_id),
+                    _id_to_db(rule_id),
                     paper_id,
                     title,
                     message,
                     notification_type.value,
                     priority,
-                    json.dumps(data),
+                    _json_dumps(data),
                 ),
             )
 
         # Trigger handlers
-        self._trigger_handlers(notification)
+        if trigger:
+            self._trigger_handlers(notification)
 
         return notification
 
@@ -640,7 +713,7 @@ class PaperNotificationSystem:
                 """
                 UPDATE notification_rules SET last_triggered = ? WHERE id = ?
             """,
-                (datetime.now().isoformat(), rule_id),
+                (datetime.now().isoformat(), _id_to_db(rule_id)),
             )
 
     def get_notifications(
@@ -658,8 +731,8 @@ class PaperNotificationSystem:
             notifications = []
             for result in results:
                 notification = Notification(
-                    id=result[0],
-                    rule_id=result[1],
+                    id=_id_from_db(result[0]),
+                    rule_id=_id_from_db(result[1]),
                     paper_id=result[2],
                     title=result[3],
                     message=result[4],
@@ -669,7 +742,7 @@ class PaperNotificationSystem:
                     created_date=datetime.fromisoformat(result[8])
                     if result[8]
                     else datetime.now(),
-                    data=json.loads(result[9]) if result[9] else {},
+                    data=_json_loads(result[9]) if result[9] else {},
                 )
                 notifications.append(notification)
 
@@ -678,13 +751,7 @@ class PaperNotificationSystem:
     def mark_notification_read(self, notification_id: str) -> bool:
         """Mark a notification as read."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    UPDATE notifications SET is_read = 1 WHERE id = ?
-                """,
-                    (notification_id,),
-                )
+            self.mark_notifications_read([notification_id])
 
             logger.info(f"Marked notification {notification_id} as read")
             return True
@@ -692,6 +759,27 @@ class PaperNotificationSystem:
             logger.error(f"Failed to mark notification as read: {e}")
             return False
 
+    def mark_notifications_read(self, notification_ids: Sequence[str]) -> int:
+        """Mark several notifications as read in a single transaction.
+
+        IDs are bound in chunks to stay under SQLite's host parameter limit.
+
+        Returns:
+            Number of notifications updated
+        """
+        count = 0
+        with sqlite3.connect(self.db_path) as conn:
+            for start in range(0, len(notification_ids), self.BULK_CHUNK_SIZE):
+                chunk = notification_ids[start : start + self.BULK_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"UPDATE notifications SET is_read = 1 WHERE id IN ({placeholders})",
+                    tuple(_id_to_db(notification_id) for notification_id in chunk),
+                )
+                count += cursor.rowcount
+
+        return count
+
     def mark_all_read(self) -> int:
         """Mark all notifications as read."""
         with sqlite3.connect(self.db_path) as conn:
@@ -706,31 +794,29 @@ class PaperNotificationSystem:
     def get_notification_stats(self) -> NotificationStats:
         """Get notification statistics."""
         with sqlite3.connect(self.db_path) as conn:
-            # Total notifications
-            total = conn.execute("SELECT COUNT(*) FROM notifications").fetchone()[0]
-
-            # Unread notifications
-            unread = conn.execute(
-                "SELECT COUNT(*) FROM notifications WHERE is_read = 0"
-            ).fetchone()[0]
-
-            # By type
-            type_results = conn.execute(
+            # Totals, unread, by type and by priority from a single scan
+            group_results = conn.execute(
                 """
-                SELECT notification_type, COUNT(*) FROM notifications
-                GROUP BY notification_type
+                SELECT notification_type, priority, COUNT(*),
+                       SUM(CASE WHEN is_read = 0 THEN 1 ELSE 0 END)
+                FROM notifications
+                GROUP BY notification_type, priority
             """
             ).fetchall()
-            notifications_by_type = {row[0]: row[1] for row in type_results}
 
-            # By priority
-            priority_results = conn.execute(
-                """
-                SELECT priority, COUNT(*) FROM notifications
-                GROUP BY priority
-            """
-            ).fetchall()
-            notifications_by_priority = {row[0]: row[1] for row in priority_results}
+            total = 0
+            unread = 0
+            notifications_by_type: Dict[str, int] = {}
+            notifications_by_priority: Dict[str, int] = {}
+            for notification_type, priority, count, unread_count in group_results:
+                total += count
+                unread += unread_count
+                notifications_by_type[notification_type] = (
+                    notifications_by_type.get(notification_type, 0) + count
+                )
+                notifications_by_priority[priority] = (
+                    notifications_by_priority.get(priority, 0) + count
+                )
 
             # Active rules
             active_rules = conn.execute(
@@ -780,12 +866,10 @@ class PaperNotificationSystem:
                     f"Handler error for {notification.notification_type.value}: {e}"
                 )
 
-    async def run_monitoring_cycle(self) -> int:
-        """Run a complete monitoring cycle for all active monitors."""
-        notifications_created = 0
-
+    def _get_active_monitors(self) -> List[tuple]:
+        """Fetch scheduling info for all active paper monitors."""
         with sqlite3.connect(self.db_path) as conn:
-            monitors = conn.execute(
+            return conn.execute(
                 """
                 SELECT paper_id, title, check_frequency, last_check
                 FROM paper_monitors
@@ -793,28 +877,44 @@ class PaperNotificationSystem:
             """
             ).fetchall()
 
-            for monitor in monitors:
-                paper_id, title, check_frequency_seconds, last_check_str = monitor
-                last_check = (
-                    datetime.fromisoformat(last_check_str)
-                    if last_check_str
-                    else datetime.now()
+    async def run_monitoring_cycle(self) -> int:
+        """Run a complete monitoring cycle for all active monitors.
+
+        SQLite work runs in the default executor so the event loop is not
+        blocked while the database is busy; registered handlers still run on
+        the event loop.
+        """
+        notifications_created = 0
+
+        loop = asyncio.get_running_loop()
+        monitors = await loop.run_in_executor(None, self._get_active_monitors)
+
+        for monitor in monitors:
+            paper_id, title, check_frequency_seconds, last_check_str = monitor
+            last_check = (
+                datetime.fromisoformat(last_check_str)
+                if last_check_str
+                else datetime.now()
+            )
+            check_frequency = timedelta(seconds=check_frequency_seconds)
+
+            # Check if it's time to monitor this paper
+            if datetime.now() - last_check >= check_frequency:
+                # In a real implementation, you would fetch current paper data
+                # For now, we'll simulate with mock data
+                current_data = {
+                    "arxiv_id": paper_id,
+                    "title": title,
+                    "version": "1",
+                    "authors": [],
+                }
+
+                notifications = await loop.run_in_executor(
+                    None, self._check_paper_updates, paper_id, current_data
                 )
-                check_frequency = timedelta(seconds=check_frequency_seconds)
-
-                # Check if it's time to monitor this paper
-                if datetime.now() - last_check >= check_frequency:
-                    # In a real implementation, you would fetch current paper data
-                    # For now, we'll simulate with mock data
-                    current_data = {
-                        "arxiv_id": paper_id,
-                        "title": title,
-                        "version": "1",
-                        "authors": [],
-                    }
-
-                    notifications = self.check_paper_updates(paper_id, current_data)
-                    notifications_created += len(notifications)
+                for notification in notifications:
+                    self._trigger_handlers(notification)
+                notifications_created += len(notifications)
 
         logger.info(
             f"Monitoring cycle completed: {notifications_created} notifications created"
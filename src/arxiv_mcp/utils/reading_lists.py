@@ -6,11 +6,15 @@ This module provides personal collection and bookmarking capabilities
 for research papers, enabling users to organize and manage their reading.
 """
 
+import dataclasses
 import json
+import re
 import sqlite3
-from typing import List, Dict, Any, Optional
-from collections import Counter
-from dataclasses import dataclass, field, asdict
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional
+from itertools import groupby
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime, timedelta
 import uuid
@@ -19,8 +23,187 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+_FTS_TOKEN_RE = re.compile(r"\w+")
 
-@dataclass
+_SQL_APPEND_LIST_PAPER = """
+    INSERT OR REPLACE INTO list_papers (list_id, arxiv_id, position)
+    VALUES (
+        ?, ?,
+        COALESCE((SELECT MAX(position) + 1 FROM list_papers WHERE list_id = ?), 1)
+    )
+"""
+
+# Bulk import from a JSON array of paper objects (see import_reading_list)
+_SQL_IMPORT_PAPERS_JSON = """
+    INSERT OR REPLACE INTO papers
+    (arxiv_id, title, authors, abstract, categories, url, pdf_url,
+     tags, notes, rating, read_status)
+    SELECT json_extract(value, '$.arxiv_id'),
+           json_extract(value, '$.title'),
+           COALESCE(json_extract(value, '$.authors'), '[]'),
+           COALESCE(json_extract(value, '$.abstract'), ''),
+           COALESCE(json_extract(value, '$.categories'), '[]'),
+           COALESCE(json_extract(value, '$.url'), ''),
+           COALESCE(json_extract(value, '$.pdf_url'), ''),
+           COALESCE(json_extract(value, '$.tags'), '[]'),
+           COALESCE(json_extract(value, '$.notes'), ''),
+           json_extract(value, '$.rating'),
+           COALESCE(json_extract(value, '$.read_status'), 'unread')
+    FROM json_each(?)
+"""
+
+_SQL_INSERT_READING_LIST = """
+    INSERT INTO reading_lists (id, name, description, tags, metadata)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_IMPORT_LIST_PAPERS_JSON = """
+    INSERT OR REPLACE INTO list_papers (list_id, arxiv_id, position)
+    SELECT ?, json_extract(value, '$.arxiv_id'), key + 1
+    FROM json_each(?)
+"""
+
+# Paper columns understood by ReadingListManager._row_to_paper
+_PAPER_COLUMNS = """
+    p.arxiv_id, p.title, p.authors, p.abstract, p.categories,
+    p.submitted_date, p.url, p.pdf_url, p.tags, p.notes,
+    p.rating, p.read_status, p.added_date, p.last_accessed
+"""
+
+# Reading list columns understood by ReadingListManager._row_to_reading_list
+_LIST_COLUMNS = """
+    rl.id, rl.name, rl.description, rl.tags AS list_tags, rl.created_date,
+    rl.modified_date, rl.is_public, rl.metadata
+"""
+
+_SQL_UPSERT_PAPER = """
+    INSERT OR REPLACE INTO papers
+    (arxiv_id, title, authors, abstract, categories, submitted_date,
+     url, pdf_url, tags, notes, rating, read_status, last_accessed)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_LIST_PAPER = """
+    INSERT OR REPLACE INTO list_papers (list_id, arxiv_id, position)
+    VALUES (?, ?, ?)
+"""
+
+# CSV export rows; JSON list columns are flattened in document order
+_SQL_EXPORT_CSV = """
+    SELECT p.arxiv_id, p.title,
+           COALESCE((SELECT group_concat(value, ', ') FROM json_each(p.authors)), ''),
+           COALESCE(p.abstract, ''),
+           COALESCE((SELECT group_concat(value, ', ') FROM json_each(p.categories)), ''),
+           COALESCE(p.read_status, 'unread'),
+           p.rating,
+           COALESCE(p.notes, ''),
+           COALESCE((SELECT group_concat(value, ', ') FROM json_each(p.tags)), ''),
+           COALESCE(replace(p.added_date, ' ', 'T'), '')
+    FROM papers p
+    JOIN list_papers lp ON p.arxiv_id = lp.arxiv_id
+    WHERE lp.list_id = ?
+    ORDER BY lp.position, lp.added_date
+"""
+
+# search_papers text matching: extra JOIN and WHERE condition per mode
+_SEARCH_MATCH_MODES = {
+    "fts": (" JOIN papers_fts f ON f.rowid = p.rowid", "papers_fts MATCH ?"),
+    "like": ("", "(p.title LIKE ? OR p.abstract LIKE ? OR p.notes LIKE ?)"),
+    None: ("", None),
+}
+
+
+def _build_search_sql(
+    match: Optional[str], has_list: bool, has_status: bool, tag_count: int = 0
+) -> str:
+    """Build a search statement; parameters bind as list, match, status, tags."""
+    join, match_condition = _SEARCH_MATCH_MODES[match]
+    sql = f"SELECT {_PAPER_COLUMNS} FROM papers p"
+    conditions = []
+    if has_list:
+        sql += " JOIN list_papers lp ON p.arxiv_id = lp.arxiv_id"
+        conditions.append("lp.list_id = ?")
+    sql += join
+    if match_condition:
+        conditions.append(match_condition)
+    if has_status:
+        conditions.append("p.read_status = ?")
+    if tag_count:
+        # Papers carrying any of the requested tags
+        conditions.append(
+            "EXISTS (SELECT 1 FROM paper_tags pt WHERE pt.arxiv_id = p.arxiv_id"
+            f" AND pt.tag IN ({','.join('?' * tag_count)}))"
+        )
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    return sql + " ORDER BY p.last_accessed DESC, p.added_date DESC"
+
+
+# Every untagged search maps onto one of these, keyed by
+# (match mode, has_list, has_status), so the statement cache stays warm
+_SEARCH_SQL = {
+    (match, has_list, has_status): _build_search_sql(match, has_list, has_status)
+    for match in _SEARCH_MATCH_MODES
+    for has_list in (False, True)
+    for has_status in (False, True)
+}
+
+# Secondary indexes dropped and rebuilt around large imports
+_BULK_INDEXES = {
+    "idx_papers_status": "CREATE INDEX IF NOT EXISTS idx_papers_status ON papers(read_status)",
+    "idx_papers_rating": "CREATE INDEX IF NOT EXISTS idx_papers_rating ON papers(rating)",
+    "idx_list_papers_list": (
+        "CREATE INDEX IF NOT EXISTS idx_list_papers_list ON list_papers(list_id)"
+    ),
+}
+
+# Imports larger than this rebuild _BULK_INDEXES once instead of per row
+BULK_IMPORT_INDEX_THRESHOLD = 1000
+
+# Imported paper fields that must hold JSON arrays when present
+_IMPORT_LIST_FIELDS = ("authors", "categories", "tags")
+
+
+def _is_importable_paper(paper_data: Any) -> bool:
+    """Whether an imported paper entry can be stored; bad entries are skipped."""
+    if not isinstance(paper_data, dict):
+        return False
+    if not all(
+        isinstance(paper_data.get(key), str) and paper_data[key]
+        for key in ("arxiv_id", "title")
+    ):
+        return False
+    return all(
+        isinstance(paper_data.get(key, []), list) for key in _IMPORT_LIST_FIELDS
+    )
+
+
+def _reset_invalid_checks(paper_data: Dict[str, Any], statuses: List[str]) -> Dict[str, Any]:
+    """Copy of an imported paper with out-of-range rating/status reset to defaults.
+
+    Mirrors ``_migrate_papers_checks`` so one bad value does not trip the
+    papers CHECK constraints and roll back the whole import.
+    """
+    rating = paper_data.get("rating")
+    if rating is not None and not (
+        isinstance(rating, int) and not isinstance(rating, bool) and 1 <= rating <= 5
+    ):
+        paper_data = {**paper_data, "rating": None}
+    if paper_data.get("read_status", "unread") not in statuses:
+        paper_data = {**paper_data, "read_status": "unread"}
+    return paper_data
+
+
+def _status_counter_update(statuses: List[str], sign: str, status_expr: str, where: str) -> str:
+    """UPDATE adjusting the reading_lists per-status counters by one paper."""
+    assignments = ", ".join(
+        f"{status}_count = {status}_count {sign} ({status_expr} IS '{status}')"
+        for status in statuses
+    )
+    return f"UPDATE reading_lists SET {assignments} WHERE {where};"
+
+
+@dataclass(slots=True)
 class Paper:
     """Represents a research paper in a reading list."""
 
@@ -39,8 +222,81 @@ class Paper:
     added_date: datetime = field(default_factory=datetime.now)
     last_accessed: Optional[datetime] = None
 
+    def _to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the fields, cheaper than dataclasses.asdict."""
+        return {
+            "arxiv_id": self.arxiv_id,
+            "title": self.title,
+            "authors": list(self.authors),
+            "abstract": self.abstract,
+            "categories": list(self.categories),
+            "submitted_date": self.submitted_date,
+            "url": self.url,
+            "pdf_url": self.pdf_url,
+            "tags": list(self.tags),
+            "notes": self.notes,
+            "rating": self.rating,
+            "read_status": self.read_status,
+            "added_date": self.added_date,
+            "last_accessed": self.last_accessed,
+        }
+
+
+# Paper fields _LazyPaper keeps as raw JSON, mapped to their backing slot
+_LAZY_JSON_FIELDS = {
+    "authors": "_raw_authors",
+    "categories": "_raw_categories",
+    "tags": "_raw_tags",
+}
+
+
+class _LazyPaper(Paper):
+    """Paper read from the database whose JSON list fields decode on first access.
+
+    Enumerations that only look at ids, titles or statuses never pay for
+    ``json.loads``; once decoded, a field behaves like a regular attribute.
+    """
+
+    __slots__ = tuple(_LAZY_JSON_FIELDS.values())
 
-@dataclass
+    def __init__(
+        self,
+        raw_authors: Optional[str] = None,
+        raw_categories: Optional[str] = None,
+        raw_tags: Optional[str] = None,
+        **fields: Any,
+    ):
+        # Plain Paper fields are accepted too, so dataclasses.replace() works
+        self._raw_authors = raw_authors
+        self._raw_categories = raw_categories
+        self._raw_tags = raw_tags
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached while a lazy slot is still unset
+        raw_name = _LAZY_JSON_FIELDS.get(name)
+        if raw_name is None:
+            raise AttributeError(name)
+        raw = getattr(self, raw_name)
+        value = json.loads(raw) if raw else []
+        setattr(self, name, value)
+        return value
+
+    def __eq__(self, other: Any) -> bool:
+        # Compare by value with plain Paper instances too
+        if not isinstance(other, Paper):
+            return NotImplemented
+        return self._to_dict() == other._to_dict()
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # copy/deepcopy/pickle produce a plain Paper with the decoded fields
+        return Paper, tuple(getattr(self, f.name) for f in dataclasses.fields(Paper))
+
+
+@dataclass(slots=True)
 class ReadingList:
     """Represents a collection of papers organized by topic or purpose."""
 
@@ -54,8 +310,22 @@ class ReadingList:
     is_public: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the fields, cheaper than dataclasses.asdict."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "papers": [paper._to_dict() for paper in self.papers],
+            "tags": list(self.tags),
+            "created_date": self.created_date,
+            "modified_date": self.modified_date,
+            "is_public": self.is_public,
+            "metadata": dict(self.metadata),
+        }
+
+
+@dataclass(slots=True)
 class ReadingProgress:
     """Tracks reading progress and statistics."""
 
@@ -72,7 +342,7 @@ class ReadingProgress:
     completion_date: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadingStatistics:
     """Reading statistics and analytics."""
 
@@ -123,13 +393,43 @@ class ReadingListManager:
             self.db_path = self.cache_dir / "reading_lists.db"
 
         self.cache_dir.mkdir(exist_ok=True)
+
+        # One long-lived connection so SQLite's statement cache stays warm
+        self._lock = threading.RLock()
+        self._conn = self._connect()
         self._init_database()
 
         logger.info(f"ReadingListManager initialized with cache: {self.cache_dir}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection performance PRAGMAs applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        # REPLACE must fire delete triggers so the FTS index drops stale rows
+        conn.execute("PRAGMA recursive_triggers=ON")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection inside a transaction, serialized by a lock."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _init_database(self) -> None:
         """Initialize SQLite database for persistent storage."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
+            # WAL persists in the database file, so it only needs setting once
+            conn.execute("PRAGMA journal_mode=WAL")
+
             # Reading lists table
             conn.execute(
                 """
@@ -141,32 +441,37 @@ class ReadingListManager:
                     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     modified_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     is_public BOOLEAN DEFAULT 0,
-                    metadata TEXT
+                    metadata TEXT,
+                    unread_count INTEGER DEFAULT 0,
+                    reading_count INTEGER DEFAULT 0,
+                    read_count INTEGER DEFAULT 0,
+                    archived_count INTEGER DEFAULT 0
                 )
             """
             )
 
-            # Papers table
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS papers (
-                    arxiv_id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    authors TEXT,
-                    abstract TEXT,
-                    categories TEXT,
-                    submitted_date TIMESTAMP,
-                    url TEXT,
-                    pdf_url TEXT,
-                    tags TEXT,
-                    notes TEXT,
-                    rating INTEGER,
-                    read_status TEXT DEFAULT 'unread',
-                    added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_accessed TIMESTAMP
+            # Older databases lack the per-status counters; add and fill them
+            list_columns = {
+                row["name"] for row in conn.execute("PRAGMA table_info(reading_lists)")
+            }
+            missing_counters = [
+                f"{status}_count"
+                for status in self.READ_STATUSES
+                if f"{status}_count" not in list_columns
+            ]
+            for column in missing_counters:
+                conn.execute(
+                    f"ALTER TABLE reading_lists ADD COLUMN {column} INTEGER DEFAULT 0"
                 )
-            """
-            )
+
+            # Papers table; databases created before the CHECK constraints
+            # existed are rebuilt once
+            self._create_papers_table(conn, "papers")
+            papers_sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'papers'"
+            ).fetchone()[0]
+            if "chk_papers_read_status" not in papers_sql:
+                self._migrate_papers_checks(conn)
 
             # List-paper associations
             conn.execute(
@@ -203,20 +508,266 @@ class ReadingListManager:
             """
             )
 
-            # Create indexes
+            # Normalized tag/author/category tables for indexed filtering and
+            # aggregation, kept in sync with the JSON columns by triggers
+            self._create_json_side_table(conn, "paper_tags", "tags", "tag")
+            self._create_json_side_table(conn, "paper_authors", "authors", "author")
+            self._create_json_side_table(
+                conn, "paper_categories", "categories", "category"
+            )
+
+            # Full-text index over title/abstract/notes (external content)
+            has_papers_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'papers_fts'"
+            ).fetchone()
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+                    title, abstract, notes, content='papers', content_rowid='rowid'
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS papers_fts_ai AFTER INSERT ON papers
+                BEGIN
+                    INSERT INTO papers_fts (rowid, title, abstract, notes)
+                    VALUES (new.rowid, new.title, new.abstract, new.notes);
+                END
+            """
+            )
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_papers_status ON papers(read_status)"
+                """
+                CREATE TRIGGER IF NOT EXISTS papers_fts_ad AFTER DELETE ON papers
+                BEGIN
+                    INSERT INTO papers_fts (papers_fts, rowid, title, abstract, notes)
+                    VALUES ('delete', old.rowid, old.title, old.abstract, old.notes);
+                END
+            """
             )
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_papers_rating ON papers(rating)"
+                """
+                CREATE TRIGGER IF NOT EXISTS papers_fts_au AFTER UPDATE ON papers
+                BEGIN
+                    INSERT INTO papers_fts (papers_fts, rowid, title, abstract, notes)
+                    VALUES ('delete', old.rowid, old.title, old.abstract, old.notes);
+                    INSERT INTO papers_fts (rowid, title, abstract, notes)
+                    VALUES (new.rowid, new.title, new.abstract, new.notes);
+                END
+            """
             )
+            if not has_papers_fts:
+                conn.execute("INSERT INTO papers_fts (papers_fts) VALUES ('rebuild')")
+
+            self._create_status_counter_triggers(conn)
+
+            # Create indexes
+            for create_index in _BULK_INDEXES.values():
+                conn.execute(create_index)
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_list_papers_list ON list_papers(list_id)"
+                "CREATE INDEX IF NOT EXISTS idx_list_papers_paper ON list_papers(arxiv_id)"
             )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_progress_paper ON reading_progress(paper_id)"
             )
 
+            if missing_counters:
+                self._rebuild_counters(conn)
+
+    def _create_status_counter_triggers(self, conn: sqlite3.Connection) -> None:
+        """Keep reading_lists' per-status counters in step with its papers.
+
+        Replacing a paper or list entry (INSERT OR REPLACE) fires the delete
+        triggers too, since the connection enables recursive_triggers.
+        """
+        statuses = self.READ_STATUSES
+        in_lists = "id IN (SELECT list_id FROM list_papers WHERE arxiv_id = {}.arxiv_id)"
+        paper_status = "(SELECT read_status FROM papers WHERE arxiv_id = {}.arxiv_id)"
+        triggers = {
+            "list_papers_counts_ai AFTER INSERT ON list_papers": [
+                _status_counter_update(
+                    statuses, "+", paper_status.format("new"), "id = new.list_id"
+                ),
+            ],
+            "list_papers_counts_ad AFTER DELETE ON list_papers": [
+                _status_counter_update(
+                    statuses, "-", paper_status.format("old"), "id = old.list_id"
+                ),
+            ],
+            "list_papers_counts_au AFTER UPDATE OF list_id, arxiv_id ON list_papers": [
+                _status_counter_update(
+                    statuses, "-", paper_status.format("old"), "id = old.list_id"
+                ),
+                _status_counter_update(
+                    statuses, "+", paper_status.format("new"), "id = new.list_id"
+                ),
+            ],
+            "papers_counts_ai AFTER INSERT ON papers": [
+                _status_counter_update(
+                    statuses, "+", "new.read_status", in_lists.format("new")
+                ),
+            ],
+            "papers_counts_ad AFTER DELETE ON papers": [
+                _status_counter_update(
+                    statuses, "-", "old.read_status", in_lists.format("old")
+                ),
+            ],
+            "papers_counts_au AFTER UPDATE OF read_status ON papers"
+            " WHEN old.read_status IS NOT new.read_status": [
+                _status_counter_update(
+                    statuses, "-", "old.read_status", in_lists.format("old")
+                ),
+                _status_counter_update(
+                    statuses, "+", "new.read_status", in_lists.format("new")
+                ),
+            ],
+        }
+        for header, statements in triggers.items():
+            body = "\n".join(statements)
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {header} BEGIN\n{body}\nEND")
+
+    def _rebuild_counters(self, conn: sqlite3.Connection) -> None:
+        """Recompute every reading list's per-status counters from scratch."""
+        assignments = ", ".join(
+            f"""{status}_count = (
+                SELECT COUNT(*) FROM list_papers lp
+                JOIN papers p ON p.arxiv_id = lp.arxiv_id
+                WHERE lp.list_id = reading_lists.id AND p.read_status = '{status}'
+            )"""
+            for status in self.READ_STATUSES
+        )
+        conn.execute(f"UPDATE reading_lists SET {assignments}")
+
+    def rebuild_counters(self) -> None:
+        """Recompute the denormalized per-status paper counts of all lists.
+
+        The counters are maintained by triggers; this is only needed after
+        writes that bypassed them (e.g. editing the database by hand).
+        """
+        with self._connection() as conn:
+            self._rebuild_counters(conn)
+
+    def _create_papers_table(self, conn: sqlite3.Connection, table: str) -> None:
+        """Create the papers table (or a copy of its schema) under ``table``."""
+        statuses = ", ".join(f"'{status}'" for status in self.READ_STATUSES)
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                arxiv_id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                authors TEXT,
+                abstract TEXT,
+                categories TEXT,
+                submitted_date TIMESTAMP,
+                url TEXT,
+                pdf_url TEXT,
+                tags TEXT,
+                notes TEXT,
+                rating INTEGER
+                    CONSTRAINT chk_papers_rating
+                    CHECK (rating IS NULL OR rating BETWEEN 1 AND 5),
+                read_status TEXT DEFAULT 'unread'
+                    CONSTRAINT chk_papers_read_status
+                    CHECK (read_status IN ({statuses})),
+                added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_accessed TIMESTAMP
+            )
+        """
+        )
+
+    def _migrate_papers_checks(self, conn: sqlite3.Connection) -> None:
+        """Rebuild an existing papers table so it carries the CHECK constraints.
+
+        Rowids are preserved so the FTS index and side tables stay valid;
+        out-of-range values are reset to the column defaults on the way over.
+        Triggers and indexes on ``papers`` are dropped with the old table and
+        recreated by ``_init_database``.
+        """
+        logger.info("Migrating papers table to add status/rating constraints")
+        statuses = ", ".join(f"'{status}'" for status in self.READ_STATUSES)
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        conn.execute("DROP TABLE IF EXISTS papers_new")
+        self._create_papers_table(conn, "papers_new")
+        conn.execute(
+            f"""
+            INSERT INTO papers_new
+            (rowid, arxiv_id, title, authors, abstract, categories, submitted_date,
+             url, pdf_url, tags, notes, rating, read_status, added_date, last_accessed)
+            SELECT rowid, arxiv_id, title, authors, abstract, categories, submitted_date,
+                   url, pdf_url, tags, notes,
+                   CASE WHEN rating BETWEEN 1 AND 5 THEN rating END,
+                   CASE WHEN read_status IN ({statuses}) THEN read_status
+                        ELSE 'unread' END,
+                   added_date, last_accessed
+            FROM papers
+        """
+        )
+        conn.execute("DROP TABLE papers")
+        conn.execute("ALTER TABLE papers_new RENAME TO papers")
+
+    @staticmethod
+    def _create_json_side_table(
+        conn: sqlite3.Connection, table: str, column: str, value_column: str
+    ) -> None:
+        """Create a (arxiv_id, value) table mirroring a JSON list column of papers.
+
+        Insert/update/delete triggers on ``papers`` keep the table in sync, and
+        rows already in ``papers`` are backfilled when the table is first created.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                arxiv_id TEXT,
+                {value_column} TEXT,
+                PRIMARY KEY (arxiv_id, {value_column})
+            )
+        """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS papers_{column}_ai AFTER INSERT ON papers
+            BEGIN
+                DELETE FROM {table} WHERE arxiv_id = new.arxiv_id;
+                INSERT OR IGNORE INTO {table} (arxiv_id, {value_column})
+                SELECT new.arxiv_id, value FROM json_each(COALESCE(new.{column}, '[]'));
+            END
+        """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS papers_{column}_au AFTER UPDATE OF {column} ON papers
+            BEGIN
+                DELETE FROM {table} WHERE arxiv_id = old.arxiv_id;
+                INSERT OR IGNORE INTO {table} (arxiv_id, {value_column})
+                SELECT new.arxiv_id, value FROM json_each(COALESCE(new.{column}, '[]'));
+            END
+        """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS papers_{column}_ad AFTER DELETE ON papers
+            BEGIN
+                DELETE FROM {table} WHERE arxiv_id = old.arxiv_id;
+            END
+        """
+        )
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_{value_column} "
+            f"ON {table}({value_column})"
+        )
+        if not exists:
+            conn.execute(
+                f"""
+                INSERT OR IGNORE INTO {table} (arxiv_id, {value_column})
+                SELECT p.arxiv_id, j.value
+                FROM papers p, json_each(COALESCE(p.{column}, '[]')) j
+            """
+            )
+
     def create_reading_list(
         self, name: str, description: str = "", tags: List[str] = None
     ) -> ReadingList:
@@ -228,12 +779,9 @@ class ReadingListManager:
             id=list_id, name=name, description=description, tags=tags
         )
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute(
-                """
-                INSERT INTO reading_lists (id, name, description, tags, metadata)
-                VALUES (?, ?, ?, ?, ?)
-            """,
+                _SQL_INSERT_READING_LIST,
                 (list_id, name, description, json.dumps(tags), json.dumps({})),
             )
 
@@ -242,12 +790,9 @@ class ReadingListManager:
 
     def get_reading_list(self, list_id: str) -> Optional[ReadingList]:
         """Retrieve a reading list by ID."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             result = conn.execute(
-                """
-                SELECT id, name, description, tags, created_date, modified_date, is_public, metadata
-                FROM reading_lists WHERE id = ?
-            """,
+                f"SELECT {_LIST_COLUMNS} FROM reading_lists rl WHERE rl.id = ?",
                 (list_id,),
             ).fetchone()
 
@@ -257,154 +802,123 @@ class ReadingListManager:
             # Get papers in this list
             papers = self._get_papers_in_list(list_id)
 
-            reading_list = ReadingList(
-                id=result[0],
-                name=result[1],
-                description=result[2] or "",
-                papers=papers,
-                tags=json.loads(result[3]) if result[3] else [],
-                created_date=datetime.fromisoformat(result[4])
-                if result[4]
-                else datetime.now(),
-                modified_date=datetime.fromisoformat(result[5])
-                if result[5]
-                else datetime.now(),
-                is_public=bool(result[6]),
-                metadata=json.loads(result[7]) if result[7] else {},
-            )
-
-            return reading_list
+            return self._row_to_reading_list(result, papers)
 
     def list_reading_lists(self) -> List[ReadingList]:
         """Get all reading lists."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
+            # One query for lists and their papers; empty lists yield a single
+            # row with NULL paper columns.
             results = conn.execute(
-                """
-                SELECT id, name, description, tags, created_date, modified_date, is_public, metadata
-                FROM reading_lists ORDER BY modified_date DESC
+                f"""
+                SELECT {_LIST_COLUMNS}, {_PAPER_COLUMNS}
+                FROM reading_lists rl
+                LEFT JOIN list_papers lp ON lp.list_id = rl.id
+                LEFT JOIN papers p ON p.arxiv_id = lp.arxiv_id
+                ORDER BY rl.modified_date DESC, rl.id, lp.position, lp.added_date
             """
             ).fetchall()
 
             lists = []
-            for result in results:
-                papers = self._get_papers_in_list(result[0])
-
-                reading_list = ReadingList(
-                    id=result[0],
-                    name=result[1],
-                    description=result[2] or "",
-                    papers=papers,
-                    tags=json.loads(result[3]) if result[3] else [],
-                    created_date=datetime.fromisoformat(result[4])
-                    if result[4]
-                    else datetime.now(),
-                    modified_date=(
-                        datetime.fromisoformat(result[5])
-                        if result[5]
-                        else datetime.now()
-                    ),
-                    is_public=bool(result[6]),
-                    metadata=json.loads(result[7]) if result[7] else {},
-                )
-                lists.append(reading_list)
+            for _, rows in groupby(results, key=lambda row: row["id"]):
+                rows = list(rows)
+                papers = [
+                    self._row_to_paper(row) for row in rows if row["arxiv_id"] is not None
+                ]
+                lists.append(self._row_to_reading_list(rows[0], papers))
 
             return lists
 
     def _get_papers_in_list(self, list_id: str) -> List[Paper]:
         """Get all papers in a reading list."""
-        with sqlite3.connect(self.db_path) as conn:
-            results = conn.execute(
-                """
-                SELECT p.arxiv_id, p.title, p.authors, p.abstract, p.categories,
-                       p.submitted_date, p.url, p.pdf_url, p.tags, p.notes,
-                       p.rating, p.read_status, p.added_date, p.last_accessed
+        return list(self._iter_papers_in_list(list_id))
+
+    def _iter_papers_in_list(self, list_id: str) -> Iterator[Paper]:
+        """Yield the papers in a reading list one row at a time.
+
+        The connection lock is held until the generator is exhausted or
+        closed, so consume it promptly.
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT {_PAPER_COLUMNS}
                 FROM papers p
                 JOIN list_papers lp ON p.arxiv_id = lp.arxiv_id
                 WHERE lp.list_id = ?
                 ORDER BY lp.position, lp.added_date
             """,
                 (list_id,),
-            ).fetchall()
+            )
+            for row in cursor:
+                yield self._row_to_paper(row)
 
-            papers = []
-            for result in results:
-                paper = Paper(
-                    arxiv_id=result[0],
-                    title=result[1],
-                    authors=json.loads(result[2]) if result[2] else [],
-                    abstract=result[3] or "",
-                    categories=json.loads(result[4]) if result[4] else [],
-                    submitted_date=datetime.fromisoformat(result[5])
-                    if result[5]
-                    else None,
-                    url=result[6] or "",
-                    pdf_url=result[7] or "",
-                    tags=json.loads(result[8]) if result[8] else [],
-                    notes=result[9] or "",
-                    rating=result[10],
-                    read_status=result[11] or "unread",
-                    added_date=datetime.fromisoformat(result[12])
-                    if result[12]
-                    else datetime.now(),
-                    last_accessed=datetime.fromisoformat(result[13])
-                    if result[13]
-                    else None,
-                )
-                papers.append(paper)
+    @staticmethod
+    def _row_to_paper(row: sqlite3.Row) -> Paper:
+        """Build a Paper from a row selected with ``_PAPER_COLUMNS``.
+
+        JSON list columns are left undecoded until first accessed.
+        """
+        _parse_dt = datetime.fromisoformat
+        submitted, added, accessed = (
+            row["submitted_date"],
+            row["added_date"],
+            row["last_accessed"],
+        )
+        return _LazyPaper(
+            row["authors"],
+            row["categories"],
+            row["tags"],
+            arxiv_id=row["arxiv_id"],
+            title=row["title"],
+            abstract=row["abstract"] or "",
+            submitted_date=_parse_dt(submitted) if submitted else None,
+            url=row["url"] or "",
+            pdf_url=row["pdf_url"] or "",
+            notes=row["notes"] or "",
+            rating=row["rating"],
+            read_status=row["read_status"] or "unread",
+            added_date=_parse_dt(added) if added else datetime.now(),
+            last_accessed=_parse_dt(accessed) if accessed else None,
+        )
 
-            return papers
+    @staticmethod
+    def _row_to_reading_list(row: sqlite3.Row, papers: List[Paper]) -> ReadingList:
+        """Build a ReadingList from a row selected with ``_LIST_COLUMNS``."""
+        return ReadingList(
+            id=row["id"],
+            name=row["name"],
+            description=row["description"] or "",
+            papers=papers,
+            tags=json.loads(row["list_tags"]) if row["list_tags"] else [],
+            created_date=datetime.fromisoformat(row["created_date"])
+            if row["created_date"]
+            else datetime.now(),
+            modified_date=datetime.fromisoformat(row["modified_date"])
+            if row["modified_date"]
+            else datetime.now(),
+            is_public=bool(row["is_public"]),
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+        )
 
     def add_paper_to_list(
         self, list_id: str, paper: Paper, position: Optional[int] = None
     ) -> bool:
         """Add a paper to a reading list."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 # Insert or update paper
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO papers
-                    (arxiv_id, title, authors, abstract, categories, submitted_date,
-                     url, pdf_url, tags, notes, rating, read_status, last_accessed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        paper.arxiv_id,
-                        paper.title,
-                        json.dumps(paper.authors),
-                        paper.abstract,
-                        json.dumps(paper.categories),
-                        paper.submitted_date.isoformat()
-                        if paper.submitted_date
-                        else None,
-                        paper.url,
-                        paper.pdf_url,
-                        json.dumps(paper.tags),
-                        paper.notes,
-                        paper.rating,
-                        paper.read_status,
-                        paper.last_accessed.isoformat()
-                        if paper.last_accessed
-                        else None,
-                    ),
-                )
+                conn.execute(_SQL_UPSERT_PAPER, self._paper_to_row(paper))
 
-                # Add to list
+                # Add to list, appending after the last position by default
                 if position is None:
-                    # Get max position
-                    max_pos = conn.execute(
-                        "SELECT MAX(position) FROM list_papers WHERE list_id = ?",
-                        (list_id,),
-                    ).fetchone()[0]
-                    position = (max_pos or 0) + 1
-
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO list_papers (list_id, arxiv_id, position)
-                    VALUES (?, ?, ?)
-                """,
-                    (list_id, paper.arxiv_id, position),
-                )
+                    conn.execute(
+                        _SQL_APPEND_LIST_PAPER, (list_id, paper.arxiv_id, list_id)
+                    )
+                else:
+                    conn.execute(
+                        _SQL_UPSERT_LIST_PAPER, (list_id, paper.arxiv_id, position)
+                    )
 
                 # Update list modified date
                 conn.execute(
@@ -421,10 +935,65 @@ class ReadingListManager:
             logger.error(f"Failed to add paper to list: {e}")
             return False
 
+    def add_papers_to_list(self, list_id: str, papers: List[Paper]) -> int:
+        """Add several papers to a reading list in a single transaction.
+
+        Papers are appended after the current last position, in order.
+
+        Returns:
+            Number of papers added
+        """
+        if not papers:
+            return 0
+
+        with self._connection() as conn:
+            max_pos = conn.execute(
+                "SELECT MAX(position) FROM list_papers WHERE list_id = ?",
+                (list_id,),
+            ).fetchone()[0]
+            base_position = (max_pos or 0) + 1
+
+            conn.executemany(
+                _SQL_UPSERT_PAPER, [self._paper_to_row(paper) for paper in papers]
+            )
+            conn.executemany(
+                _SQL_UPSERT_LIST_PAPER,
+                [
+                    (list_id, paper.arxiv_id, position)
+                    for position, paper in enumerate(papers, start=base_position)
+                ],
+            )
+            conn.execute(
+                "UPDATE reading_lists SET modified_date = ? WHERE id = ?",
+                (datetime.now().isoformat(), list_id),
+            )
+
+        logger.info(f"Added {len(papers)} papers to list {list_id}")
+        return len(papers)
+
+    @staticmethod
+    def _paper_to_row(paper: Paper) -> tuple:
+        """Build the parameter tuple for ``_SQL_UPSERT_PAPER``."""
+        return (
+            paper.arxiv_id,
+            paper.title,
+            json.dumps(paper.authors),
+            paper.abstract,
+            json.dumps(paper.categories),
+            paper.submitted_date.isoformat() if paper.submitted_date else None,
+            paper.url,
+            paper.pdf_url,
+            json.dumps(paper.tags),
+            paper.notes,
+            paper.rating,
+            paper.read_status,
+            paper.last_accessed.isoformat() if paper.last_accessed else None,
+        )
+
     def remove_paper_from_list(self, list_id: str, arxiv_id: str) -> bool:
         """Remove a paper from a reading list."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 conn.execute(
                     """
                     DELETE FROM list_papers WHERE list_id = ? AND arxiv_id = ?
@@ -450,14 +1019,15 @@ class ReadingListManager:
     def update_paper_status(
         self, arxiv_id: str, status: str, notes: str = "", rating: Optional[int] = None
     ) -> bool:
-        """Update a paper's reading status and metadata."""
+        """Update a paper's reading status and metadata.
+
+        Status and rating ranges are also enforced by the table's CHECK constraints.
+        """
         if status not in self.READ_STATUSES:
-            raise ValueError(
-                f"Invalid status: {status}. Must be one of {self.READ_STATUSES}"
-            )
+            raise ValueError(f"Invalid status: {status}. Must be one of {self.READ_STATUSES}")
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 update_fields = ["read_status = ?", "last_accessed = ?"]
                 values = [status, datetime.now().isoformat()]
 
@@ -466,8 +1036,6 @@ class ReadingListManager:
                     values.append(notes)
 
                 if rating is not None:
-                    if not 1 <= rating <= 5:
-                        raise ValueError("Rating must be between 1 and 5")
                     update_fields.append("rating = ?")
                     values.append(rating)
 
@@ -483,6 +1051,17 @@ class ReadingListManager:
             logger.info(f"Updated paper {arxiv_id} status to {status}")
             return True
 
+        except sqlite3.IntegrityError as e:
+            if "chk_papers_read_status" in str(e):
+                raise ValueError(
+                    f"Invalid status: {status}. Must be one of {self.READ_STATUSES}"
+                ) from e
+            if "chk_papers_rating" in str(e):
+                logger.error("Failed to update paper status: Rating must be between 1 and 5")
+            else:
+                logger.error(f"Failed to update paper status: {e}")
+            return False
+
         except Exception as e:
             logger.error(f"Failed to update paper status: {e}")
             return False
@@ -495,83 +1074,42 @@ class ReadingListManager:
         tags: List[str] = None,
     ) -> List[Paper]:
         """Search papers across lists or within a specific list."""
-        with sqlite3.connect(self.db_path) as conn:
-            base_query = """
-                SELECT DISTINCT p.arxiv_id, p.title, p.authors, p.abstract, p.categories,
-                       p.submitted_date, p.url, p.pdf_url, p.tags, p.notes,
-                       p.rating, p.read_status, p.added_date, p.last_accessed
-                FROM papers p
-            """
+        fts_query = self._build_fts_query(query) if query else ""
+        if fts_query:
+            match, match_values = "fts", [fts_query]
+        elif query:
+            # No indexable terms (punctuation only) - fall back to a scan
+            search_term = f"%{query}%"
+            match, match_values = "like", [search_term] * 3
+        else:
+            match, match_values = None, []
 
-            conditions = []
-            values = []
+        values = ([list_id] if list_id else []) + match_values
+        if status:
+            values.append(status)
 
-            if list_id:
-                base_query += " JOIN list_papers lp ON p.arxiv_id = lp.arxiv_id"
-                conditions.append("lp.list_id = ?")
-                values.append(list_id)
+        if tags:
+            # Tag counts vary per call, so this rarer path is built on demand
+            sql = _build_search_sql(match, bool(list_id), bool(status), len(tags))
+            values.extend(tags)
+        else:
+            sql = _SEARCH_SQL[(match, bool(list_id), bool(status))]
 
-            if query:
-                conditions.append(
-                    "(p.title LIKE ? OR p.abstract LIKE ? OR p.notes LIKE ?)"
-                )
-                search_term = f"%{query}%"
-                values.extend([search_term, search_term, search_term])
-
-            if status:
-                conditions.append("p.read_status = ?")
-                values.append(status)
-
-            if tags:
-                # Search for papers containing any of the specified tags
-                tag_conditions = []
-                for tag in tags:
-                    tag_conditions.append("p.tags LIKE ?")
-                    values.append(f"%{tag}%")
-
-                if tag_conditions:
-                    conditions.append(f"({' OR '.join(tag_conditions)})")
-
-            if conditions:
-                base_query += " WHERE " + " AND ".join(conditions)
-
-            base_query += " ORDER BY p.last_accessed DESC, p.added_date DESC"
-
-            results = conn.execute(base_query, values).fetchall()
-
-            papers = []
-            for result in results:
-                paper = Paper(
-                    arxiv_id=result[0],
-                    title=result[1],
-                    authors=json.loads(result[2]) if result[2] else [],
-                    abstract=result[3] or "",
-                    categories=json.loads(result[4]) if result[4] else [],
-                    submitted_date=datetime.fromisoformat(result[5])
-                    if result[5]
-                    else None,
-                    url=result[6] or "",
-                    pdf_url=result[7] or "",
-                    tags=json.loads(result[8]) if result[8] else [],
-                    notes=result[9] or "",
-                    rating=result[10],
-                    read_status=result[11] or "unread",
-                    added_date=datetime.fromisoformat(result[12])
-                    if result[12]
-                    else datetime.now(),
-                    last_accessed=datetime.fromisoformat(result[13])
-                    if result[13]
-                    else None,
-                )
-                papers.append(paper)
+        with self._connection() as conn:
+            results = conn.execute(sql, values).fetchall()
+
+            return [self._row_to_paper(row) for row in results]
 
-            return papers
+    @staticmethod
+    def _build_fts_query(query: str) -> str:
+        """Turn free text into an FTS5 query of quoted prefix terms (ANDed)."""
+        return " ".join(f'"{term}"*' for term in _FTS_TOKEN_RE.findall(query))
 
     def get_reading_statistics(
         self, list_id: Optional[str] = None, days: int = 30
     ) -> ReadingStatistics:
         """Generate reading statistics and analytics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             base_query = "FROM papers p"
             where_clause = ""
             values = []
@@ -581,17 +1119,24 @@ class ReadingListManager:
                 where_clause = " WHERE lp.list_id = ?"
                 values.append(list_id)
 
-            # Count papers by status
-            status_counts = {}
-            for status in self.READ_STATUSES:
-                count = conn.execute(
-                    f"""
-                    SELECT COUNT(*) {base_query} {where_clause}
-                    {"AND" if where_clause else "WHERE"} p.read_status = ?
-                """,
-                    values + [status],
-                ).fetchone()[0]
-                status_counts[status] = count
+            # Count papers by status: a single list reads its trigger-maintained
+            # counters, the whole library needs one grouped scan
+            status_counts = {status: 0 for status in self.READ_STATUSES}
+            if list_id:
+                counters = conn.execute(
+                    "SELECT "
+                    + ", ".join(f"{status}_count" for status in self.READ_STATUSES)
+                    + " FROM reading_lists WHERE id = ?",
+                    (list_id,),
+                ).fetchone()
+                if counters:
+                    status_counts.update(zip(self.READ_STATUSES, counters))
+            else:
+                for status, count in conn.execute(
+                    "SELECT read_status, COUNT(*) FROM papers GROUP BY read_status"
+                ):
+                    if status in status_counts:
+                        status_counts[status] = count
 
             total_papers = sum(status_counts.values())
 
@@ -601,39 +1146,12 @@ class ReadingListManager:
             )  # Assume 2 hours per paper
             avg_time = total_time / max(status_counts["read"], 1)
 
-            # Get favorite categories
-            category_results = conn.execute(
-                f"""
-                SELECT p.categories {base_query} {where_clause}
-                {"AND" if where_clause else "WHERE"} p.categories IS NOT NULL
-            """,
-                values,
-            ).fetchall()
-
-            all_categories = []
-            for result in category_results:
-                categories = json.loads(result[0]) if result[0] else []
-                all_categories.extend(categories)
-
-            category_counts = Counter(all_categories)
-            favorite_categories = [cat for cat, _ in category_counts.most_common(5)]
-
-            # Get top authors
-            author_results = conn.execute(
-                f"""
-                SELECT p.authors {base_query} {where_clause}
-                {"AND" if where_clause else "WHERE"} p.authors IS NOT NULL
-            """,
-                values,
-            ).fetchall()
-
-            all_authors = []
-            for result in author_results:
-                authors = json.loads(result[0]) if result[0] else []
-                all_authors.extend(authors)
-
-            author_counts = Counter(all_authors)
-            top_authors = [author for author, _ in author_counts.most_common(5)]
+            # Favorite categories and top authors, aggregated from the
+            # normalized side tables
+            favorite_categories = self._top_values(
+                conn, "paper_categories", "category", list_id
+            )
+            top_authors = self._top_values(conn, "paper_authors", "author", list_id)
 
             # Calculate reading streak (simplified)
             recent_reads = conn.execute(
@@ -647,26 +1165,26 @@ class ReadingListManager:
 
             reading_streak = min(recent_reads, days)
 
-            # Papers per month (last 6 months)
+            # Papers per month (current month and the five before it),
+            # bucketed by SQLite in one grouped query
+            month_date = datetime.now().replace(day=1)
             papers_per_month = {}
-            for i in range(6):
-                month_start = datetime.now().replace(day=1) - timedelta(days=30 * i)
-                month_key = month_start.strftime("%Y-%m")
-
-                count = conn.execute(
-                    f"""
-                    SELECT COUNT(*) {base_query} {where_clause}
-                    {"AND" if where_clause else "WHERE"} p.added_date >= ?
-                    AND p.added_date < ?
-                """,
-                    values
-                    + [
-                        month_start.isoformat(),
-                        (month_start + timedelta(days=32)).replace(day=1).isoformat(),
-                    ],
-                ).fetchone()[0]
+            for _ in range(6):
+                papers_per_month[month_date.strftime("%Y-%m")] = 0
+                month_date = (month_date - timedelta(days=1)).replace(day=1)
+            oldest_month = next(reversed(papers_per_month))
 
-                papers_per_month[month_key] = count
+            for month_key, count in conn.execute(
+                f"""
+                SELECT strftime('%Y-%m', p.added_date) AS month, COUNT(*)
+                {base_query} {where_clause}
+                {"AND" if where_clause else "WHERE"} p.added_date >= ?
+                GROUP BY month
+            """,
+                values + [f"{oldest_month}-01"],
+            ):
+                if month_key in papers_per_month:
+                    papers_per_month[month_key] = count
 
             return ReadingStatistics(
                 total_papers=total_papers,
@@ -681,21 +1199,44 @@ class ReadingListManager:
                 top_authors=top_authors,
             )
 
+    @staticmethod
+    def _top_values(
+        conn: sqlite3.Connection,
+        table: str,
+        value_column: str,
+        list_id: Optional[str] = None,
+        limit: int = 5,
+    ) -> List[str]:
+        """Return the most frequent values of a normalized paper side table."""
+        query = f"SELECT t.{value_column}, COUNT(*) AS c FROM {table} t"
+        values: List[Any] = []
+        if list_id:
+            query += " JOIN list_papers lp ON lp.arxiv_id = t.arxiv_id WHERE lp.list_id = ?"
+            values.append(list_id)
+        query += f" GROUP BY t.{value_column} ORDER BY c DESC, t.{value_column} LIMIT ?"
+        values.append(limit)
+        return [row[0] for row in conn.execute(query, values).fetchall()]
+
     def export_reading_list(
         self, list_id: str, output_path: str, format: str = "json"
     ) -> bool:
         """Export a reading list to file."""
         try:
-            reading_list = self.get_reading_list(list_id)
-            if not reading_list:
+            with self._connection() as conn:
+                exists = conn.execute(
+                    "SELECT 1 FROM reading_lists WHERE id = ?", (list_id,)
+                ).fetchone()
+            if not exists:
                 logger.error(f"Reading list {list_id} not found")
                 return False
 
             output_file = Path(output_path)
 
             if format == "json":
+                reading_list = self.get_reading_list(list_id)
+
                 # Convert to JSON-serializable format
-                data = asdict(reading_list)
+                data = reading_list._to_dict()
 
                 # Convert datetime objects to strings
                 def serialize_datetime(obj):
@@ -709,38 +1250,26 @@ class ReadingListManager:
             elif format == "csv":
                 import csv
 
-                with open(output_file, "w", newline="") as f:
-                    fieldnames = [
-                        "arxiv_id",
-                        "title",
-                        "authors",
-                        "abstract",
-                        "categories",
-                        "read_status",
-                        "rating",
-                        "notes",
-                        "tags",
-                        "added_date",
-                    ]
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-
-                    for paper in reading_list.papers:
-                        row = {
-                            "arxiv_id": paper.arxiv_id,
-                            "title": paper.title,
-                            "authors": ", ".join(paper.authors),
-                            "abstract": paper.abstract,
-                            "categories": ", ".join(paper.categories),
-                            "read_status": paper.read_status,
-                            "rating": paper.rating,
-                            "notes": paper.notes,
-                            "tags": ", ".join(paper.tags),
-                            "added_date": paper.added_date.isoformat()
-                            if paper.added_date
-                            else "",
-                        }
-                        writer.writerow(row)
+                with open(output_file, "w", newline="") as f, self._connection() as conn:
+                    writer = csv.writer(f)
+                    writer.writerow(
+                        [
+                            "arxiv_id",
+                            "title",
+                            "authors",
+                            "abstract",
+                            "categories",
+                            "read_status",
+                            "rating",
+                            "notes",
+                            "tags",
+                            "added_date",
+                        ]
+                    )
+
+                    # SQLite emits ready-to-write rows, so the cursor streams
+                    # straight into the writer without any per-row Python work
+                    writer.writerows(conn.execute(_SQL_EXPORT_CSV, (list_id,)))
             else:
                 raise ValueError(f"Unsupported format: {format}")
 
@@ -760,31 +1289,58 @@ class ReadingListManager:
                 with open(input_file, "r") as f:
                     data = json.load(f)
 
-                # Create new reading list
-                reading_list = self.create_reading_list(
+                entries = data.get("papers", [])
+                papers = [
+                    _reset_invalid_checks(p, self.READ_STATUSES)
+                    for p in entries
+                    if _is_importable_paper(p)
+                ]
+                skipped = len(entries) - len(papers)
+                if skipped:
+                    logger.warning(f"Skipping {skipped} malformed papers during import")
+
+                tags = data.get("tags", [])
+                reading_list = ReadingList(
+                    id=str(uuid.uuid4()),
                     name=list_name,
                     description=data.get("description", ""),
-                    tags=data.get("tags", []),
+                    tags=tags,
                 )
 
-                # Add papers
-                for paper_data in data.get("papers", []):
-                    paper = Paper(
-                        arxiv_id=paper_data["arxiv_id"],
-                        title=paper_data["title"],
-                        authors=paper_data.get("authors", []),
-                        abstract=paper_data.get("abstract", ""),
-                        categories=paper_data.get("categories", []),
-                        read_status=paper_data.get("read_status", "unread"),
-                        rating=paper_data.get("rating"),
-                        notes=paper_data.get("notes", ""),
-                        tags=paper_data.get("tags", []),
+                # The list row and its papers go in one transaction, so a failed
+                # import leaves no empty list behind. SQLite unpacks the JSON
+                # array itself, so the paper inserts are two statements
+                # regardless of size.
+                papers_json = json.dumps(papers)
+                rebuild_indexes = len(papers) > BULK_IMPORT_INDEX_THRESHOLD
+                with self._connection() as conn:
+                    # Open the transaction explicitly so any DROPs roll back
+                    # together with the inserts if anything fails
+                    conn.execute("BEGIN")
+                    if rebuild_indexes:
+                        for index_name in _BULK_INDEXES:
+                            conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+                    conn.execute(
+                        _SQL_INSERT_READING_LIST,
+                        (
+                            reading_list.id,
+                            list_name,
+                            reading_list.description,
+                            json.dumps(tags),
+                            json.dumps({}),
+                        ),
+                    )
+                    conn.execute(_SQL_IMPORT_PAPERS_JSON, (papers_json,))
+                    conn.execute(
+                        _SQL_IMPORT_LIST_PAPERS_JSON, (reading_list.id, papers_json)
                     )
-                    self.add_paper_to_list(reading_list.id, paper)
 
-                logger.info(
-                    f"Imported reading list {list_name} with {len(data.get('papers', []))} papers"
-                )
+                    if rebuild_indexes:
+                        for create_index in _BULK_INDEXES.values():
+                            conn.execute(create_index)
+
+                logger.info(f"Imported reading list {list_name} with {len(papers)} papers")
                 return reading_list.id
 
             else:
@@ -797,7 +1353,7 @@ class ReadingListManager:
     def delete_reading_list(self, list_id: str) -> bool:
         """Delete a reading list (but keep papers)."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 conn.execute("DELETE FROM list_papers WHERE list_id = ?", (list_id,))
                 conn.execute(
                     "DELETE FROM reading_progress WHERE list_id = ?", (list_id,)
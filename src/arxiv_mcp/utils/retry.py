@@ -5,15 +5,41 @@ Simple, low-effort retry mechanisms for failed operations.
 
 import asyncio
 import functools
+import random
+import time
 from typing import Callable, Any, Union, List, Type
 from ..utils.logging import structured_logger
 
 
+@functools.lru_cache(maxsize=None)
+def _retry_logger():
+    """Configure structured logging on the first failure, not at decoration.
+
+    Decorators run at import time, and ``structured_logger`` resets the root
+    logger's handlers and creates ``./logs``.
+    """
+    return structured_logger()
+
+
+def _backoff_pause(delay: float, jitter: bool) -> float:
+    """Seconds to sleep before a retry whose backoff delay is ``delay``.
+
+    With ``jitter`` the pause is "equal jitter": half the delay plus a random
+    share of the other half, so retries spread out but never drop below
+    ``delay / 2``.
+    """
+    if not jitter:
+        return delay
+    half = delay / 2
+    return half + random.uniform(0, half)
+
+
 def async_retry(
     retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: Union[Type[Exception], List[Type[Exception]]] = Exception,
+    jitter: bool = False,
 ):
     """
     Async retry decorator with exponential backoff.
@@ -23,35 +49,40 @@ def async_retry(
         delay: Initial delay between retries in seconds
         backoff: Multiplier for delay between retries
         exceptions: Exception type(s) to catch and retry on
+        jitter: Randomise each pause between half and all of the backoff delay
+            so concurrent callers do not retry in lockstep
     """
     if isinstance(exceptions, type):
         exceptions = [exceptions]
+    exc_tuple = tuple(exceptions)
+    # Sleep before retry n (0-based) is delay * backoff**n
+    delays = tuple(delay * backoff**i for i in range(retries))
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            logger = structured_logger()
-            last_exception = None
-            current_delay = delay
-
             for attempt in range(retries + 1):
                 try:
                     return await func(*args, **kwargs)
-                except tuple(exceptions) as e:
-                    last_exception = e
-
-                    if attempt < retries:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{retries + 1} failed for {func.__name__}: {str(e)}"
-                        )
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
+                except exc_tuple as e:
+                    logger = _retry_logger()
+                    if attempt == retries:
                         logger.error(
-                            f"All {retries + 1} attempts failed for {func.__name__}: {str(e)}"
+                            "All %d attempts failed for %s: %s",
+                            retries + 1,
+                            func.__name__,
+                            e,
                         )
+                        raise
 
-            raise last_exception
+                    logger.warning(
+                        "Attempt %d/%d failed for %s: %s",
+                        attempt + 1,
+                        retries + 1,
+                        func.__name__,
+                        e,
+                    )
+                await asyncio.sleep(_backoff_pause(delays[attempt], jitter))
 
         return wrapper
 
@@ -63,40 +94,44 @@ def sync_retry(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: Union[Type[Exception], List[Type[Exception]]] = Exception,
+    jitter: bool = False,
 ):
     """
     Synchronous retry decorator with exponential backoff.
+
+    Takes the same arguments as ``async_retry``.
     """
     if isinstance(exceptions, type):
         exceptions = [exceptions]
+    exc_tuple = tuple(exceptions)
+    # Sleep before retry n (0-based) is delay * backoff**n
+    delays = tuple(delay * backoff**i for i in range(retries))
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            logger = structured_logger()
-            last_exception = None
-            current_delay = delay
-
             for attempt in range(retries + 1):
                 try:
                     return func(*args, **kwargs)
-                except tuple(exceptions) as e:
-                    last_exception = e
-
-                    if attempt < retries:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{retries + 1} failed for {func.__name__}: {str(e)}"
-                        )
-                        import time
-
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
+                except exc_tuple as e:
+                    logger = _retry_logger()
+                    if attempt == retries:
                         logger.error(
-                            f"All {retries + 1} attempts failed for {func.__name__}: {str(e)}"
+                            "All %d attempts failed for %s: %s",
+                            retries + 1,
+                            func.__name__,
+                            e,
                         )
-
-            raise last_exception
+                        raise
+
+                    logger.warning(
+                        "Attempt %d/%d failed for %s: %s",
+                        attempt + 1,
+                        retries + 1,
+                        func.__name__,
+                        e,
+                    )
+                time.sleep(_backoff_pause(delays[attempt], jitter))
 
         return wrapper
 
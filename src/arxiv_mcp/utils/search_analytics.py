@@ -3,17 +3,95 @@ Search analytics for tracking query patterns, popular searches, and usage statis
 Extends the existing metrics system with specialized search tracking.
 """
 
+import atexit
+import heapq
 import json
+import queue
+import re
 import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict, Counter
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from collections import defaultdict, deque, Counter
 from dataclasses import dataclass
 
 from .logging import structured_logger
 from .metrics import MetricsCollector
 
+# Buffered analytics writes are flushed once either limit is reached
+FLUSH_BATCH_SIZE = 500
+FLUSH_INTERVAL_SECONDS = 5.0
+
+# Tracked queries waiting for the background writer; beyond this they are dropped
+QUEUE_MAXSIZE = 10_000
+
+# Tells the background writer to exit (see SearchAnalytics.close)
+_STOP = object()
+
+# Once a query string is seen more than HOT_QUERY_THRESHOLD times within
+# HOT_QUERY_WINDOW_SECONDS, only every HOT_QUERY_SAMPLE_RATE-th occurrence is
+# stored, with that many as its weight; aggregates sum weights, not rows.
+# Occurrences still held back are written as one weighted row on every flush,
+# so stored weights always add up to the number of tracked queries.
+HOT_QUERY_THRESHOLD = 100
+HOT_QUERY_SAMPLE_RATE = 10
+HOT_QUERY_WINDOW_SECONDS = 60.0
+
+# Caps on the in-memory caches; counters are halved once they exceed their cap
+QUERY_CACHE_SIZE = 10_000
+MAX_TRACKED_TERMS = 50_000
+MAX_TRACKED_CATEGORIES = 10_000
+
+# get_trending_queries is served from per-hour in-memory counts covering the
+# last TRENDING_WINDOW_HOURS; each hour keeps at most TRENDING_SKETCH_SIZE
+# queries, aged by halving once it overflows
+TRENDING_WINDOW_HOURS = 24
+TRENDING_SKETCH_SIZE = 1024
+
+# The background writer refreshes planner statistics and truncates the WAL
+# file this often so long-running processes keep reads fast
+MAINTENANCE_INTERVAL_SECONDS = 300.0
+
+# Shared compact encoder for the JSON list columns (see _encode_list)
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+_quote_json = json.encoder.encode_basestring_ascii
+
+# Popular-term tokens: runs of three or more letters/digits
+_TERM_RE = re.compile(r"[^\W_]{3,}")
+
+_INSERT_SQL = """
+    INSERT INTO search_queries
+    (query, timestamp, categories, authors, date_range, results_count,
+     response_time, user_id, success, weight, timestamp_hour, ts_epoch)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_TERM_SQL = """
+    INSERT INTO popular_terms (term, count, last_seen) VALUES (?, ?, ?)
+    ON CONFLICT(term) DO UPDATE SET
+        count = popular_terms.count + excluded.count,
+        last_seen = excluded.last_seen
+"""
+
+
+_UPSERT_DAILY_SQL = """
+    INSERT INTO search_queries_daily
+    (date, count, success_count, fail_count, total_response_time, timed_count,
+     total_results)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        count = count + excluded.count,
+        success_count = success_count + excluded.success_count,
+        fail_count = fail_count + excluded.fail_count,
+        total_response_time = total_response_time + excluded.total_response_time,
+        timed_count = timed_count + excluded.timed_count,
+        total_results = total_results + excluded.total_results
+"""
+
 
 @dataclass
 class SearchQuery:
@@ -45,17 +123,144 @@ class SearchAnalytics:
             db_path = cache_dir / "search_analytics.db"
 
         self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self._init_database()
 
+        # Rows waiting for the next batched flush (guarded by self._lock)
+        self._pending_queries: List[tuple] = []
+        self._pending_terms: List[tuple] = []
+        self._last_flush = time.monotonic()
+        self._last_maintenance = time.monotonic()
+
+        # Running totals behind the average gauges, published once per batch
+        self._rt_sum = 0.0
+        self._rt_count = 0
+        self._rc_sum = 0
+        self._rc_count = 0
+
         # In-memory caches for performance
-        self._query_cache = []
+        self._query_cache: deque = deque(maxlen=QUERY_CACHE_SIZE)
         self._popular_terms = Counter()
         self._category_stats = defaultdict(int)
 
+        # Per-query occurrence counts for hot-query sampling, reset every window.
+        # Hot occurrences not yet stored are counted in _held_counts, with the
+        # latest one kept in _held_queries to stand for them when released.
+        self._recent: Counter = Counter()
+        self._recent_window_start = time.monotonic()
+        self._held_counts: Counter = Counter()
+        self._held_queries: Dict[str, SearchQuery] = {}
+
+        # Trending sketch: epoch hour -> query -> [count, results sum, time sum]
+        self._trending: Dict[int, Dict[str, List[float]]] = {}
+        self._seed_trending()
+
+        # track_search only enqueues; a daemon thread records queries in batches.
+        # _enqueued/_processed let readers wait until their own writes landed.
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=QUEUE_MAXSIZE)
+        self._enqueue_lock = threading.Lock()
+        self._enqueued = 0
+        self._processed = 0
+        self._drained = threading.Condition(self._lock)
+        self._worker = threading.Thread(
+            target=_drain_queue,
+            args=(weakref.ref(self), self._queue),
+            name="search-analytics-writer",
+            daemon=True,
+        )
+        self._worker.start()
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared autocommit connection used by every method."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        # Per-connection tuning for append-heavy analytics writes
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Serialize access to the shared connection across threads."""
+        with self._lock:
+            yield self._conn
+
+    @contextmanager
+    def _synced_connection(self) -> Iterator[sqlite3.Connection]:
+        """Like ``_connection`` but with every query tracked so far written out."""
+        with self._enqueue_lock:
+            target = self._enqueued
+        with self._connection() as conn:
+            self._drained.wait_for(
+                lambda: self._processed >= target, timeout=FLUSH_INTERVAL_SECONDS
+            )
+            self._flush_pending(conn)
+            yield conn
+
+    def close(self) -> None:
+        """Stop the background writer, flush and close the database connection."""
+        self._queue.put(_STOP)
+        self._worker.join(timeout=FLUSH_INTERVAL_SECONDS)
+        with self._lock:
+            self._flush_pending(self._conn)
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+
+    def flush(self) -> None:
+        """Write all tracked search queries and term counts to the database."""
+        with self._synced_connection():
+            pass
+
+    def _flush_pending(self, conn: sqlite3.Connection) -> None:
+        """Write buffered rows in one transaction; caller must hold the lock."""
+        self._release_held_queries()
+        if not self._pending_queries and not self._pending_terms:
+            return
+        queries, self._pending_queries = self._pending_queries, []
+        terms, self._pending_terms = self._pending_terms, []
+        self._last_flush = time.monotonic()
+
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(_INSERT_SQL, queries)
+            conn.executemany(_UPSERT_DAILY_SQL, _daily_rollup(queries))
+            # One upsert per distinct term, carrying its count for the batch
+            term_counts: Dict[str, List[Any]] = {}
+            for term, seen in terms:
+                entry = term_counts.setdefault(term, [0, seen])
+                entry[0] += 1
+                entry[1] = seen
+            conn.executemany(
+                _UPSERT_TERM_SQL,
+                [(term, count, seen) for term, (count, seen) in term_counts.items()],
+            )
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _maintain(self, conn: sqlite3.Connection) -> None:
+        """Refresh query planner statistics and shrink the WAL file."""
+        self._last_maintenance = time.monotonic()
+        conn.execute("PRAGMA optimize")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def _init_database(self):
         """Initialize SQLite database for persistent analytics storage."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
+                # WAL persists in the database file, so it only needs setting once
+                conn.execute("PRAGMA journal_mode=WAL")
+
                 conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS search_queries (
@@ -68,11 +273,111 @@ class SearchAnalytics:
                         results_count INTEGER DEFAULT 0,
                         response_time REAL DEFAULT 0.0,
                         user_id TEXT,
-                        success BOOLEAN DEFAULT TRUE
+                        success BOOLEAN DEFAULT TRUE,
+                        weight INTEGER DEFAULT 1,
+                        timestamp_hour INTEGER,
+                        ts_epoch INTEGER NOT NULL
                     )
                 """
                 )
 
+                # Older databases lack the sampling weight, precomputed hour and
+                # epoch seconds; backfills treat stored timestamps as local time
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(search_queries)")}
+                if "weight" not in columns:
+                    conn.execute(
+                        "ALTER TABLE search_queries ADD COLUMN weight INTEGER DEFAULT 1"
+                    )
+                if "timestamp_hour" not in columns:
+                    conn.execute("ALTER TABLE search_queries ADD COLUMN timestamp_hour INTEGER")
+                    conn.execute(
+                        "UPDATE search_queries "
+                        "SET timestamp_hour = CAST(strftime('%H', timestamp) AS INTEGER)"
+                    )
+                if "ts_epoch" not in columns:
+                    conn.execute("ALTER TABLE search_queries ADD COLUMN ts_epoch INTEGER")
+                    conn.execute(
+                        "UPDATE search_queries "
+                        "SET ts_epoch = CAST(strftime('%s', timestamp, 'utc') AS INTEGER)"
+                    )
+
+                # Normalized query categories, filled from the JSON column by a
+                # trigger (and backfilled once) so usage stats aggregate in SQL
+                has_categories = conn.execute(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'search_categories'"
+                ).fetchone()
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS search_categories (
+                        query_id INTEGER,
+                        category TEXT,
+                        PRIMARY KEY (query_id, category)
+                    )
+                """
+                )
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_search_categories_category
+                    ON search_categories(category, query_id)
+                """
+                )
+                conn.execute(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS search_queries_categories_ai
+                    AFTER INSERT ON search_queries
+                    WHEN new.categories IS NOT NULL AND json_valid(new.categories)
+                    BEGIN
+                        INSERT OR IGNORE INTO search_categories (query_id, category)
+                        SELECT new.id, value FROM json_each(new.categories);
+                    END
+                """
+                )
+                if not has_categories:
+                    conn.execute(
+                        """
+                        INSERT OR IGNORE INTO search_categories (query_id, category)
+                        SELECT sq.id, je.value
+                        FROM search_queries sq, json_each(sq.categories) je
+                        WHERE sq.categories IS NOT NULL AND json_valid(sq.categories)
+                    """
+                    )
+
+                # Per-day roll-up of search_queries (weighted), maintained by
+                # _flush_pending and backfilled from raw rows when first created
+                has_daily = conn.execute(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'search_queries_daily'"
+                ).fetchone()
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS search_queries_daily (
+                        date TEXT PRIMARY KEY,
+                        count INTEGER DEFAULT 0,
+                        success_count INTEGER DEFAULT 0,
+                        fail_count INTEGER DEFAULT 0,
+                        total_response_time REAL DEFAULT 0.0,
+                        timed_count INTEGER DEFAULT 0,
+                        total_results INTEGER DEFAULT 0
+                    )
+                """
+                )
+                if not has_daily:
+                    conn.execute(
+                        """
+                        INSERT INTO search_queries_daily
+                        SELECT DATE(timestamp), SUM(weight),
+                               SUM(CASE WHEN success THEN weight ELSE 0 END),
+                               SUM(CASE WHEN success THEN 0 ELSE weight END),
+                               SUM(CASE WHEN response_time > 0
+                                   THEN response_time * weight ELSE 0 END),
+                               SUM(CASE WHEN response_time > 0 THEN weight ELSE 0 END),
+                               SUM(results_count * weight)
+                        FROM search_queries
+                        GROUP BY DATE(timestamp)
+                    """
+                    )
+
                 conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS popular_terms (
@@ -83,9 +388,22 @@ class SearchAnalytics:
                 """
                 )
 
+                # Covering indexes for the time-windowed aggregates, keyed on
+                # integer epoch seconds; their prefix makes a plain time index
+                # redundant. Earlier text-timestamp versions are dropped.
+                for old_index in ("idx_timestamp", "idx_ts_query", "idx_ts_success"):
+                    conn.execute(f"DROP INDEX IF EXISTS {old_index}")
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_epoch_query
+                    ON search_queries(ts_epoch, query, weight)
+                """
+                )
+
                 conn.execute(
                     """
-                    CREATE INDEX IF NOT EXISTS idx_timestamp ON search_queries(timestamp)
+                    CREATE INDEX IF NOT EXISTS idx_epoch_success
+                    ON search_queries(ts_epoch, success, response_time, weight)
                 """
                 )
 
@@ -95,44 +413,70 @@ class SearchAnalytics:
                 """
                 )
 
-            self.logger.info(f"Search analytics database initialized at {self.db_path}")
+            self.logger.info("Search analytics database initialized at %s", self.db_path)
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize analytics database: {e}")
+            self.logger.error("Failed to initialize analytics database: %s", e)
             raise
 
     def track_search(self, search_query: SearchQuery):
-        """Track a search query with full metadata."""
+        """Track a search query with full metadata.
+
+        The query is handed to a background writer, so this never touches the
+        database; reads wait for previously tracked queries to be recorded.
+        """
+        with self._enqueue_lock:
+            try:
+                self._queue.put_nowait(search_query)
+            except queue.Full:
+                self.metrics.increment_counter("analytics_dropped")
+                return
+            self._enqueued += 1
+
+    def _record_batch(self, batch: List[SearchQuery]) -> None:
+        """Buffer a batch of queued queries; runs on the background writer."""
+        with self._connection() as conn:
+            try:
+                for search_query in batch:
+                    self._record_query(search_query)
+                if batch:
+                    self._publish_averages()
+
+                if (
+                    len(self._pending_queries) >= FLUSH_BATCH_SIZE
+                    or time.monotonic() - self._last_flush >= FLUSH_INTERVAL_SECONDS
+                ):
+                    self._flush_pending(conn)
+
+                if time.monotonic() - self._last_maintenance >= MAINTENANCE_INTERVAL_SECONDS:
+                    self._maintain(conn)
+
+            except Exception as e:
+                self.logger.error("Failed to record search queries: %s", e)
+
+            finally:
+                self._processed += len(batch)
+                self._drained.notify_all()
+
+    def _record_query(self, search_query: SearchQuery) -> None:
+        """Buffer one query's rows and update caches; called with the lock held."""
         try:
-            # Store in database
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO search_queries
-                    (query, timestamp, categories, authors, date_range, results_count,
-                     response_time, user_id, success)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        search_query.query,
-                        search_query.timestamp.isoformat(),
-                        json.dumps(search_query.categories) if search_query.categories else None,
-                        json.dumps(search_query.authors) if search_query.authors else None,
-                        json.dumps(search_query.date_range) if search_query.date_range else None,
-                        search_query.results_count,
-                        search_query.response_time,
-                        search_query.user_id,
-                        search_query.success,
-                    ),
-                )
+            weight = self._sample_weight(search_query.query)
+            if weight:
+                self._pending_queries.append(_query_row(search_query, weight))
+            else:
+                self._held_queries[search_query.query] = search_query
+            self._update_popular_terms(search_query.query)
+            self._update_trending(search_query)
 
             # Update in-memory caches
             self._query_cache.append(search_query)
-            self._update_popular_terms(search_query.query)
 
             if search_query.categories:
                 for category in search_query.categories:
                     self._category_stats[category] += 1
+                if len(self._category_stats) > MAX_TRACKED_CATEGORIES:
+                    _halve_counts(self._category_stats)
 
             # Update metrics
             self.metrics.increment_counter("search_queries_total")
@@ -141,49 +485,134 @@ class SearchAnalytics:
             else:
                 self.metrics.increment_counter("search_queries_failed")
 
-            self.metrics.set_gauge("avg_response_time", search_query.response_time)
-            self.metrics.set_gauge("avg_results_count", search_query.results_count)
+            self._rt_sum += search_query.response_time
+            self._rt_count += 1
+            self._rc_sum += search_query.results_count
+            self._rc_count += 1
 
-            self.logger.debug(f"Tracked search query: {search_query.query[:50]}...")
+            self.logger.debug("Tracked search query: %.50s...", search_query.query)
 
         except Exception as e:
-            self.logger.error(f"Failed to track search query: {e}")
+            self.logger.error("Failed to track search query: %s", e)
+
+    def _publish_averages(self) -> None:
+        """Set the average gauges from the running totals."""
+        if self._rt_count:
+            self.metrics.set_gauge("avg_response_time", self._rt_sum / self._rt_count)
+        if self._rc_count:
+            self.metrics.set_gauge("avg_results_count", self._rc_sum / self._rc_count)
+
+    def _sample_weight(self, query: str) -> int:
+        """Weight to store this occurrence of ``query`` with; 0 means hold it back.
+
+        Called with the connection lock held.
+        """
+        now = time.monotonic()
+        if now - self._recent_window_start >= HOT_QUERY_WINDOW_SECONDS:
+            self._release_held_queries()
+            self._recent.clear()
+            self._recent_window_start = now
+
+        self._recent[query] += 1
+        if self._recent[query] <= HOT_QUERY_THRESHOLD:
+            return 1
+
+        held = self._held_counts[query] + 1
+        if held < HOT_QUERY_SAMPLE_RATE:
+            self._held_counts[query] = held
+            return 0
+        # This row stands for itself and every occurrence held back before it
+        del self._held_counts[query]
+        self._held_queries.pop(query, None)
+        return held
+
+    def _release_held_queries(self) -> None:
+        """Buffer one row per query for its held-back occurrences; lock held."""
+        for query, held in self._held_counts.items():
+            self._pending_queries.append(_query_row(self._held_queries[query], held))
+        self._held_counts.clear()
+        self._held_queries.clear()
 
     def _update_popular_terms(self, query: str):
-        """Extract and update popular search terms."""
+        """Extract popular search terms and buffer their count updates.
+
+        Called with the connection lock held.
+        """
         # Simple term extraction (can be enhanced with NLP)
-        terms = query.lower().split()
-        terms = [term.strip('.,!?;:"()[]{}') for term in terms if len(term) > 2]
+        terms = _TERM_RE.findall(query.lower())
 
+        now = datetime.now().isoformat()
         for term in terms:
             self._popular_terms[term] += 1
+            self._pending_terms.append((term, now))
+
+        if len(self._popular_terms) > MAX_TRACKED_TERMS:
+            _halve_counts(self._popular_terms)
+
+    def _update_trending(self, search_query: SearchQuery) -> None:
+        """Count a query in its hour of the trending sketch; lock held."""
+        hour = int(search_query.timestamp.timestamp()) // 3600
+        oldest = int(time.time()) // 3600 - TRENDING_WINDOW_HOURS
+        if hour < oldest:
+            return
+
+        bucket = self._trending.get(hour)
+        if bucket is None:
+            for stale in [h for h in self._trending if h < oldest]:
+                del self._trending[stale]
+            bucket = self._trending[hour] = {}
+
+        entry = bucket.get(search_query.query)
+        if entry is None:
+            entry = bucket[search_query.query] = [0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += search_query.results_count
+        entry[2] += search_query.response_time
+
+        if len(bucket) > TRENDING_SKETCH_SIZE:
+            _halve_trending(bucket)
+
+    def _seed_trending(self) -> None:
+        """Load the trending window already stored in the database."""
+        oldest = int(time.time()) // 3600 - TRENDING_WINDOW_HOURS
+        try:
+            with self._connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT ts_epoch / 3600 as hour, query, SUM(weight),
+                           SUM(results_count * weight), SUM(response_time * weight)
+                    FROM search_queries
+                    WHERE ts_epoch >= ?
+                    GROUP BY hour, query
+                """,
+                    (oldest * 3600,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.error("Failed to load trending queries: %s", e)
+            return
 
-            # Update database
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO popular_terms (term, count, last_seen)
-                        VALUES (?, COALESCE((SELECT count FROM popular_terms WHERE term = ?) + 1, 1), ?)
-                    """,
-                        (term, term, datetime.now().isoformat()),
-                    )
-            except Exception as e:
-                self.logger.warning(f"Failed to update popular term {term}: {e}")
+        for hour, query, count, results_sum, time_sum in rows:
+            bucket = self._trending.setdefault(hour, {})
+            bucket[query] = [count, float(results_sum or 0), float(time_sum or 0)]
+        for bucket in self._trending.values():
+            while len(bucket) > TRENDING_SKETCH_SIZE:
+                _halve_trending(bucket)
 
     def get_query_patterns(self, days: int = 30) -> Dict[str, Any]:
         """Get query pattern analysis for the specified number of days."""
         try:
             cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_epoch = int(cutoff_date.timestamp())
 
-            with sqlite3.connect(self.db_path) as conn:
-                # Query frequency over time
-                queries = conn.execute(
+            with self._synced_connection() as conn:
+                # Query frequency, success rate and response time come from the
+                # daily roll-up, so they cost one row per day in the window
+                daily = conn.execute(
                     """
-                    SELECT DATE(timestamp) as date, COUNT(*) as count
-                    FROM search_queries
-                    WHERE timestamp >= ?
-                    GROUP BY DATE(timestamp)
+                    SELECT date, count, success_count, fail_count,
+                           total_response_time, timed_count
+                    FROM search_queries_daily
+                    WHERE date >= DATE(?)
                     ORDER BY date
                 """,
                     (cutoff_date.isoformat(),),
@@ -192,56 +621,39 @@ class SearchAnalytics:
                 # Most common queries
                 common_queries = conn.execute(
                     """
-                    SELECT query, COUNT(*) as count
+                    SELECT query, SUM(weight) as count
                     FROM search_queries
-                    WHERE timestamp >= ?
+                    WHERE ts_epoch >= ?
                     GROUP BY query
                     ORDER BY count DESC
                     LIMIT 20
                 """,
-                    (cutoff_date.isoformat(),),
+                    (cutoff_epoch,),
                 ).fetchall()
 
-                # Success rate
-                success_stats = conn.execute(
-                    """
-                    SELECT success, COUNT(*) as count
-                    FROM search_queries
-                    WHERE timestamp >= ?
-                    GROUP BY success
-                """,
-                    (cutoff_date.isoformat(),),
-                ).fetchall()
-
-                # Average response time
-                avg_response = conn.execute(
-                    """
-                    SELECT AVG(response_time) as avg_time
-                    FROM search_queries
-                    WHERE timestamp >= ? AND response_time > 0
-                """,
-                    (cutoff_date.isoformat(),),
-                ).fetchone()
+            successful = sum(row[2] for row in daily)
+            failed = sum(row[3] for row in daily)
+            total_response_time = sum(row[4] for row in daily)
+            timed_count = sum(row[5] for row in daily)
 
             return {
-                "query_frequency": [{"date": row[0], "count": row[1]} for row in queries],
+                "query_frequency": [{"date": row[0], "count": row[1]} for row in daily],
                 "common_queries": [{"query": row[0], "count": row[1]} for row in common_queries],
-                "success_rate": {
-                    "successful": next((row[1] for row in success_stats if row[0]), 0),
-                    "failed": next((row[1] for row in success_stats if not row[0]), 0),
-                },
-                "avg_response_time": avg_response[0] if avg_response and avg_response[0] else 0.0,
+                "success_rate": {"successful": successful, "failed": failed},
+                "avg_response_time": (
+                    total_response_time / timed_count if timed_count else 0.0
+                ),
                 "analysis_period_days": days,
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to get query patterns: {e}")
+            self.logger.error("Failed to get query patterns: %s", e)
             return {}
 
     def get_popular_searches(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get most popular search terms."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._synced_connection() as conn:
                 results = conn.execute(
                     """
                     SELECT term, count, last_seen
@@ -255,60 +667,57 @@ class SearchAnalytics:
                 return [{"term": row[0], "count": row[1], "last_seen": row[2]} for row in results]
 
         except Exception as e:
-            self.logger.error(f"Failed to get popular searches: {e}")
+            self.logger.error("Failed to get popular searches: %s", e)
             return []
 
     def get_usage_statistics(self, days: int = 30) -> Dict[str, Any]:
         """Get comprehensive usage statistics."""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_epoch = int((datetime.now() - timedelta(days=days)).timestamp())
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._synced_connection() as conn:
                 # Total queries
                 total_queries = conn.execute(
                     """
-                    SELECT COUNT(*) FROM search_queries WHERE timestamp >= ?
+                    SELECT COALESCE(SUM(weight), 0) FROM search_queries WHERE ts_epoch >= ?
                 """,
-                    (cutoff_date.isoformat(),),
+                    (cutoff_epoch,),
                 ).fetchone()[0]
 
                 # Unique queries
                 unique_queries = conn.execute(
                     """
-                    SELECT COUNT(DISTINCT query) FROM search_queries WHERE timestamp >= ?
+                    SELECT COUNT(DISTINCT query) FROM search_queries WHERE ts_epoch >= ?
                 """,
-                    (cutoff_date.isoformat(),),
+                    (cutoff_epoch,),
                 ).fetchone()[0]
 
                 # Peak hour analysis
                 hourly_stats = conn.execute(
                     """
-                    SELECT strftime('%H', timestamp) as hour, COUNT(*) as count
+                    SELECT printf('%02d', COALESCE(timestamp_hour, strftime('%H', timestamp)))
+                           as hour, SUM(weight) as count
                     FROM search_queries
-                    WHERE timestamp >= ?
+                    WHERE ts_epoch >= ?
                     GROUP BY hour
                     ORDER BY count DESC
                 """,
-                    (cutoff_date.isoformat(),),
+                    (cutoff_epoch,),
                 ).fetchall()
 
                 # Category usage
-                category_usage = defaultdict(int)
-                category_queries = conn.execute(
-                    """
-                    SELECT categories FROM search_queries
-                    WHERE timestamp >= ? AND categories IS NOT NULL
-                """,
-                    (cutoff_date.isoformat(),),
-                ).fetchall()
-
-                for row in category_queries:
-                    try:
-                        categories = json.loads(row[0])
-                        for cat in categories:
-                            category_usage[cat] += 1
-                    except json.JSONDecodeError:
-                        continue
+                category_usage = dict(
+                    conn.execute(
+                        """
+                        SELECT sc.category, SUM(sq.weight)
+                        FROM search_categories sc
+                        JOIN search_queries sq ON sq.id = sc.query_id
+                        WHERE sq.ts_epoch >= ?
+                        GROUP BY sc.category
+                    """,
+                        (cutoff_epoch,),
+                    ).fetchall()
+                )
 
             return {
                 "total_queries": total_queries,
@@ -317,33 +726,81 @@ class SearchAnalytics:
                     (total_queries - unique_queries) / total_queries if total_queries > 0 else 0
                 ),
                 "peak_hours": [{"hour": row[0], "count": row[1]} for row in hourly_stats[:5]],
-                "category_usage": dict(category_usage),
+                "category_usage": category_usage,
                 "analysis_period_days": days,
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to get usage statistics: {e}")
+            self.logger.error("Failed to get usage statistics: %s", e)
             return {}
 
     def get_trending_queries(self, hours: int = 24) -> List[Dict[str, Any]]:
-        """Get trending queries in the specified time period."""
+        """Get trending queries in the specified time period.
+
+        Windows up to ``TRENDING_WINDOW_HOURS`` are answered from the in-memory
+        sketch at hour granularity; longer ones fall back to the database.
+        """
+        if hours > TRENDING_WINDOW_HOURS:
+            return self._trending_from_db(hours)
+
         try:
-            cutoff_time = datetime.now() - timedelta(hours=hours)
+            cutoff_hour = int(time.time() - hours * 3600) // 3600
+            totals: Dict[str, List[float]] = {}
+            with self._synced_connection():
+                for hour, bucket in self._trending.items():
+                    if hour < cutoff_hour:
+                        continue
+                    for query, (count, results_sum, time_sum) in bucket.items():
+                        entry = totals.get(query)
+                        if entry is None:
+                            totals[query] = [count, results_sum, time_sum]
+                        else:
+                            entry[0] += count
+                            entry[1] += results_sum
+                            entry[2] += time_sum
+
+            trending = heapq.nlargest(
+                20,
+                (
+                    (count, results_sum / count, time_sum / count, query)
+                    for query, (count, results_sum, time_sum) in totals.items()
+                    if count >= 2
+                ),
+                key=lambda row: (row[0], row[1]),
+            )
+            return [
+                {
+                    "query": query,
+                    "frequency": count,
+                    "avg_results": avg_results,
+                    "avg_response_time": avg_time,
+                }
+                for count, avg_results, avg_time, query in trending
+            ]
 
-            with sqlite3.connect(self.db_path) as conn:
+        except Exception as e:
+            self.logger.error("Failed to get trending queries: %s", e)
+            return []
+
+    def _trending_from_db(self, hours: int) -> List[Dict[str, Any]]:
+        """Compute trending queries from stored rows for long windows."""
+        try:
+            cutoff_epoch = int((datetime.now() - timedelta(hours=hours)).timestamp())
+
+            with self._synced_connection() as conn:
                 trending = conn.execute(
                     """
-                    SELECT query, COUNT(*) as recent_count,
-                           AVG(results_count) as avg_results,
-                           AVG(response_time) as avg_time
+                    SELECT query, SUM(weight) as recent_count,
+                           SUM(results_count * weight) * 1.0 / SUM(weight) as avg_results,
+                           SUM(response_time * weight) / SUM(weight) as avg_time
                     FROM search_queries
-                    WHERE timestamp >= ?
+                    WHERE ts_epoch >= ?
                     GROUP BY query
                     HAVING recent_count >= 2
                     ORDER BY recent_count DESC, avg_results DESC
                     LIMIT 20
                 """,
-                    (cutoff_time.isoformat(),),
+                    (cutoff_epoch,),
                 ).fetchall()
 
                 return [
@@ -357,7 +814,7 @@ class SearchAnalytics:
                 ]
 
         except Exception as e:
-            self.logger.error(f"Failed to get trending queries: {e}")
+            self.logger.error("Failed to get trending queries: %s", e)
             return []
 
     def export_analytics(self, days: int = 30) -> Dict[str, Any]:
@@ -381,3 +838,118 @@ def get_search_analytics() -> SearchAnalytics:
     if _analytics_instance is None:
         _analytics_instance = SearchAnalytics()
     return _analytics_instance
+
+
+def _encode_list(values: Optional[Any]) -> Optional[str]:
+    """Encode a list column as compact JSON, or None when empty.
+
+    A single string, the common case for categories and authors, is quoted
+    directly without going through the general encoder.
+    """
+    if not values:
+        return None
+    if len(values) == 1 and isinstance(values[0], str):
+        return f"[{_quote_json(values[0])}]"
+    return _encode_json(values)
+
+
+def _query_row(search_query: SearchQuery, weight: int) -> tuple:
+    """Parameters for _INSERT_SQL storing ``search_query`` with ``weight``."""
+    return (
+        search_query.query,
+        search_query.timestamp.isoformat(),
+        _encode_list(search_query.categories),
+        _encode_list(search_query.authors),
+        _encode_list(search_query.date_range),
+        search_query.results_count,
+        search_query.response_time,
+        search_query.user_id,
+        search_query.success,
+        weight,
+        search_query.timestamp.hour,
+        int(search_query.timestamp.timestamp()),
+    )
+
+
+def _daily_rollup(rows: List[tuple]) -> List[tuple]:
+    """Collapse buffered search_queries rows into search_queries_daily deltas."""
+    days: Dict[str, List[Any]] = {}
+    for row in rows:
+        results_count, response_time, success, weight = row[5], row[6], row[8], row[9]
+        day = days.setdefault(row[1][:10], [0, 0, 0, 0.0, 0, 0])
+        day[0] += weight
+        day[1 if success else 2] += weight
+        if response_time > 0:
+            day[3] += response_time * weight
+            day[4] += weight
+        day[5] += results_count * weight
+    return [(date, *totals) for date, totals in days.items()]
+
+
+def _halve_counts(counts: Dict[str, int]) -> None:
+    """Age a frequency table in place: halve every count, drop those reaching 0.
+
+    Frequent keys survive repeated halvings while one-off keys are evicted,
+    which keeps the table bounded without a full LFU structure.
+    """
+    for key, count in list(counts.items()):
+        if count > 1:
+            counts[key] = count // 2
+        else:
+            del counts[key]
+
+
+def _halve_trending(bucket: Dict[str, List[float]]) -> None:
+    """Age one hour of the trending sketch like ``_halve_counts``.
+
+    Result and response-time sums are scaled with the count so per-query
+    averages are unchanged.
+    """
+    for query, entry in list(bucket.items()):
+        count = entry[0]
+        if count > 1:
+            kept = count // 2
+            entry[1] *= kept / count
+            entry[2] *= kept / count
+            entry[0] = kept
+        else:
+            del bucket[query]
+
+
+def _drain_queue(ref: "weakref.ReferenceType[SearchAnalytics]", work: queue.Queue) -> None:
+    """Background writer: record queued queries in batches until stopped.
+
+    Holds only a weak reference so an abandoned analytics instance can still
+    be garbage collected; the thread then exits on its next wake-up.
+    """
+    while True:
+        try:
+            batch = [work.get(timeout=FLUSH_INTERVAL_SECONDS)]
+        except queue.Empty:
+            batch = []
+        while batch and len(batch) < FLUSH_BATCH_SIZE:
+            try:
+                batch.append(work.get_nowait())
+            except queue.Empty:
+                break
+
+        stop = any(item is _STOP for item in batch)
+        analytics = ref()
+        if analytics is None:
+            return
+        # An empty batch still lets the writer flush on the time limit
+        analytics._record_batch([item for item in batch if item is not _STOP])
+        del analytics
+        if stop:
+            return
+
+
+def _flush_at_exit(ref: "weakref.ReferenceType[SearchAnalytics]") -> None:
+    """Flush an analytics instance's buffered writes at interpreter exit."""
+    analytics = ref()
+    if analytics is None:
+        return
+    try:
+        analytics.flush()
+    except Exception:
+        pass
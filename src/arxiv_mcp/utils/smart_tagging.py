@@ -6,13 +6,21 @@ This module provides automatic keyword extraction and tagging capabilities
 for research papers, leveraging NLP techniques and domain-specific knowledge.
 """
 
+import hashlib
 import re
-from typing import List, Dict, Any, Optional, Tuple
-from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
+import multiprocessing
+import os
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
 # Optional NLTK imports
@@ -28,12 +36,193 @@ try:
 except ImportError:
     NLTK_AVAILABLE = False
 
+# Optional PyStemmer (libstemmer C bindings), much faster than NLTK's stemmer
+try:
+    import Stemmer
+
+    STEMMER_AVAILABLE = True
+except ImportError:
+    STEMMER_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+_SQL_UPSERT_TAG = """
+    INSERT INTO tags
+    (term, category, confidence, frequency, contexts, related_terms, last_used)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(term, category) DO UPDATE SET
+        confidence = excluded.confidence,
+        frequency = excluded.frequency,
+        contexts = excluded.contexts,
+        related_terms = excluded.related_terms,
+        last_used = excluded.last_used
+"""
+
+_SQL_LINK_PAPER_TAG = """
+    INSERT INTO paper_tags (paper_id, tag_id, confidence, context)
+    SELECT ?, id, ?, ? FROM tags WHERE term = ? AND category = ?
+"""
+
+
+def _json_list(values: List[str]) -> str:
+    """Encode a tag's contexts or related terms for storage.
+
+    Freshly extracted tags mostly have empty lists, which skip the encoder.
+    """
+    if not values:
+        return "[]"
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(values).decode()
+    return json.dumps(values)
+
+
+# Candidate terms for basic extraction; applied to lower-cased text
+_WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+
+# Number of extract_tags results each tagger remembers for repeated texts
+TAG_CACHE_SIZE = 1024
+
+# Default tag_papers worker count. Workers are spawned rather than forked: the
+# server process runs background threads that hold locks, and a forked child
+# could inherit one mid-acquire.
+TAGGING_WORKERS = min(4, os.cpu_count() or 1)
+
+
+# Fallback stopwords when NLTK is not installed
+_BASIC_STOPWORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "this",
+        "that",
+        "these",
+        "those",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "can",
+        "cannot",
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def _language_resources() -> Tuple[frozenset, Optional[Any]]:
+    """Load the stopword set and stemmer once per process."""
+    if not NLTK_AVAILABLE:
+        return _BASIC_STOPWORDS, None
+    _ensure_nltk_data()
+    return frozenset(stopwords.words("english")), PorterStemmer()
+
+
+def _ensure_nltk_data() -> None:
+    """Ensure required NLTK data is downloaded."""
+    required_data = [
+        "punkt",
+        "stopwords",
+        "averaged_perceptron_tagger",
+        "maxent_ne_chunker",
+        "words",
+    ]
+
+    for data_name in required_data:
+        try:
+            nltk.data.find(f"tokenizers/{data_name}")
+        except LookupError:
+            try:
+                nltk.download(data_name, quiet=True)
+            except Exception as e:
+                logger.warning(f"Could not download NLTK data {data_name}: {e}")
+
+
+def _trie_pattern(words) -> str:
+    """Build a regex matching any of ``words``, factored as a character trie.
 
-@dataclass
+    Shared prefixes are matched once, so the engine does work proportional to
+    the text rather than to the number of words at each position.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+
+    return build(trie)
+
+
+def _keyword_index(
+    field_keywords: Dict[str, frozenset],
+) -> Tuple[re.Pattern, Dict[str, Tuple[Tuple[str, str], ...]]]:
+    """Compile one scanner for all field keywords.
+
+    Returns the pattern and, per matched keyword, the ``(domain, keyword)``
+    hits it stands for. A match also credits keywords nested inside it
+    ("organic" in "inorganic"), as plain substring counting did.
+    """
+    domains: Dict[str, List[str]] = defaultdict(list)
+    for domain, keywords in field_keywords.items():
+        for keyword in keywords:
+            domains[keyword].append(domain)
+
+    hits = {}
+    for keyword in domains:
+        credited = []
+        for other, other_domains in domains.items():
+            for _ in range(keyword.count(other)):
+                credited.extend((domain, other) for domain in other_domains)
+        hits[keyword] = tuple(credited)
+    return re.compile(_trie_pattern(domains)), hits
+
+
+@dataclass(slots=True)
 class Tag:
     """Represents a smart tag with metadata."""
 
@@ -47,7 +236,7 @@ class Tag:
     last_used: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaggingResult:
     """Result of smart tagging operation."""
 
@@ -211,69 +400,72 @@ class SmartTagger:
         "review": ["survey", "review", "overview", "state-of-art", "literature"],
     }
 
+    # Frozen once at class creation; hot paths only read these
+    FIELD_KEYWORDS = {domain: frozenset(words) for domain, words in FIELD_KEYWORDS.items()}
+    TAG_CATEGORIES = {category: frozenset(words) for category, words in TAG_CATEGORIES.items()}
+
+    # Single-pass scanners over every FIELD_KEYWORDS and TAG_CATEGORIES entry
+    _KEYWORD_PATTERN, _KEYWORD_HITS = _keyword_index(FIELD_KEYWORDS)
+    _CATEGORY_PATTERN, _CATEGORY_HITS = _keyword_index(TAG_CATEGORIES)
+
     def __init__(self, cache_dir: Optional[str] = None):
         """Initialize the smart tagger."""
         self.cache_dir = Path(cache_dir) if cache_dir else Path.cwd() / "tag_cache"
         self.cache_dir.mkdir(exist_ok=True)
 
         self.db_path = self.cache_dir / "tags.db"
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self._init_database()
-
-        # Initialize NLTK components if available
-        if NLTK_AVAILABLE:
-            self._ensure_nltk_data()
-            self.stemmer = PorterStemmer()
-            self.stop_words = set(stopwords.words("english"))
-        else:
-            self.stemmer = None
-            self.stop_words = {
-                "the",
-                "a",
-                "an",
-                "and",
-                "or",
-                "but",
-                "in",
-                "on",
-                "at",
-                "to",
-                "for",
-                "of",
-                "with",
-                "by",
-                "this",
-                "that",
-                "these",
-                "those",
-                "is",
-                "are",
-                "was",
-                "were",
-                "be",
-                "been",
-                "being",
-                "have",
-                "has",
-                "had",
-                "do",
-                "does",
-                "did",
-                "will",
-                "would",
-                "could",
-                "should",
-                "may",
-                "might",
-                "must",
-                "can",
-                "cannot",
-            }
+        self._init_extraction()
 
         logger.info(f"SmartTagger initialized with NLTK: {NLTK_AVAILABLE}")
 
+    @classmethod
+    def _extraction_only(cls) -> "SmartTagger":
+        """Tagger that can only extract tags, without opening the tag database."""
+        tagger = cls.__new__(cls)
+        tagger._init_extraction()
+        return tagger
+
+    def _init_extraction(self) -> None:
+        """Set up the state used by extract_tags."""
+        # extract_tags results keyed by text digest, title and abstract
+        self._tag_cache: "OrderedDict[Tuple[bytes, str, str], Tuple[tuple, ...]]" = (
+            OrderedDict()
+        )
+
+        # Stopwords and stemmer are shared by every tagger; PyStemmer objects
+        # are not thread-safe, so each tagger gets its own
+        self.stop_words, self.stemmer = _language_resources()
+        if STEMMER_AVAILABLE and self.stemmer is not None:
+            self.stemmer = Stemmer.Stemmer("english")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection to the tag database used by every method."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Serialize access to the shared connection; commits on success."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the tag database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _init_database(self) -> None:
         """Initialize SQLite database for tag persistence."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
+            # WAL persists in the database file, so it only needs setting once
+            conn.execute("PRAGMA journal_mode=WAL")
+
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS tags (
@@ -316,25 +508,6 @@ class SmartTagger:
             """
             )
 
-    def _ensure_nltk_data(self) -> None:
-        """Ensure required NLTK data is downloaded."""
-        required_data = [
-            "punkt",
-            "stopwords",
-            "averaged_perceptron_tagger",
-            "maxent_ne_chunker",
-            "words",
-        ]
-
-        for data_name in required_data:
-            try:
-                nltk.data.find(f"tokenizers/{data_name}")
-            except LookupError:
-                try:
-                    nltk.download(data_name, quiet=True)
-                except Exception as e:
-                    logger.warning(f"Could not download NLTK data {data_name}: {e}")
-
     def categorize_paper(
         self, text: str, title: str = "", abstract: str = ""
     ) -> List[Tag]:
@@ -365,18 +538,34 @@ class SmartTagger:
         Returns:
             List of extracted tags
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+
+        # Papers are often re-tagged unchanged; Tag is mutable, so the cache
+        # holds plain tuples and every call gets fresh objects
+        key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), title, abstract)
+        cached = self._tag_cache.get(key)
+        if cached is not None:
+            self._tag_cache.move_to_end(key)
+            return [
+                Tag(term, category, confidence, frequency, list(contexts), list(related))
+                for term, category, confidence, frequency, contexts, related in cached
+            ]
 
         # Combine all text sources
         full_text = f"{title} {abstract} {text}".strip()
 
+        # Lower-case each source once and share the copies
+        full_text_lower = full_text.lower()
+        title_lower = title.lower()
+        abstract_lower = abstract.lower()
+
         if NLTK_AVAILABLE:
-            tags = self._extract_tags_nltk(full_text, title, abstract)
+            tags = self._extract_tags_nltk(full_text, title_lower, abstract_lower)
         else:
-            tags = self._extract_tags_basic(full_text, title, abstract)
+            tags = self._extract_tags_basic(full_text_lower, title_lower, abstract_lower)
 
         # Add domain-specific tags
-        domain_tags = self._extract_domain_tags(full_text)
+        domain_tags = self._extract_domain_tags(full_text_lower)
         tags.extend(domain_tags)
 
         # Categorize and deduplicate
@@ -390,47 +579,62 @@ class SmartTagger:
         # Sort by confidence
         tags.sort(key=lambda x: x.confidence, reverse=True)
 
-        processing_time = (datetime.now() - start_time).total_seconds()
+        self._tag_cache[key] = tuple(
+            (
+                tag.term,
+                tag.category,
+                tag.confidence,
+                tag.frequency,
+                tuple(tag.contexts),
+                tuple(tag.related_terms),
+            )
+            for tag in tags
+        )
+        if len(self._tag_cache) > TAG_CACHE_SIZE:
+            self._tag_cache.popitem(last=False)
+
+        processing_time = time.perf_counter() - start_time
         logger.info(f"Extracted {len(tags)} tags in {processing_time:.2f}s")
 
         return tags
 
-    def _extract_tags_nltk(self, text: str, title: str, abstract: str) -> List[Tag]:
-        """Extract tags using NLTK capabilities."""
+    def _extract_tags_nltk(
+        self, text: str, title_lower: str, abstract_lower: str
+    ) -> List[Tag]:
+        """Extract tags using NLTK capabilities; title and abstract are lower-cased."""
         tags = []
 
-        # Tokenize and clean
-        tokens = word_tokenize(text.lower())
-        tokens = [token for token in tokens if token.isalnum() and len(token) > 2]
-        tokens = [token for token in tokens if token not in self.stop_words]
-
-        # POS tagging to identify nouns and adjectives
-        pos_tags = pos_tag(tokens)
-        relevant_pos = ["NN", "NNS", "NNP", "NNPS", "JJ", "JJS", "JJR"]
-
-        # Extract meaningful terms
-        term_counts = Counter()
-        for token, pos in pos_tags:
-            if pos in relevant_pos:
-                stem = self.stemmer.stem(token) if self.stemmer else token
-                term_counts[stem] += 1
-
-        # Named entity recognition
-        sentences = sent_tokenize(text)
-        for sentence in sentences[:10]:  # Limit for performance
-            tokens = word_tokenize(sentence)
-            pos_tags = pos_tag(tokens)
-            chunks = ne_chunk(pos_tags)
-
-            for chunk in chunks:
-                if hasattr(chunk, "label"):
-                    entity = " ".join([token for token, pos in chunk.leaves()])
-                    if len(entity) > 2:
-                        term_counts[entity.lower()] += 1
+        stop_words = self.stop_words
+        relevant_pos = {"NN", "NNS", "NNP", "NNPS", "JJ", "JJS", "JJR"}
+
+        # Tokenize and POS-tag each sentence once; the tags serve both term
+        # extraction and, for the leading sentences, named entity chunking
+        terms = []
+        entities = []
+        for index, sentence in enumerate(sent_tokenize(text)):
+            pos_tags = pos_tag(word_tokenize(sentence))
+
+            # Nouns and adjectives are the meaningful terms
+            for token, pos in pos_tags:
+                if pos in relevant_pos and len(token) > 2 and token.isalnum():
+                    token = token.lower()
+                    if token not in stop_words:
+                        terms.append(token)
+
+            # Named entity recognition (limited for performance)
+            if index < 10:
+                for chunk in ne_chunk(pos_tags):
+                    if hasattr(chunk, "label"):
+                        entity = " ".join([token for token, pos in chunk.leaves()])
+                        if len(entity) > 2:
+                            entities.append(entity.lower())
+
+        term_counts = Counter(self._stem_words(terms))
+        term_counts.update(entities)
 
         # Convert to Tag objects
         for term, freq in term_counts.most_common(50):
-            if freq >= 2 or term in title.lower() or term in abstract.lower():
+            if freq >= 2 or term in title_lower or term in abstract_lower:
                 tag = Tag(
                     term=term,
                     category="extracted",
@@ -443,20 +647,29 @@ class SmartTagger:
 
         return tags
 
-    def _extract_tags_basic(self, text: str, title: str, abstract: str) -> List[Tag]:
-        """Extract tags using basic text processing."""
-        tags = []
+    def _stem_words(self, words: List[str]) -> List[str]:
+        """Stem a batch of words, in one C call when PyStemmer is installed."""
+        if self.stemmer is None:
+            return words
+        if STEMMER_AVAILABLE:
+            return self.stemmer.stemWords(words)
+        return [self.stemmer.stem(word) for word in words]
 
-        # Simple word extraction
-        words = re.findall(r"\b[a-zA-Z]{3,}\b", text.lower())
-        words = [word for word in words if word not in self.stop_words]
+    def _extract_tags_basic(
+        self, text_lower: str, title_lower: str, abstract_lower: str
+    ) -> List[Tag]:
+        """Extract tags using basic text processing on lower-cased inputs."""
+        tags = []
 
-        # Count frequencies
-        word_counts = Counter(words)
+        # Count non-stopword words in a single pass
+        stop_words = self.stop_words
+        word_counts = Counter(
+            word for word in _WORD_RE.findall(text_lower) if word not in stop_words
+        )
 
         # Convert to Tag objects
         for word, freq in word_counts.most_common(30):
-            if freq >= 2 or word in title.lower() or word in abstract.lower():
+            if freq >= 2 or word in title_lower or word in abstract_lower:
                 tag = Tag(
                     term=word,
                     category="extracted",
@@ -469,22 +682,20 @@ class SmartTagger:
 
         return tags
 
-    def _extract_domain_tags(self, text: str) -> List[Tag]:
-        """Extract domain-specific tags."""
+    def _extract_domain_tags(self, text_lower: str) -> List[Tag]:
+        """Extract domain-specific tags from lower-cased text."""
         tags = []
-        text_lower = text.lower()
 
-        for domain, keywords in self.FIELD_KEYWORDS.items():
-            domain_score = 0
-            found_keywords = []
+        hits: Dict[str, Counter] = defaultdict(Counter)
+        for match in self._KEYWORD_PATTERN.finditer(text_lower):
+            for domain, keyword in self._KEYWORD_HITS[match.group()]:
+                hits[domain][keyword] += 1
 
-            for keyword in keywords:
-                if keyword in text_lower:
-                    count = text_lower.count(keyword)
-                    domain_score += count
-                    found_keywords.extend([keyword] * count)
+        for domain in self.FIELD_KEYWORDS:
+            keyword_counts = hits.get(domain)
+            if keyword_counts:
+                domain_score = keyword_counts.total()
 
-            if domain_score > 0:
                 # Add domain tag
                 domain_tag = Tag(
                     term=domain.replace("_", " "),
@@ -492,12 +703,11 @@ class SmartTagger:
                     confidence=min(domain_score / 10.0, 1.0),
                     frequency=domain_score,
                     contexts=[],
-                    related_terms=found_keywords,
+                    related_terms=list(keyword_counts),
                 )
                 tags.append(domain_tag)
 
                 # Add individual keyword tags
-                keyword_counts = Counter(found_keywords)
                 for keyword, count in keyword_counts.items():
                     if count >= 2:
                         keyword_tag = Tag(
@@ -514,26 +724,25 @@ class SmartTagger:
 
     def _categorize_tags(self, tags: List[Tag]) -> List[Tag]:
         """Categorize tags based on content analysis."""
-        categorized = []
-
         for tag in tags:
-            # Check against category keywords
-            best_category = "general"
-            best_score = 0
-
-            for category, keywords in self.TAG_CATEGORIES.items():
-                score = sum(1 for kw in keywords if kw in tag.term.lower())
-                if score > best_score:
-                    best_score = score
-                    best_category = category
-
-            # Update category if better match found
-            if best_score > 0 and tag.category == "extracted":
-                tag.category = best_category
-
-            categorized.append(tag)
+            # Only generic extracted terms are re-categorized, so skip the
+            # keyword scoring for domain and keyword tags
+            if tag.category != "extracted":
+                continue
+
+            # Collect the distinct category keywords in the term in one scan
+            found: Dict[str, set] = {}
+            for match in self._CATEGORY_PATTERN.finditer(tag.term.lower()):
+                for category, keyword in self._CATEGORY_HITS[match.group()]:
+                    found.setdefault(category, set()).add(keyword)
+
+            # The category with most keywords wins; ties go to the earlier one
+            if found:
+                tag.category = max(
+                    self.TAG_CATEGORIES, key=lambda category: len(found.get(category, ()))
+                )
 
-        return categorized
+        return tags
 
     def _deduplicate_tags(self, tags: List[Tag]) -> List[Tag]:
         """Remove duplicate tags and merge similar ones."""
@@ -594,19 +803,88 @@ class SmartTagger:
         Returns:
             TaggingResult with extracted tags and metadata
         """
-        start_time = datetime.now()
+        tags, extract_time = self._timed_extract_tags(
+            content.get("text", ""), content.get("title", ""), content.get("abstract", "")
+        )
+        result = self._build_result(paper_id, content, tags, extract_time)
+
+        # Store in database
+        self._store_paper_tags(paper_id, tags)
+        return result
+
+    def tag_papers(
+        self,
+        items: Iterable[Tuple[str, Dict[str, str]]],
+        max_workers: Optional[int] = None,
+    ) -> List[TaggingResult]:
+        """
+        Tag many papers, extracting in parallel worker processes.
+
+        Extraction is CPU-bound and independent per paper, so it is spread
+        over a process pool; all tags are then stored in one transaction.
+
+        Args:
+            items: ``(paper_id, content)`` pairs as accepted by ``tag_paper``
+            max_workers: Worker process count (defaults to TAGGING_WORKERS);
+                1 extracts in this process
+
+        Returns:
+            One TaggingResult per paper, in input order
+        """
+        items = list(items)
+        sources = [
+            (content.get("text", ""), content.get("title", ""), content.get("abstract", ""))
+            for _, content in items
+        ]
+
+        workers = max_workers or TAGGING_WORKERS
+        if len(items) < 2 or workers == 1:
+            extracted = [self._timed_extract_tags(*source) for source in sources]
+        else:
+            # Workers only extract; the tag database stays with this process
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                extracted = list(
+                    pool.map(
+                        _extract_tags_in_worker,
+                        *zip(*sources),
+                        chunksize=max(1, len(sources) // (4 * workers)),
+                    )
+                )
+
+        results = [
+            self._build_result(paper_id, content, tags, extract_time)
+            for (paper_id, content), (tags, extract_time) in zip(items, extracted)
+        ]
+        self._store_paper_tags_bulk([(result.paper_id, result.tags) for result in results])
+        return results
+
+    def _timed_extract_tags(
+        self, text: str, title: str, abstract: str
+    ) -> Tuple[List[Tag], float]:
+        """Run extract_tags and also return how long it took in seconds."""
+        start_time = time.perf_counter()
+        tags = self.extract_tags(text, title, abstract)
+        return tags, time.perf_counter() - start_time
 
+    def _build_result(
+        self, paper_id: str, content: Dict[str, str], tags: List[Tag], extract_time: float
+    ) -> TaggingResult:
+        """Group extracted tags by category and wrap them in a TaggingResult."""
+        start_time = time.perf_counter()
         title = content.get("title", "")
         abstract = content.get("abstract", "")
         text = content.get("text", "")
 
-        # Extract tags
-        tags = self.extract_tags(text, title, abstract)
-
-        # Categorize tags
-        categories = defaultdict(list)
+        # Group tags by category, keeping confidence order within each group
+        categories: Dict[str, List[Tag]] = {}
         for tag in tags:
-            categories[tag.category].append(tag)
+            group = categories.get(tag.category)
+            if group is None:
+                categories[tag.category] = [tag]
+            else:
+                group.append(tag)
 
         # Calculate overall confidence
         if tags:
@@ -614,27 +892,20 @@ class SmartTagger:
         else:
             confidence_score = 0.0
 
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = extract_time + time.perf_counter() - start_time
         method_used = "NLTK-enhanced" if NLTK_AVAILABLE else "basic"
 
-        # Store in database
-        self._store_paper_tags(paper_id, tags)
-
         result = TaggingResult(
             paper_id=paper_id,
             tags=tags,
-            categories=dict(categories),
+            categories=categories,
             confidence_score=confidence_score,
             processing_time=processing_time,
             method_used=method_used,
             metadata={
                 "total_tags": len(tags),
                 "categories_found": len(categories),
-                "top_category": (
-                    max(categories.keys(), key=lambda k: len(categories[k]))
-                    if categories
-                    else None
-                ),
+                "top_category": max(categories, key=lambda k: len(categories[k]), default=None),
                 "text_length": len(text),
                 "has_title": bool(title),
                 "has_abstract": bool(abstract),
@@ -648,50 +919,44 @@ class SmartTagger:
 
     def _store_paper_tags(self, paper_id: str, tags: List[Tag]) -> None:
         """Store paper tags in database."""
-        with sqlite3.connect(self.db_path) as conn:
-            for tag in tags:
-                # Insert or update tag
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO tags
-                    (term, category, confidence, frequency, contexts, related_terms, last_used)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        tag.term,
-                        tag.category,
-                        tag.confidence,
-                        tag.frequency,
-                        json.dumps(tag.contexts),
-                        json.dumps(tag.related_terms),
-                        datetime.now(),
-                    ),
-                )
-
-                # Get tag ID
-                tag_id = conn.execute(
-                    "SELECT id FROM tags WHERE term = ? AND category = ?",
-                    (tag.term, tag.category),
-                ).fetchone()[0]
+        self._store_paper_tags_bulk([(paper_id, tags)])
+
+    def _store_paper_tags_bulk(self, papers: List[Tuple[str, List[Tag]]]) -> None:
+        """Store the tags of several papers in one transaction."""
+        now = datetime.now()
+        tag_rows = [
+            (
+                tag.term,
+                tag.category,
+                tag.confidence,
+                tag.frequency,
+                _json_list(tag.contexts),
+                _json_list(tag.related_terms),
+                now,
+            )
+            for _, tags in papers
+            for tag in tags
+        ]
+        link_rows = [
+            (
+                paper_id,
+                tag.confidence,
+                f"Auto-tagged with {tag.frequency} occurrences",
+                tag.term,
+                tag.category,
+            )
+            for paper_id, tags in papers
+            for tag in tags
+        ]
 
-                # Link to paper
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO paper_tags
-                    (paper_id, tag_id, confidence, context)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (
-                        paper_id,
-                        tag_id,
-                        tag.confidence,
-                        f"Auto-tagged with {tag.frequency} occurrences",
-                    ),
-                )
+        # Both batches commit together; the upsert keeps existing tag ids
+        with self._connection() as conn:
+            conn.executemany(_SQL_UPSERT_TAG, tag_rows)
+            conn.executemany(_SQL_LINK_PAPER_TAG, link_rows)
 
     def get_paper_tags(self, paper_id: str) -> List[Tag]:
         """Retrieve tags for a specific paper."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             results = conn.execute(
                 """
                 SELECT t.term, t.category, pt.confidence, t.frequency,
@@ -728,25 +993,25 @@ class SmartTagger:
         self, limit: int = 20, days: int = 30
     ) -> List[Tuple[str, int, float]]:
         """Get trending tags based on recent usage."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             results = conn.execute(
                 """
                 SELECT t.term, COUNT(pt.id) as usage_count, AVG(pt.confidence) as avg_confidence
                 FROM tags t
                 JOIN paper_tags pt ON t.id = pt.tag_id
-                WHERE pt.created_at >= datetime('now', '-{} days')
+                WHERE pt.created_at >= datetime('now', ?)
                 GROUP BY t.term
                 ORDER BY usage_count DESC, avg_confidence DESC
                 LIMIT ?
-            """.format(days),
-                (limit,),
+            """,
+                (f"-{days} days", limit),
             ).fetchall()
 
             return [(row[0], row[1], row[2]) for row in results]
 
     def suggest_related_tags(self, tag_term: str, limit: int = 10) -> List[str]:
         """Suggest related tags based on co-occurrence."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             # Find papers that contain the given tag
             paper_ids = conn.execute(
                 """
@@ -784,7 +1049,7 @@ class SmartTagger:
     def export_tags(self, output_path: str, format: str = "json") -> bool:
         """Export tags to file."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 # Get all tags with statistics
                 results = conn.execute(
                     """
@@ -838,14 +1103,32 @@ class SmartTagger:
             return False
 
 
+# Per-process tagger used by tag_papers workers
+_worker_tagger: Optional[SmartTagger] = None
+
+
+def _extract_tags_in_worker(text: str, title: str, abstract: str) -> Tuple[List[Tag], float]:
+    """Extract tags in a worker process, reusing one tagger per process."""
+    global _worker_tagger
+    if _worker_tagger is None:
+        _worker_tagger = SmartTagger._extraction_only()
+    return _worker_tagger._timed_extract_tags(text, title, abstract)
+
+
 # Convenience functions
 def create_smart_tagger(cache_dir: Optional[str] = None) -> SmartTagger:
     """Create a configured SmartTagger instance."""
     return SmartTagger(cache_dir=cache_dir)
 
 
+# Global tagger instance for quick_tag_extraction
+_default_tagger = None
+
+
 def quick_tag_extraction(text: str, max_tags: int = 10) -> List[str]:
     """Quick tag extraction for simple use cases."""
-    tagger = SmartTagger()
-    tags = tagger.extract_tags(text)
+    global _default_tagger
+    if _default_tagger is None:
+        _default_tagger = SmartTagger()
+    tags = _default_tagger.extract_tags(text)
     return [tag.term for tag in tags[:max_tags]]
@@ -6,19 +6,157 @@ This module provides trending analysis and popularity tracking capabilities
 for research papers, including download metrics, citation trends, and topic analysis.
 """
 
+import csv
+import heapq
+import itertools
 import json
+import re
 import sqlite3
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime, timedelta
 import math
 import statistics
+from operator import attrgetter
+
+# Optional NumPy for scoring large ingestion batches in one vectorized pass
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Below this many rows the per-array NumPy overhead outweighs the scalar loop
+VECTORIZE_MIN_BATCH = 64
+
+# Top-N query results kept per window until the next metrics or keyword write
+QUERY_CACHE_SIZE = 32
+
+# Threads running the independent branches of generate_trending_report
+REPORT_WORKERS = 2
+
+# Keyword trend multipliers for high-impact topics; earlier groups take
+# precedence when a keyword mentions terms from several
+_IMPACT_GROUPS = (
+    (("neural", "ai", "machine learning", "deep learning"), 1.5),
+    (("quantum", "blockchain", "transformer"), 1.3),
+    (("covid", "climate", "sustainability"), 1.4),
+)
+_IMPACT_RANK = {
+    term: (rank, mult)
+    for rank, (terms, mult) in enumerate(_IMPACT_GROUPS)
+    for term in terms
+}
+# Whole-word matches only, so "ai" does not fire on "chain" or "training"
+_IMPACT_PATTERN = re.compile(
+    r"\b(?:" + "|".join(sorted(map(re.escape, _IMPACT_RANK), key=len, reverse=True)) + r")\b"
+)
+
+# paper_metrics and keyword_trends store dates as proleptic Gregorian day
+# numbers (date.toordinal()), so range filters compare integers not strings
+_DAY_NUMBER_TABLES = ("paper_metrics", "keyword_trends")
+
+# Day number of a legacy ISO date or datetime string; julianday() of
+# 0001-01-01 is 1721425.5 and that date's ordinal is 1
+_SQL_ISO_TO_DAY_NUMBER = "CAST(julianday(substr(date, 1, 10)) - 1721424.5 AS INTEGER)"
+
+# Score history for several papers at once; the ids are bound as one JSON
+# array so the statement text stays the same for any number of papers
+_SQL_SCORE_HISTORY_FOR_PAPERS = """
+    SELECT arxiv_id, trend_score FROM paper_metrics
+    WHERE arxiv_id IN (SELECT value FROM json_each(?))
+      AND date >= ? AND date <= ?
+    ORDER BY arxiv_id, date
+"""
+
+_SQL_UPSERT_METRICS = """
+    INSERT OR REPLACE INTO paper_metrics
+    (arxiv_id, date, download_count, citation_count, view_count,
+     social_mentions, trend_score)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Same-day observations of a keyword update its row in place and accumulate;
+# keyword_trend_score is _calculate_keyword_trend_score registered in _connect
+_SQL_UPSERT_KEYWORD = """
+    INSERT INTO keyword_trends
+    (keyword, date, frequency, papers_count, trend_score, related_terms, categories)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(keyword, date) DO UPDATE SET
+        frequency = frequency + excluded.frequency,
+        papers_count = papers_count + excluded.papers_count,
+        trend_score = keyword_trend_score(keyword, frequency + excluded.frequency),
+        related_terms = excluded.related_terms,
+        categories = excluded.categories
+"""
+
+# One pass per report: aggregate the window, split it at the midpoint for
+# velocity, and rank every paper on the first and last day for rank change
+_SQL_TRENDING_KEYWORDS = """
+    SELECT
+        keyword,
+        SUM(frequency) as total_frequency,
+        COUNT(DISTINCT date) as appearances,
+        AVG(trend_score) as avg_score,
+        related_terms,
+        categories
+    FROM keyword_trends
+    WHERE date >= :start AND date <= :end
+    GROUP BY keyword
+    HAVING total_frequency > 5
+    ORDER BY avg_score DESC, total_frequency DESC
+    LIMIT :limit
+"""
+
+_SQL_TRENDING_PAPERS = """
+    WITH agg AS (
+        SELECT arxiv_id,
+               AVG(trend_score) AS avg_score,
+               MAX(download_count) AS max_downloads,
+               MAX(citation_count) AS max_citations,
+               MAX(view_count) AS max_views,
+               MAX(social_mentions) AS max_social,
+               AVG(trend_score) FILTER (WHERE date < :mid) AS first_half,
+               AVG(trend_score) FILTER (WHERE date >= :mid) AS second_half
+        FROM paper_metrics
+        WHERE date >= :start AND date <= :end
+        GROUP BY arxiv_id
+        HAVING AVG(trend_score) > 0
+        ORDER BY avg_score DESC
+        LIMIT :limit
+    ),
+    ranked AS MATERIALIZED (
+        SELECT arxiv_id, date,
+               RANK() OVER (PARTITION BY date ORDER BY trend_score DESC) AS rank
+        FROM paper_metrics
+        WHERE date IN (:start, :end)
+    )
+    SELECT agg.arxiv_id, agg.avg_score, agg.max_downloads, agg.max_citations,
+           agg.max_views, agg.max_social, agg.first_half, agg.second_half,
+           cur.rank, prev.rank
+    FROM agg
+    LEFT JOIN ranked cur ON cur.arxiv_id = agg.arxiv_id AND cur.date = :end
+    LEFT JOIN ranked prev ON prev.arxiv_id = agg.arxiv_id AND prev.date = :start
+    ORDER BY agg.avg_score DESC
+"""
+
 
 @dataclass
 class TrendingPaper:
@@ -120,19 +258,151 @@ class TrendingAnalyzer:
             self.db_path = self.cache_dir / "trending.db"
 
         self.cache_dir.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        # (sql, window params) -> (data version, limit, rows); see _query_top
+        self._query_cache: "OrderedDict[Tuple[str, tuple], Tuple[int, int, list]]" = (
+            OrderedDict()
+        )
+        self._data_version = 0
+        # PRAGMA data_version of self._conn when the cache was last validated;
+        # it changes whenever another connection commits to the database
+        self._external_version: Optional[int] = None
+        # Read-only connection per thread for the top-N queries; WAL lets
+        # them run alongside each other and the writer
+        self._readers = threading.local()
+        self._reader_conns: List[sqlite3.Connection] = []
+        self._report_pool: Optional[ThreadPoolExecutor] = None
+        # TREND_WEIGHTS flattened once, so scoring skips five dict lookups per call
+        self._score_weights = tuple(
+            self.TREND_WEIGHTS[name]
+            for name in ("downloads", "citations", "views", "social", "recency")
+        )
         self._init_database()
 
         logger.info(f"TrendingAnalyzer initialized with cache: {self.cache_dir}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection used by every method."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        # Only takes effect while the file is still empty, i.e. for new databases
+        conn.execute("PRAGMA page_size=8192")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Report generation makes several passes over the metric indexes
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.create_function(
+            "keyword_trend_score", 2, self._calculate_keyword_trend_score, deterministic=True
+        )
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Serialize access to the shared connection; commits on success."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def _read_connection(self) -> sqlite3.Connection:
+        """Return this thread's read-only connection, opening it on first use."""
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            conn.execute("PRAGMA query_only=1")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            self._readers.conn = conn
+            with self._lock:
+                self._reader_conns.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close the trending database connections and report workers."""
+        if self._report_pool is not None:
+            self._report_pool.shutdown(wait=True)
+            self._report_pool = None
+        with self._lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns.clear()
+            self._conn.close()
+
+    def _invalidate_queries(self) -> None:
+        """Drop cached query results; call with the lock held after a write."""
+        self._data_version += 1
+        self._query_cache.clear()
+
+    def _check_external_writes(self) -> None:
+        """Invalidate the cache if another connection committed; call with the lock held."""
+        external_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if external_version != self._external_version:
+            self._external_version = external_version
+            self._invalidate_queries()
+
+    def _query_top(self, sql: str, params: Dict[str, Any], limit: int) -> list:
+        """
+        Run a ``LIMIT :limit`` query, reusing cached rows for the same window.
+
+        A cached result fetched with a larger limit (or one that returned every
+        row) also answers smaller limits, since those are its prefix. Writes
+        by this instance or any other connection invalidate the cache.
+        """
+        key = (sql, tuple(sorted(params.items())))
+        with self._lock:
+            self._check_external_writes()
+            version = self._data_version
+            entry = self._query_cache.get(key)
+            if entry is not None:
+                _, cached_limit, rows = entry
+                if cached_limit >= limit or len(rows) < cached_limit:
+                    self._query_cache.move_to_end(key)
+                    return rows[:limit]
+
+        rows = self._read_connection().execute(sql, {**params, "limit": limit}).fetchall()
+
+        with self._lock:
+            # Skip storing if a write landed while the query ran
+            if version == self._data_version:
+                self._query_cache[key] = (version, limit, rows)
+                self._query_cache.move_to_end(key)
+                if len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return rows
+
     def _init_database(self) -> None:
         """Initialize SQLite database for trending data."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
+            # WAL persists in the database file, so it only needs setting once
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            # Schema setup and the date migration below commit or roll back together
+            conn.execute("BEGIN")
+
+            # Metric and keyword dates used to be ISO TEXT; move tables still
+            # declared that way aside and copy them into the INTEGER schema
+            legacy_tables = [
+                table
+                for table in _DAY_NUMBER_TABLES
+                if any(
+                    column[1] == "date" and column[2].upper() == "DATE"
+                    for column in conn.execute(f"PRAGMA table_info({table})")
+                )
+            ]
+            for table in legacy_tables:
+                conn.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+
             # Paper metrics table
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS paper_metrics (
                     arxiv_id TEXT,
-                    date DATE,
+                    date INTEGER,
                     download_count INTEGER DEFAULT 0,
                     citation_count INTEGER DEFAULT 0,
                     view_count INTEGER DEFAULT 0,
@@ -165,7 +435,7 @@ class TrendingAnalyzer:
                 """
                 CREATE TABLE IF NOT EXISTS keyword_trends (
                     keyword TEXT,
-                    date DATE,
+                    date INTEGER,
                     frequency INTEGER DEFAULT 0,
                     papers_count INTEGER DEFAULT 0,
                     trend_score REAL DEFAULT 0.0,
@@ -189,55 +459,117 @@ class TrendingAnalyzer:
             """
             )
 
-            # Create indexes
+            # Dropping the legacy tables also drops their indexes, so this has
+            # to happen before the indexes below are (re)created
+            for table in legacy_tables:
+                columns = [
+                    column[1] for column in conn.execute(f"PRAGMA table_info({table})")
+                ]
+                select = ", ".join(
+                    _SQL_ISO_TO_DAY_NUMBER if column == "date" else column
+                    for column in columns
+                )
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                    f"SELECT {select} FROM {table}_legacy "
+                    f"WHERE {_SQL_ISO_TO_DAY_NUMBER} IS NOT NULL"
+                )
+                conn.execute(f"DROP TABLE {table}_legacy")
+                logger.info(f"Migrated {table} dates to day numbers")
+
+            # Create indexes. The covering indexes answer the date-range
+            # aggregates and per-day rankings without touching the tables;
+            # they replace the old single-column date and score indexes.
+            has_cover = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+                ("idx_metrics_date_score_cover",),
+            ).fetchone()
+            conn.execute("DROP INDEX IF EXISTS idx_metrics_date")
+            conn.execute("DROP INDEX IF EXISTS idx_metrics_score")
+            conn.execute("DROP INDEX IF EXISTS idx_keyword_date")
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_metrics_date ON paper_metrics(date)"
+                """
+                CREATE INDEX IF NOT EXISTS idx_metrics_date_score_cover
+                ON paper_metrics(date, trend_score DESC, arxiv_id, download_count,
+                                 citation_count, view_count, social_mentions)
+            """
             )
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_metrics_score ON paper_metrics(trend_score)"
+                """
+                CREATE INDEX IF NOT EXISTS idx_keyword_date_cover
+                ON keyword_trends(date, keyword, frequency, trend_score,
+                                  related_terms, categories)
+            """
             )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_category_date ON category_trends(date)"
             )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_keyword_date ON keyword_trends(date)"
-            )
+
+            # Give the planner statistics for the new indexes once
+            if not has_cover:
+                conn.execute("ANALYZE")
 
     def record_paper_metrics(
         self, arxiv_id: str, metrics: Dict[str, int], date: datetime = None
     ) -> None:
         """Record metrics for a paper."""
-        if date is None:
-            date = datetime.now().date()
+        self.record_paper_metrics_bulk([(arxiv_id, metrics, date)])
 
-        download_count = metrics.get("downloads", 0)
-        citation_count = metrics.get("citations", 0)
-        view_count = metrics.get("views", 0)
-        social_mentions = metrics.get("social", 0)
+    def record_paper_metrics_bulk(
+        self, entries: Iterable[Tuple[str, Dict[str, int], Optional[datetime]]]
+    ) -> int:
+        """
+        Record metrics for many papers in a single transaction.
 
-        # Calculate trend score
-        trend_score = self._calculate_trend_score(metrics, date)
+        Args:
+            entries: ``(arxiv_id, metrics, date)`` tuples as accepted by
+                ``record_paper_metrics``; a None date means today
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO paper_metrics
-                (arxiv_id, date, download_count, citation_count, view_count,
-                 social_mentions, trend_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    arxiv_id,
-                    date.isoformat(),
-                    download_count,
-                    citation_count,
-                    view_count,
-                    social_mentions,
-                    trend_score,
-                ),
+        Returns:
+            Number of rows written
+        """
+        today = datetime.now().date()
+        entries = [
+            (arxiv_id, metrics, today if date is None else date)
+            for arxiv_id, metrics, date in entries
+        ]
+        counts = [
+            (
+                metrics.get("downloads", 0),
+                metrics.get("citations", 0),
+                metrics.get("views", 0),
+                metrics.get("social", 0),
             )
+            for _, metrics, _ in entries
+        ]
 
-        logger.debug(f"Recorded metrics for {arxiv_id}: score {trend_score:.2f}")
+        if NUMPY_AVAILABLE and len(entries) >= VECTORIZE_MIN_BATCH:
+            # fromiter over flat scalars avoids NumPy's slow nested-sequence path
+            n = len(entries)
+            metrics_array = np.fromiter(
+                itertools.chain.from_iterable(counts), np.float64, count=4 * n
+            ).reshape(n, 4)
+            ordinals = np.fromiter(
+                (date.toordinal() for _, _, date in entries), np.int64, count=n
+            )
+            raw_scores = self._calculate_trend_scores_batch(metrics_array, ordinals)
+            scores = [round(score, 3) for score in raw_scores.tolist()]
+        else:
+            scores = [
+                self._calculate_trend_score(metrics, date) for _, metrics, date in entries
+            ]
+
+        rows = [
+            (arxiv_id, date.toordinal(), *paper_counts, score)
+            for (arxiv_id, _, date), paper_counts, score in zip(entries, counts, scores)
+        ]
+
+        with self._connection() as conn:
+            conn.executemany(_SQL_UPSERT_METRICS, rows)
+            self._invalidate_queries()
+
+        logger.debug(f"Recorded metrics for {len(rows)} papers")
+        return len(rows)
 
     def _calculate_trend_score(self, metrics: Dict[str, int], date: datetime) -> float:
         """Calculate trending score for a paper."""
@@ -254,16 +586,40 @@ class TrendingAnalyzer:
         recency = max(0, 1 - (days_old / 30))
 
         # Weighted score
+        w_downloads, w_citations, w_views, w_social, w_recency = self._score_weights
         score = (
-            downloads * self.TREND_WEIGHTS["downloads"]
-            + citations * self.TREND_WEIGHTS["citations"]
-            + views * self.TREND_WEIGHTS["views"]
-            + social * self.TREND_WEIGHTS["social"]
-            + recency * self.TREND_WEIGHTS["recency"]
+            downloads * w_downloads
+            + citations * w_citations
+            + views * w_views
+            + social * w_social
+            + recency * w_recency
         )
 
         return round(score, 3)
 
+    def _calculate_trend_scores_batch(
+        self, metrics_array: "np.ndarray", dates: "np.ndarray"
+    ) -> "np.ndarray":
+        """
+        Vectorized ``_calculate_trend_score`` for many papers at once.
+
+        Args:
+            metrics_array: ``(N, 4)`` float64 array of downloads, citations,
+                views and social mentions; overwritten with their log1p
+            dates: ``(N,)`` int64 array of metric dates as proleptic
+                Gregorian ordinals (``date.toordinal()``)
+
+        Returns:
+            ``(N,)`` array of unrounded trend scores
+        """
+        weights = np.array(self._score_weights[:4])
+        np.log1p(metrics_array, out=metrics_array)
+
+        days_old = datetime.now().date().toordinal() - dates
+        recency = np.clip(1 - days_old / 30, 0, None)
+
+        return metrics_array @ weights + recency * self._score_weights[4]
+
     def get_trending_papers(
         self, limit: int = 20, days: int = 7, category: str = None
     ) -> List[TrendingPaper]:
@@ -271,128 +627,56 @@ class TrendingAnalyzer:
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=days)
 
-        with sqlite3.connect(self.db_path) as conn:
-            # Base query for trending papers
-            query = """
-                SELECT
-                    pm.arxiv_id,
-                    AVG(pm.trend_score) as avg_score,
-                    MAX(pm.download_count) as max_downloads,
-                    MAX(pm.citation_count) as max_citations,
-                    MAX(pm.view_count) as max_views,
-                    MAX(pm.social_mentions) as max_social
-                FROM paper_metrics pm
-                WHERE pm.date >= ? AND pm.date <= ?
-            """
-            params = [start_date.isoformat(), end_date.isoformat()]
-
-            # Add category filter if specified
-            if category:
-                # This would require joining with a papers table that has category info
-                # For now, we'll proceed without category filtering
-                pass
-
-            query += """
-                GROUP BY pm.arxiv_id
-                HAVING AVG(pm.trend_score) > 0
-                ORDER BY avg_score DESC
-                LIMIT ?
-            """
-            params.append(limit)
-
-            results = conn.execute(query, params).fetchall()
-
-            trending_papers = []
-            for i, result in enumerate(results):
-                arxiv_id = result[0]
-                avg_score = result[1]
-
-                # Calculate velocity (rate of change)
-                velocity = self._calculate_velocity(arxiv_id, days)
-
-                # Get rank change
-                rank_change = self._calculate_rank_change(arxiv_id, days)
-
-                # Create trending paper (mock data for missing fields)
-                trending_paper = TrendingPaper(
-                    arxiv_id=arxiv_id,
-                    title=f"Paper {arxiv_id}",  # Would fetch from papers table
-                    authors=[],  # Would fetch from papers table
-                    categories=[],  # Would fetch from papers table
-                    submitted_date=datetime.now() - timedelta(days=30),  # Mock
-                    trend_score=avg_score,
-                    download_count=result[2],
-                    citation_count=result[3],
-                    view_count=result[4],
-                    social_mentions=result[5],
-                    velocity=velocity,
-                    rank_change=rank_change,
-                )
-                trending_papers.append(trending_paper)
-
-            return trending_papers
-
-    def _calculate_velocity(self, arxiv_id: str, days: int) -> float:
-        """Calculate the rate of change in trending score."""
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=days)
         mid_date = start_date + timedelta(days=days // 2)
 
-        with sqlite3.connect(self.db_path) as conn:
-            # Get average scores for first and second half of period
-            first_half = conn.execute(
-                """
-                SELECT AVG(trend_score) FROM paper_metrics
-                WHERE arxiv_id = ? AND date >= ? AND date < ?
-            """,
-                (arxiv_id, start_date.isoformat(), mid_date.isoformat()),
-            ).fetchone()[0]
-
-            second_half = conn.execute(
-                """
-                SELECT AVG(trend_score) FROM paper_metrics
-                WHERE arxiv_id = ? AND date >= ? AND date <= ?
-            """,
-                (arxiv_id, mid_date.isoformat(), end_date.isoformat()),
-            ).fetchone()[0]
-
+        # Category filtering would require joining with a papers table that
+        # has category info; for now we proceed without it
+        params = {
+            "start": start_date.toordinal(),
+            "mid": mid_date.toordinal(),
+            "end": end_date.toordinal(),
+        }
+        results = self._query_top(_SQL_TRENDING_PAPERS, params, limit)
+
+        trending_papers = []
+        for (
+            arxiv_id,
+            avg_score,
+            max_downloads,
+            max_citations,
+            max_views,
+            max_social,
+            first_half,
+            second_half,
+            current_rank,
+            previous_rank,
+        ) in results:
+            # Rate of change between the two halves of the period
+            velocity = 0.0
             if first_half and second_half and first_half > 0:
-                velocity = (second_half - first_half) / first_half
-                return round(velocity, 3)
-
-            return 0.0
-
-    def _calculate_rank_change(self, arxiv_id: str, days: int) -> int:
-        """Calculate change in ranking position."""
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=days)
-
-        with sqlite3.connect(self.db_path) as conn:
-            # Get ranks for different periods
-            # This is a simplified calculation
-            current_rank = conn.execute(
-                """
-                SELECT COUNT(*) + 1 FROM paper_metrics pm1
-                WHERE pm1.date = ? AND pm1.trend_score > (
-                    SELECT trend_score FROM paper_metrics pm2
-                    WHERE pm2.arxiv_id = ? AND pm2.date = ?
-                )
-            """,
-                (end_date.isoformat(), arxiv_id, end_date.isoformat()),
-            ).fetchone()[0]
-
-            previous_rank = conn.execute(
-                """
-                SELECT COUNT(*) + 1 FROM paper_metrics pm1
-                WHERE pm1.date = ? AND pm1.trend_score > (
-                    SELECT trend_score FROM paper_metrics pm2
-                    WHERE pm2.arxiv_id = ? AND pm2.date = ?
-                )
-            """,
-                (start_date.isoformat(), arxiv_id, start_date.isoformat()),
-            ).fetchone()[0]
+                velocity = round((second_half - first_half) / first_half, 3)
+
+            # A paper with no metrics on a boundary day counts as ranked first
+            rank_change = (previous_rank or 1) - (current_rank or 1)
+
+            # Create trending paper (mock data for missing fields)
+            trending_paper = TrendingPaper(
+                arxiv_id=arxiv_id,
+                title=f"Paper {arxiv_id}",  # Would fetch from papers table
+                authors=[],  # Would fetch from papers table
+                categories=[],  # Would fetch from papers table
+                submitted_date=datetime.now() - timedelta(days=30),  # Mock
+                trend_score=avg_score,
+                download_count=max_downloads,
+                citation_count=max_citations,
+                view_count=max_views,
+                social_mentions=max_social,
+                velocity=velocity,
+                rank_change=rank_change,
+            )
+            trending_papers.append(trending_paper)
 
-            return previous_rank - current_rank
+        return trending_papers
 
     def analyze_category_trends(self, days: int = 30) -> List[TrendingCategory]:
         """Analyze trending categories."""
@@ -440,46 +724,32 @@ class TrendingAnalyzer:
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=days)
 
-        with sqlite3.connect(self.db_path) as conn:
-            results = conn.execute(
-                """
-                SELECT
-                    keyword,
-                    SUM(frequency) as total_frequency,
-                    COUNT(DISTINCT date) as appearances,
-                    AVG(trend_score) as avg_score,
-                    related_terms,
-                    categories
-                FROM keyword_trends
-                WHERE date >= ? AND date <= ?
-                GROUP BY keyword
-                HAVING total_frequency > 5
-                ORDER BY avg_score DESC, total_frequency DESC
-                LIMIT ?
-            """,
-                (start_date.isoformat(), end_date.isoformat(), limit),
-            ).fetchall()
+        results = self._query_top(
+            _SQL_TRENDING_KEYWORDS,
+            {"start": start_date.toordinal(), "end": end_date.toordinal()},
+            limit,
+        )
 
-            trending_keywords = []
-            for result in results:
-                keyword = result[0]
-                frequency = result[1]
-                papers_count = result[2]  # Approximation
-                trend_score = result[3] or 0.0
-                related_terms = json.loads(result[4]) if result[4] else []
-                categories = json.loads(result[5]) if result[5] else []
-
-                trending_keyword = TrendingKeyword(
-                    keyword=keyword,
-                    frequency=frequency,
-                    papers_count=papers_count,
-                    trend_score=trend_score,
-                    related_terms=related_terms,
-                    categories=categories,
-                )
-                trending_keywords.append(trending_keyword)
+        trending_keywords = []
+        for result in results:
+            keyword = result[0]
+            frequency = result[1]
+            papers_count = result[2]  # Approximation
+            trend_score = result[3] or 0.0
+            related_terms = json.loads(result[4]) if result[4] else []
+            categories = json.loads(result[5]) if result[5] else []
+
+            trending_keyword = TrendingKeyword(
+                keyword=keyword,
+                frequency=frequency,
+                papers_count=papers_count,
+                trend_score=trend_score,
+                related_terms=related_terms,
+                categories=categories,
+            )
+            trending_keywords.append(trending_keyword)
 
-            return trending_keywords
+        return trending_keywords
 
     def record_keyword_trend(
         self,
@@ -490,32 +760,47 @@ class TrendingAnalyzer:
         date: datetime = None,
     ) -> None:
         """Record keyword trend data."""
-        if date is None:
-            date = datetime.now().date()
+        self.record_keyword_trend_bulk([(keyword, frequency, related_terms, categories, date)])
 
-        related_terms = related_terms or []
-        categories = categories or []
+    def record_keyword_trend_bulk(
+        self,
+        items: Iterable[
+            Tuple[str, int, Optional[List[str]], Optional[List[str]], Optional[datetime]]
+        ],
+    ) -> int:
+        """
+        Record many keyword observations in a single transaction.
 
-        # Calculate trend score for keyword
-        trend_score = self._calculate_keyword_trend_score(keyword, frequency)
+        Observations of a keyword on a day it already has a row for add to
+        that row's frequency, and its trend score is recomputed from the total.
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO keyword_trends
-                (keyword, date, frequency, papers_count, trend_score, related_terms, categories)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    keyword,
-                    date.isoformat(),
-                    frequency,
-                    frequency,  # Using frequency as papers count approximation
-                    trend_score,
-                    json.dumps(related_terms),
-                    json.dumps(categories),
-                ),
+        Args:
+            items: ``(keyword, frequency, related_terms, categories, date)``
+                tuples as accepted by ``record_keyword_trend``; a None date
+                means today
+
+        Returns:
+            Number of observations written
+        """
+        today = datetime.now().date()
+        rows = [
+            (
+                keyword,
+                (today if date is None else date).toordinal(),
+                frequency,
+                frequency,  # Using frequency as papers count approximation
+                self._calculate_keyword_trend_score(keyword, frequency),
+                json.dumps(related_terms or []),
+                json.dumps(categories or []),
             )
+            for keyword, frequency, related_terms, categories, date in items
+        ]
+
+        with self._connection() as conn:
+            conn.executemany(_SQL_UPSERT_KEYWORD, rows)
+            self._invalidate_queries()
+
+        return len(rows)
 
     def _calculate_keyword_trend_score(self, keyword: str, frequency: int) -> float:
         """Calculate trend score for a keyword."""
@@ -523,17 +808,10 @@ class TrendingAnalyzer:
         base_score = math.log1p(frequency) / 10
 
         # Bonus for certain high-impact keywords
-        impact_keywords = {
-            "neural,ai,machine learning,deep learning": 1.5,
-            "quantum,blockchain,transformer": 1.3,
-            "covid,climate,sustainability": 1.4,
-        }
-
         multiplier = 1.0
-        for keywords, mult in impact_keywords.items():
-            if any(kw in keyword.lower() for kw in keywords.split(", ")):
-                multiplier = mult
-                break
+        matches = _IMPACT_PATTERN.findall(keyword.lower())
+        if matches:
+            multiplier = min(_IMPACT_RANK[term] for term in matches)[1]
 
         return round(base_score * multiplier, 3)
 
@@ -547,18 +825,21 @@ class TrendingAnalyzer:
             return []
 
         # Calculate average trend score
-        avg_score = statistics.mean(paper.trend_score for paper in trending_papers)
+        avg_score = statistics.fmean(paper.trend_score for paper in trending_papers)
         threshold = avg_score * threshold_multiplier
 
-        # Filter viral papers
+        # Filter viral papers; the list comes ordered by trend score, so
+        # scanning stops at the first paper at or below the threshold
         viral_papers = [
             paper
-            for paper in trending_papers
-            if paper.trend_score > threshold and paper.velocity > 0.5
+            for paper in itertools.takewhile(
+                lambda paper: paper.trend_score > threshold, trending_papers
+            )
+            if paper.velocity > 0.5
         ]
 
-        # Sort by trend score and velocity
-        viral_papers.sort(key=lambda x: (x.trend_score, x.velocity), reverse=True)
+        # Sort by trend score and velocity (only score ties move)
+        viral_papers.sort(key=attrgetter("trend_score", "velocity"), reverse=True)
 
         logger.info(
             f"Identified {len(viral_papers)} viral papers (threshold: {threshold:.2f})"
@@ -569,17 +850,12 @@ class TrendingAnalyzer:
         self, days: int = 30, growth_threshold: float = 2.0
     ) -> List[str]:
         """Detect emerging topics based on keyword growth."""
-        current_keywords = self.analyze_keyword_trends(limit=50, days=days // 2)
-        past_keywords = self.analyze_keyword_trends(limit=50, days=days)
-
-        # Create frequency maps
-        current_freq = {kw.keyword: kw.frequency for kw in current_keywords}
-        past_freq = {kw.keyword: kw.frequency for kw in past_keywords}
+        current_freq = self._keyword_frequencies(limit=50, days=days // 2)
+        past_freq = self._keyword_frequencies(limit=50, days=days)
 
         emerging_topics = []
 
-        for keyword in current_freq:
-            current_count = current_freq[keyword]
+        for keyword, current_count in current_freq.items():
             past_count = past_freq.get(keyword, 0)
 
             # Calculate growth rate
@@ -592,14 +868,35 @@ class TrendingAnalyzer:
             if growth_rate >= growth_threshold and current_count >= 5:
                 emerging_topics.append(keyword)
 
-        # Sort by current frequency
-        emerging_topics.sort(key=lambda x: current_freq[x], reverse=True)
-
         logger.info(f"Detected {len(emerging_topics)} emerging topics")
-        return emerging_topics[:10]  # Return top 10
+        # Top 10 by current frequency; a bounded heap instead of a full sort
+        return heapq.nlargest(10, emerging_topics, key=current_freq.__getitem__)
+
+    def _keyword_frequencies(self, limit: int, days: int) -> Dict[str, int]:
+        """Top keyword frequencies, read from the rows behind analyze_keyword_trends."""
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=days)
+        rows = self._query_top(
+            _SQL_TRENDING_KEYWORDS,
+            {"start": start_date.toordinal(), "end": end_date.toordinal()},
+            limit,
+        )
+        return {row[0]: row[1] for row in rows}
 
     def generate_trending_report(self, days: int = 7) -> TrendingStats:
         """Generate a comprehensive trending analysis report."""
+        # Viral papers and emerging topics run first, side by side on their
+        # own read connections: they fetch the widest top-N lists, which the
+        # smaller queries below then reuse from cache
+        if self._report_pool is None:
+            self._report_pool = ThreadPoolExecutor(
+                max_workers=REPORT_WORKERS, thread_name_prefix="trending-report"
+            )
+        viral_future = self._report_pool.submit(self.identify_viral_papers, days=days)
+        emerging_future = self._report_pool.submit(self.detect_emerging_topics, days=days)
+        viral_papers = viral_future.result()
+        emerging_topics = emerging_future.result()
+
         # Get trending papers
         trending_papers = self.get_trending_papers(limit=20, days=days)
         total_papers = len(trending_papers)
@@ -618,12 +915,6 @@ class TrendingAnalyzer:
         # Get trending keywords
         top_keywords = self.analyze_keyword_trends(limit=15, days=days)
 
-        # Identify viral papers
-        viral_papers = self.identify_viral_papers(days=days)
-
-        # Detect emerging topics
-        emerging_topics = self.detect_emerging_topics(days=days)
-
         return TrendingStats(
             total_papers_analyzed=total_papers,
             trending_threshold=trending_threshold,
@@ -640,7 +931,7 @@ class TrendingAnalyzer:
         if date is None:
             date = datetime.now().date()
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO trending_snapshots (date, snapshot_type, data, metadata)
@@ -661,34 +952,55 @@ class TrendingAnalyzer:
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=days)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             results = conn.execute(
                 """
                 SELECT date, trend_score FROM paper_metrics
                 WHERE arxiv_id = ? AND date >= ? AND date <= ?
                 ORDER BY date
             """,
-                (arxiv_id, start_date.isoformat(), end_date.isoformat()),
+                (arxiv_id, start_date.toordinal(), end_date.toordinal()),
             ).fetchall()
 
-            return [(datetime.fromisoformat(row[0]).date(), row[1]) for row in results]
+            return [(datetime.fromordinal(row[0]).date(), row[1]) for row in results]
 
     def compare_papers(
         self, arxiv_ids: List[str], days: int = 30
     ) -> Dict[str, Dict[str, float]]:
         """Compare trending metrics between papers."""
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=days)
+
+        with self._connection() as conn:
+            rows = conn.execute(
+                _SQL_SCORE_HISTORY_FOR_PAPERS,
+                (json.dumps(arxiv_ids), start_date.toordinal(), end_date.toordinal()),
+            ).fetchall()
+
+        history: Dict[str, List[float]] = {}
+        for arxiv_id, score in rows:
+            history.setdefault(arxiv_id, []).append(score)
+
         comparison = {}
 
         for arxiv_id in arxiv_ids:
-            trends = self.get_historical_trends(arxiv_id, days)
-
-            if trends:
-                scores = [score for _, score in trends]
+            scores = history.get(arxiv_id)
+
+            if scores:
+                # Float reductions; statistics.mean/stdev use exact fractions
+                # and are ~50x slower for no meaningful gain in precision
+                average = statistics.fmean(scores)
+                volatility = 0
+                if len(scores) > 1:
+                    volatility = math.sqrt(
+                        math.fsum((score - average) ** 2 for score in scores)
+                        / (len(scores) - 1)
+                    )
                 comparison[arxiv_id] = {
-                    "average_score": statistics.mean(scores),
+                    "average_score": average,
                     "peak_score": max(scores),
                     "current_score": scores[-1] if scores else 0,
-                    "volatility": statistics.stdev(scores) if len(scores) > 1 else 0,
+                    "volatility": volatility,
                     "trend_direction": (
                         "up" if len(scores) > 1 and scores[-1] > scores[0] else "down"
                     ),
@@ -748,36 +1060,36 @@ class TrendingAnalyzer:
                     "emerging_topics": report.emerging_topics,
                 }
 
-                with open(output_file, "w") as f:
-                    json.dump(data, f, indent=2)
+                if ORJSON_AVAILABLE:
+                    output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(output_file, "w") as f:
+                        json.dump(data, f, indent=2)
 
             elif format == "csv":
-                import csv
-
-                # Export papers data as CSV
+                # Export categories then keywords, streamed straight to the writer
+                rows = itertools.chain(
+                    (
+                        (
+                            "Category",
+                            cat.category,
+                            cat.trend_score,
+                            cat.paper_count,
+                            cat.growth_rate,
+                        )
+                        for cat in report.top_categories
+                    ),
+                    (
+                        ("Keyword", kw.keyword, kw.trend_score, kw.frequency, "")
+                        for kw in report.top_keywords
+                    ),
+                )
                 with open(output_file, "w", newline="") as f:
                     writer = csv.writer(f)
                     writer.writerow(
                         ["Type", "Name", "Score", "Frequency", "Additional"]
                     )
-
-                    # Add categories
-                    for cat in report.top_categories:
-                        writer.writerow(
-                            [
-                                "Category",
-                                cat.category,
-                                cat.trend_score,
-                                cat.paper_count,
-                                cat.growth_rate,
-                            ]
-                        )
-
-                    # Add keywords
-                    for kw in report.top_keywords:
-                        writer.writerow(
-                            ["Keyword", kw.keyword, kw.trend_score, kw.frequency, ""]
-                        )
+                    writer.writerows(rows)
             else:
                 raise ValueError(f"Unsupported format: {format}")
 
@@ -789,6 +1101,18 @@ class TrendingAnalyzer:
             return False
 
 
+# Global trending analyzer instance
+_analyzer_instance = None
+
+
+def get_trending_analyzer() -> TrendingAnalyzer:
+    """Get the global trending analyzer instance."""
+    global _analyzer_instance
+    if _analyzer_instance is None:
+        _analyzer_instance = TrendingAnalyzer()
+    return _analyzer_instance
+
+
 # Convenience functions
 def create_trending_analyzer(cache_dir: Optional[str] = None) -> TrendingAnalyzer:
     """Create a configured TrendingAnalyzer instance."""
@@ -797,8 +1121,7 @@ def create_trending_analyzer(cache_dir: Optional[str] = None) -> TrendingAnalyze
 
 def quick_trending_check(arxiv_id: str, days: int = 7) -> float:
     """Quick trending score check for a paper."""
-    analyzer = TrendingAnalyzer()
-    trends = analyzer.get_historical_trends(arxiv_id, days)
+    trends = get_trending_analyzer().get_historical_trends(arxiv_id, days)
 
     if trends:
         return trends[-1][1]  # Return latest score
@@ -4,9 +4,24 @@ Downloads papers and converts them to both LaTeX and Markdown formats with organ
 """
 
 import asyncio
+import atexit
+import json
+import multiprocessing
+import os
+import pickle
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..core.pipeline import ArxivPipeline
 from ..core.config import PipelineConfig
 from .file_saver import FileSaver
@@ -15,6 +30,81 @@ from ..utils.logging import structured_logger
 
 logger = structured_logger()
 
+_SECTION_RE = re.compile(r"^#+ ", re.MULTILINE)
+_LATEX_CMD_RE = re.compile(r"\\[a-zA-Z]+")
+
+
+def _count_inline_math(text: str) -> int:
+    """Count non-empty ``$...$`` spans in one pass without building substrings."""
+    count = 0
+    start = text.find("$")
+    while start != -1:
+        end = text.find("$", start + 1)
+        if end == -1:
+            break
+        if end > start + 1:
+            count += 1
+            start = text.find("$", end + 1)
+        else:
+            # "$$" encloses nothing; the second "$" may open the next span
+            start = end
+    return count
+
+
+def _scan_subdirectories(path: Path) -> List[os.DirEntry]:
+    """List the subdirectories of ``path`` in a single readdir pass."""
+    with os.scandir(path) as entries:
+        return [entry for entry in entries if entry.is_dir()]
+
+
+# LaTeX -> Markdown conversion is CPU-bound pure Python, so it runs in a small
+# pool of worker processes shared by every converter instance. Workers are
+# spawned rather than forked: the server process runs background threads that
+# hold locks, and a forked child could inherit one mid-acquire.
+CONVERSION_WORKERS = min(4, os.cpu_count() or 1)
+
+_conversion_pool: Optional[ProcessPoolExecutor] = None
+_conversion_pool_lock = threading.Lock()
+
+
+def _get_conversion_pool() -> ProcessPoolExecutor:
+    """Return the shared conversion process pool, creating it on first use."""
+    global _conversion_pool
+    with _conversion_pool_lock:
+        if _conversion_pool is None:
+            _conversion_pool = ProcessPoolExecutor(
+                max_workers=CONVERSION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_shutdown_conversion_pool)
+        return _conversion_pool
+
+
+def _shutdown_conversion_pool() -> None:
+    """Stop the conversion workers, dropping conversions not yet started."""
+    global _conversion_pool
+    with _conversion_pool_lock:
+        pool, _conversion_pool = _conversion_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+        atexit.unregister(_shutdown_conversion_pool)
+
+
+def _convert_in_worker(
+    converter: LaTeXToMarkdownConverter, tex_bytes: bytes, arxiv_id: str
+) -> Dict[str, Any]:
+    """Run a pickled copy of the caller's converter in a worker process."""
+    return converter.convert_with_metadata_bytes(tex_bytes, arxiv_id)
+
+
+def _is_picklable(obj: Any) -> bool:
+    """Whether ``obj`` can be shipped to a worker process."""
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
 
 class UnifiedDownloadConverter:
     """Unified tool for downloading and converting ArXiv papers to multiple formats."""
@@ -28,6 +118,47 @@ class UnifiedDownloadConverter:
             f"Unified download converter initialized with output: {self.config.output_directory}"
         )
 
+    async def __aenter__(self) -> "UnifiedDownloadConverter":
+        """Share one keep-alive HTTP session across downloads until exit."""
+        self._open_session(self.config.max_downloads)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._close_session()
+
+    async def _convert_markdown(self, tex_bytes: bytes, arxiv_id: str) -> Dict[str, Any]:
+        """Convert with this instance's converter in the shared process pool.
+
+        The converter itself is pickled to the worker, so its configuration
+        travels with it. A converter that cannot be pickled (e.g. one patched
+        with mocks) runs in a thread instead.
+        """
+        if not _is_picklable(self.markdown_converter):
+            return await asyncio.to_thread(
+                self.markdown_converter.convert_with_metadata_bytes, tex_bytes, arxiv_id
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_conversion_pool(),
+            _convert_in_worker,
+            self.markdown_converter,
+            tex_bytes,
+            arxiv_id,
+        )
+
+    def _open_session(self, max_connections: int) -> bool:
+        """Give the downloader a shared session; False if it already has one."""
+        downloader = self.pipeline.downloader
+        if downloader.session is not None and not downloader.session.closed:
+            return False
+        downloader.session = downloader.create_session(max_connections)
+        return True
+
+    async def _close_session(self) -> None:
+        downloader = self.pipeline.downloader
+        if downloader.session is not None:
+            await downloader.session.close()
+            downloader.session = None
+
     async def download_and_convert(
         self,
         arxiv_id: str,
@@ -49,8 +180,10 @@ class UnifiedDownloadConverter:
         logger.info(f"Starting unified download and convert for {arxiv_id}")
 
         try:
-            # Download and process the paper
-            result = await self.pipeline.process_paper(arxiv_id, include_pdf=include_pdf)
+            # Download and process the paper, keeping the extracted files for saving
+            result = await self.pipeline.process_paper(
+                arxiv_id, include_pdf=include_pdf, include_files=True
+            )
 
             if not result.get("success"):
                 return {
@@ -67,17 +200,7 @@ class UnifiedDownloadConverter:
                 "metadata": {},
             }
 
-            # Get the raw files for saving
-            source_content = await self.pipeline.downloader.download(
-                arxiv_id, timeout=self.config.download_timeout
-            )
-            files = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.pipeline.latex_processor.extract_archive,
-                source_content,
-                self.config.max_files_per_archive,
-            )
-
+            files = result["files"]
             main_tex_file = result["main_tex_file"]
 
             # Save LaTeX files if requested
@@ -89,12 +212,11 @@ class UnifiedDownloadConverter:
 
             # Convert and save Markdown if requested
             if save_markdown:
-                # Get the main TeX content
-                tex_content = files[main_tex_file].decode("utf-8", errors="ignore")
-
-                # Convert to markdown with metadata extraction
-                conversion_result = self.markdown_converter.convert_with_metadata(
-                    tex_content, arxiv_id
+                # Convert to markdown with metadata extraction, off the event loop
+                # so other papers in a batch keep downloading meanwhile; the
+                # main TeX file is shipped as raw bytes and decoded in the worker
+                conversion_result = await self._convert_markdown(
+                    files[main_tex_file], arxiv_id
                 )
 
                 if conversion_result["success"]:
@@ -176,9 +298,14 @@ class UnifiedDownloadConverter:
                     arxiv_id, save_latex, save_markdown, include_pdf
                 )
 
-        # Process all papers concurrently
-        tasks = [process_with_semaphore(arxiv_id) for arxiv_id in arxiv_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # One connection pool for the whole batch, sized to the semaphore, unless
+        # the caller already opened one with ``async with converter``. It is
+        # scoped to the batch's tasks, so concurrent calls outside the batch
+        # never pick it up and are unaffected when it closes.
+        async with self.pipeline.downloader.scoped_session(max_concurrent):
+            # Process all papers concurrently
+            tasks = [process_with_semaphore(arxiv_id) for arxiv_id in arxiv_ids]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Compile batch results
         successful = []
@@ -224,30 +351,32 @@ class UnifiedDownloadConverter:
             "directory_exists": self.file_saver.output_directory.exists(),
         }
 
-        # Add directory contents if they exist
+        # Add directory contents if they exist; DirEntry.is_dir() reuses the
+        # file type reported by readdir, so no per-entry stat is needed
         if self.file_saver.latex_dir.exists():
-            structure["latex_papers"] = [
-                {
-                    "arxiv_id": d.name,
-                    "path": str(d),
-                    "files": len(list(d.glob("*"))) if d.is_dir() else 0,
-                }
-                for d in self.file_saver.latex_dir.iterdir()
-                if d.is_dir()
-            ]
+            latex_papers = []
+            for entry in _scan_subdirectories(self.file_saver.latex_dir):
+                with os.scandir(entry.path) as children:
+                    file_count = sum(1 for _ in children)
+                latex_papers.append(
+                    {"arxiv_id": entry.name, "path": entry.path, "files": file_count}
+                )
+            structure["latex_papers"] = latex_papers
 
         if self.file_saver.markdown_dir.exists():
-            structure["markdown_papers"] = [
-                {
-                    "arxiv_id": d.name,
-                    "path": str(d),
-                    "markdown_file": (
-                        str(d / f"{d.name}.md") if (d / f"{d.name}.md").exists() else None
-                    ),
-                }
-                for d in self.file_saver.markdown_dir.iterdir()
-                if d.is_dir()
-            ]
+            markdown_papers = []
+            for entry in _scan_subdirectories(self.file_saver.markdown_dir):
+                markdown_file = os.path.join(entry.path, f"{entry.name}.md")
+                markdown_papers.append(
+                    {
+                        "arxiv_id": entry.name,
+                        "path": entry.path,
+                        "markdown_file": (
+                            markdown_file if os.path.exists(markdown_file) else None
+                        ),
+                    }
+                )
+            structure["markdown_papers"] = markdown_papers
 
         return structure
 
@@ -287,10 +416,11 @@ class UnifiedDownloadConverter:
             if not manifest_path.exists():
                 return {"error": f"Manifest not found for {arxiv_id}"}
 
-            import json
-
-            with open(manifest_path, "r") as f:
-                manifest = json.load(f)
+            with open(manifest_path, "rb") as f:
+                raw_manifest = f.read()
+            manifest = (
+                orjson.loads(raw_manifest) if ORJSON_AVAILABLE else json.loads(raw_manifest)
+            )
 
             main_tex_file = manifest["main_tex_file"]
             latex_path = latex_dir / main_tex_file
@@ -318,8 +448,8 @@ class UnifiedDownloadConverter:
                     len(markdown_content) / len(latex_content) if latex_content else 0
                 ),
                 "has_yaml_frontmatter": markdown_content.startswith("---"),
-                "sections_preserved": len(re.findall(r"^#+ ", markdown_content, re.MULTILINE)),
-                "math_expressions": len(re.findall(r"\$.*?\$", markdown_content)),
+                "sections_preserved": sum(1 for _ in _SECTION_RE.finditer(markdown_content)),
+                "math_expressions": _count_inline_math(markdown_content),
                 "conversion_date": manifest.get("saved_at"),
             }
 
@@ -331,7 +461,7 @@ class UnifiedDownloadConverter:
                 issues.append("No section headers found in markdown")
             if "\\begin{" in markdown_content:
                 issues.append("Unconverted LaTeX environments detected")
-            if re.search(r"\\[a-zA-Z]+", markdown_content):
+            if _LATEX_CMD_RE.search(markdown_content):
                 issues.append("Unconverted LaTeX commands detected")
 
             quality_metrics["issues"] = issues
@@ -4,8 +4,31 @@ Extracted from the main __init__.py for better modularity.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
+# Support both new format (YYMM.NNNN) and old format (subject-class/YYMMnnn)
+_ARXIV_RE = re.compile(r"^(\d{4}\.\d{4,5}(v\d+)?|\w+[-.]?\w+/\d{7}(v\d+)?)$")
+_PATH_BAD_RE = re.compile(r'[<>:"|?*]')
+_PARENT_DIR_RE = re.compile(r"\.\./")
+_TRAILING_PARENT_RE = re.compile(r"\.\.$")
+
+
+@lru_cache(maxsize=4096)
+def _validate_arxiv_id(arxiv_id: str) -> bool:
+    """Match an ID once; batch flows validate the same IDs repeatedly."""
+    return bool(_ARXIV_RE.match(arxiv_id.strip()))
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_file_path(path: str) -> str:
+    """Sanitize a path once; batch flows reuse the same output paths."""
+    # Remove any dangerous characters and path traversal attempts
+    path = _PATH_BAD_RE.sub("_", path)
+    path = _PARENT_DIR_RE.sub("", path)
+    path = _TRAILING_PARENT_RE.sub("", path)
+    return path.strip()
+
 
 class ArxivValidator:
     """Comprehensive input validation and sanitization"""
@@ -13,18 +36,12 @@ class ArxivValidator:
     @staticmethod
     def validate_arxiv_id(arxiv_id: str) -> bool:
         """Validate arXiv ID format"""
-        # Support both new format (YYMM.NNNN) and old format (subject-class/YYMMnnn)
-        pattern = r"^(\d{4}\.\d{4,5}(v\d+)?|\w+[-.]?\w+/\d{7}(v\d+)?)$"
-        return bool(re.match(pattern, arxiv_id.strip()))
+        return _validate_arxiv_id(arxiv_id)
 
     @staticmethod
     def sanitize_file_path(path: str) -> str:
         """Sanitize file paths to prevent traversal"""
-        # Remove any dangerous characters and path traversal attempts
-        path = re.sub(r'[<>:"|?*]', "_", path)
-        path = re.sub(r"\.\./", "", path)
-        path = re.sub(r"\.\.$", "", path)
-        return path.strip()
+        return _sanitize_file_path(path)
 
     @staticmethod
     def validate_archive_member(base_path: Path, member_name: str) -> bool:
@@ -2,13 +2,18 @@
 Integration tests for the new LaTeX to Markdown conversion and file saving features.
 """
 
+import asyncio
+import io
 import pytest
+import tarfile
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import AsyncMock, Mock
 
 from arxiv_mcp.utils.file_saver import FileSaver
 from arxiv_mcp.utils.latex_to_markdown import LaTeXToMarkdownConverter
+from arxiv_mcp.utils import unified_converter
 from arxiv_mcp.utils.unified_converter import (
     UnifiedDownloadConverter,
     download_and_convert_paper,
@@ -203,6 +208,7 @@ class TestUnifiedDownloadConverter:
 
     def teardown_method(self):
         """Clean up test environment."""
+        unified_converter._shutdown_conversion_pool()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_get_output_structure(self):
@@ -215,6 +221,117 @@ class TestUnifiedDownloadConverter:
         assert "markdown" in structure["subdirectories"]
         assert "metadata" in structure["subdirectories"]
 
+    @staticmethod
+    def _mock_source_download() -> AsyncMock:
+        """A downloader stub returning a one-file source archive."""
+        tex = rb"""\documentclass{article}
+\title{Single Download}
+\begin{document}
+\section{Introduction}
+Body text.
+\end{document}
+"""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+            info = tarfile.TarInfo("main.tex")
+            info.size = len(tex)
+            tar.addfile(info, io.BytesIO(tex))
+        return AsyncMock(return_value=io.BytesIO(buffer.getvalue()))
+
+    @pytest.mark.asyncio
+    async def test_download_and_convert_downloads_once(self):
+        """The source archive is downloaded once and reused for saving."""
+        download = self._mock_source_download()
+        self.converter.pipeline.downloader.download = download
+
+        result = await self.converter.download_and_convert(
+            arxiv_id="2301.00001", save_latex=True, save_markdown=True
+        )
+
+        assert result["success"], result
+        assert download.await_count == 1
+        assert result["summary"]["main_tex_file"] == "main.tex"
+        assert (Path(self.temp_dir) / "latex" / "2301.00001").exists()
+
+    @pytest.mark.asyncio
+    async def test_download_and_convert_markdown_in_process_pool(self):
+        """Markdown conversion runs in the shared spawn-based worker pool."""
+        self.converter.pipeline.downloader.download = self._mock_source_download()
+
+        try:
+            result = await self.converter.download_and_convert(
+                arxiv_id="2301.00001", save_latex=False, save_markdown=True
+            )
+            pool = unified_converter._conversion_pool
+            assert pool is not None
+            assert pool._mp_context.get_start_method() == "spawn"
+        finally:
+            unified_converter._shutdown_conversion_pool()
+
+        assert result["success"], result
+        assert "markdown" in result["formats"]
+        assert Path(result["files"]["markdown"]["file"]).exists()
+        assert unified_converter._conversion_pool is None
+
+    @pytest.mark.asyncio
+    async def test_download_and_convert_uses_instance_converter(self):
+        """A converter that cannot be pickled still runs, in a thread."""
+        self.converter.pipeline.downloader.download = self._mock_source_download()
+        self.converter.markdown_converter = Mock()
+        self.converter.markdown_converter.convert_with_metadata_bytes.return_value = {
+            "markdown": "# Patched",
+            "metadata": {"title": "Patched"},
+            "conversion_method": "mock",
+            "success": True,
+            "warnings": None,
+        }
+
+        result = await self.converter.download_and_convert(
+            arxiv_id="2301.00001", save_latex=False, save_markdown=True
+        )
+
+        assert result["success"], result
+        assert result["files"]["markdown"]["conversion_method"] == "mock"
+        self.converter.markdown_converter.convert_with_metadata_bytes.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_session_not_shared_with_concurrent_calls(self):
+        """A batch's HTTP session is only seen by the batch's own downloads."""
+        downloader = self.converter.pipeline.downloader
+        archive = self._mock_source_download().return_value.getvalue()
+        sessions = {}
+        outside_started = asyncio.Event()
+        batch_done = asyncio.Event()
+
+        async def download(arxiv_id, timeout=60):
+            sessions[arxiv_id] = downloader._active_session()
+            if arxiv_id == "2301.00009":
+                outside_started.set()
+                await asyncio.wait_for(batch_done.wait(), 5)
+                sessions["after_batch"] = downloader._active_session()
+            return io.BytesIO(archive)
+
+        downloader.download = download
+
+        outside = asyncio.create_task(
+            self.converter.download_and_convert(
+                "2301.00009", save_latex=False, save_markdown=False
+            )
+        )
+        await asyncio.wait_for(outside_started.wait(), 5)
+        batch = await self.converter.batch_download_and_convert(
+            ["2301.00001", "2301.00002"], save_latex=False, save_markdown=False
+        )
+        batch_done.set()
+        outside_result = await outside
+
+        assert batch["successful"] == 2 and outside_result["success"]
+        assert sessions["2301.00001"] is not None
+        assert sessions["2301.00001"] is sessions["2301.00002"]
+        assert sessions["2301.00001"].closed
+        assert sessions["2301.00009"] is None and sessions["after_batch"] is None
+        assert downloader.session is None
+
     @pytest.mark.asyncio
     async def test_download_and_convert_integration(self):
         """Integration test for downloading and converting a real paper."""
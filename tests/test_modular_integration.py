@@ -3,6 +3,7 @@ Comprehensive test suite for the modular ArXiv MCP architecture.
 Tests all major components and their interactions to ensure system integrity.
 """
 
+import asyncio
 import os
 import sys
 import pytest
@@ -13,6 +14,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from arxiv_mcp.utils.validation import ArxivValidator
 from arxiv_mcp.utils.metrics import MetricsCollector
+from arxiv_mcp.utils import retry as retry_module
+from arxiv_mcp.utils.retry import async_retry, sync_retry
 from arxiv_mcp.exceptions import (
     ArxivMCPError,
     DownloadError,
@@ -50,6 +53,86 @@ class TestArxivValidator:
         assert not validator.validate_arxiv_id("2301")
 
 
+class TestRetryDecorators:
+    """Test the retry decorators."""
+
+    def test_decorating_does_not_configure_logging(self):
+        """Decorating at import time must not touch the root logger."""
+        retry_module._retry_logger.cache_clear()
+        with patch.object(retry_module, "structured_logger") as mock_logger:
+
+            @sync_retry(retries=1, delay=0)
+            def flaky():
+                raise ValueError("boom")
+
+            mock_logger.assert_not_called()
+
+            with pytest.raises(ValueError):
+                flaky()
+            mock_logger.assert_called_once()
+        retry_module._retry_logger.cache_clear()
+
+    def test_backoff_pause_bounds(self):
+        """Jittered pauses stay within [delay / 2, delay]; plain ones are exact."""
+        assert retry_module._backoff_pause(3.0, jitter=False) == 3.0
+        for _ in range(1000):
+            assert 1.5 <= retry_module._backoff_pause(3.0, jitter=True) <= 3.0
+
+    def test_jitter_is_opt_in(self):
+        """Call sites keep the deterministic schedule unless they ask for jitter."""
+        with patch.object(retry_module.time, "sleep") as mock_sleep:
+
+            @sync_retry(retries=2, delay=3.0, backoff=2.0)
+            def flaky():
+                raise ValueError("boom")
+
+            with pytest.raises(ValueError):
+                flaky()
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [3.0, 6.0]
+
+    def test_async_retry_reraises_final_error(self):
+        """After the last attempt the original exception object propagates."""
+        attempts = []
+        final_error = ConnectionError("still down")
+
+        @async_retry(retries=2, delay=0)
+        async def flaky():
+            attempts.append(len(attempts))
+            raise final_error if len(attempts) == 3 else ConnectionError("down")
+
+        with pytest.raises(ConnectionError) as excinfo:
+            asyncio.run(flaky())
+        assert excinfo.value is final_error
+        assert len(attempts) == 3
+
+    def test_async_retry_recovers_after_transient_failures(self):
+        """A call that succeeds on a later attempt returns its result."""
+        attempts = []
+
+        @async_retry(retries=3, delay=0)
+        async def flaky():
+            attempts.append(None)
+            if len(attempts) < 3:
+                raise TimeoutError("slow")
+            return "ok"
+
+        assert asyncio.run(flaky()) == "ok"
+        assert len(attempts) == 3
+
+    def test_only_listed_exceptions_are_retried(self):
+        """Exceptions outside the configured types propagate on the first attempt."""
+        attempts = []
+
+        @sync_retry(retries=3, delay=0, exceptions=[ConnectionError, TimeoutError])
+        def broken():
+            attempts.append(None)
+            raise KeyError("not transient")
+
+        with pytest.raises(KeyError):
+            broken()
+        assert len(attempts) == 1
+
+
 class TestMetricsCollector:
     """Test the metrics collection functionality."""
 
@@ -4,11 +4,14 @@ Tests all 7 newly implemented features: Search Analytics, Auto-Summarization,
 Smart Tagging, Reading Lists, Paper Notifications, Trending Analysis, and Batch Operations.
 """
 
+import asyncio
+import json
 import pytest
 import tempfile
+import time
 import os
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from arxiv_mcp.utils.search_analytics import SearchAnalytics, SearchQuery
 from arxiv_mcp.utils.auto_summarizer import AutoSummarizer, SummaryResult
@@ -66,6 +69,111 @@ class TestSmartNewFeatures:
         popular = analytics.get_popular_searches(limit=5)
         assert isinstance(popular, list)
 
+    @staticmethod
+    def _search_query(text: str, **overrides) -> SearchQuery:
+        """A successful search for ``text`` made now."""
+        fields = dict(query=text, timestamp=datetime.now(), results_count=10, response_time=0.5)
+        fields.update(overrides)
+        return SearchQuery(**fields)
+
+    def _stored_weight(self) -> tuple:
+        """(row count, summed weight) of the stored search queries."""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(weight), 0) FROM search_queries"
+            ).fetchone()
+
+    def test_search_analytics_sampling_keeps_exact_totals(self):
+        """Sampled hot queries still sum to the number of tracked searches."""
+        from arxiv_mcp.utils import search_analytics
+
+        analytics = SearchAnalytics(db_path=self.db_path)
+        first_window = search_analytics.HOT_QUERY_THRESHOLD + 55
+        for _ in range(first_window):
+            analytics.track_search(self._search_query("hot query"))
+
+        # Let the writer record the batch without flushing, then cross the
+        # window boundary so the held-back occurrences are released by the reset
+        deadline = time.monotonic() + 5
+        while analytics._processed < first_window and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with analytics._connection():
+            analytics._recent_window_start -= search_analytics.HOT_QUERY_WINDOW_SECONDS
+
+        for _ in range(7):
+            analytics.track_search(self._search_query("hot query"))
+        analytics.flush()
+
+        rows, weight = self._stored_weight()
+        assert weight == first_window + 7
+        assert rows < weight
+        analytics.close()
+
+    def test_search_analytics_reads_see_tracked_queries(self):
+        """Reads wait for queries tracked before them to be written."""
+        analytics = SearchAnalytics(db_path=self.db_path)
+        for text in ("graph transformers", "diffusion models", "graph pruning"):
+            analytics.track_search(self._search_query(text))
+
+        assert analytics.get_usage_statistics()["total_queries"] == 3
+        terms = {row["term"]: row["count"] for row in analytics.get_popular_searches()}
+        assert terms["graph"] == 2
+        assert self._stored_weight() == (3, 3)
+        analytics.close()
+
+    def test_search_analytics_writer_flushes_without_reads(self, monkeypatch):
+        """The background writer flushes on its own once the interval passes."""
+        from arxiv_mcp.utils import search_analytics
+
+        monkeypatch.setattr(search_analytics, "FLUSH_INTERVAL_SECONDS", 0.05)
+        analytics = SearchAnalytics(db_path=self.db_path)
+        analytics.track_search(self._search_query("background flush"))
+
+        deadline = time.monotonic() + 5
+        while self._stored_weight() != (1, 1) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert self._stored_weight() == (1, 1)
+        analytics.close()
+
+    def test_search_analytics_drops_when_queue_full(self, monkeypatch):
+        """Queries beyond the queue bound are dropped and counted."""
+        import threading
+        from arxiv_mcp.utils import search_analytics
+
+        writer_may_start = threading.Event()
+        drain_queue = search_analytics._drain_queue
+
+        def gated_drain_queue(ref, work):
+            writer_may_start.wait(timeout=5)
+            drain_queue(ref, work)
+
+        monkeypatch.setattr(search_analytics, "QUEUE_MAXSIZE", 1)
+        monkeypatch.setattr(search_analytics, "_drain_queue", gated_drain_queue)
+        analytics = SearchAnalytics(db_path=self.db_path)
+
+        for text in ("kept", "dropped one", "dropped two"):
+            analytics.track_search(self._search_query(text))
+        assert analytics.metrics.counters["analytics_dropped"] == 2
+
+        writer_may_start.set()
+        analytics.flush()
+        assert self._stored_weight() == (1, 1)
+        analytics.close()
+
+    def test_search_analytics_drains_on_close_and_exit(self):
+        """Queued queries are written by close() and by the atexit hook."""
+        import weakref
+        from arxiv_mcp.utils import search_analytics
+
+        analytics = SearchAnalytics(db_path=self.db_path)
+        analytics.track_search(self._search_query("before exit"))
+        search_analytics._flush_at_exit(weakref.ref(analytics))
+        assert self._stored_weight() == (1, 1)
+
+        analytics.track_search(self._search_query("before close"))
+        analytics.close()
+        assert self._stored_weight() == (2, 2)
+
     def test_auto_summarizer_initialization(self):
         """Test AutoSummarizer class initialization."""
         summarizer = AutoSummarizer()
@@ -108,6 +216,57 @@ class TestSmartNewFeatures:
         assert isinstance(tags, list)
         assert all(isinstance(tag, Tag) for tag in tags)
 
+    def test_smart_tagging_bulk_tag_papers(self):
+        """Test that parallel bulk tagging matches tagging papers one by one."""
+        tagger = SmartTagger(cache_dir=self.temp_dir)
+        items = [
+            (
+                f"2301.0000{i}",
+                {
+                    "title": f"Neural networks {i}",
+                    "abstract": "Deep learning for image segmentation",
+                    "text": "Neural network training improves image segmentation. " * (i + 1),
+                },
+            )
+            for i in range(3)
+        ]
+
+        results = tagger.tag_papers(items, max_workers=2)
+        assert [r.paper_id for r in results] == [paper_id for paper_id, _ in items]
+
+        for (paper_id, content), result in zip(items, results):
+            expected = tagger.extract_tags(
+                content["text"], content["title"], content["abstract"]
+            )
+            assert [t.term for t in result.tags] == [t.term for t in expected]
+            assert {t.term for t in tagger.get_paper_tags(paper_id)} == {
+                t.term for t in result.tags
+            }
+
+    def test_smart_tagging_workers_spawn_without_database(self, monkeypatch):
+        """Bulk tagging spawns its workers, which never open the tag database."""
+        import arxiv_mcp.utils.smart_tagging as smart_tagging_module
+
+        start_methods = []
+        real_pool = smart_tagging_module.ProcessPoolExecutor
+
+        def recording_pool(*args, **kwargs):
+            start_methods.append(kwargs["mp_context"].get_start_method())
+            return real_pool(*args, **kwargs)
+
+        monkeypatch.setattr(smart_tagging_module, "ProcessPoolExecutor", recording_pool)
+        tagger = SmartTagger(cache_dir=self.temp_dir)
+        items = [(f"2301.0000{i}", {"text": f"Graph neural networks {i}"}) for i in range(2)]
+        tagger.tag_papers(items, max_workers=2)
+        assert start_methods == ["spawn"]
+
+        worker_tagger = SmartTagger._extraction_only()
+        assert not hasattr(worker_tagger, "_conn")
+        text = "Transformer attention improves machine translation."
+        assert [t.term for t in worker_tagger.extract_tags(text)] == [
+            t.term for t in tagger.extract_tags(text)
+        ]
+
     def test_reading_lists_initialization(self):
         """Test ReadingListManager class initialization."""
         manager = ReadingListManager(db_path=self.db_path)
@@ -138,6 +297,149 @@ class TestSmartNewFeatures:
         lists = manager.list_reading_lists()
         assert isinstance(lists, list)
 
+    def test_reading_lists_bulk_add_and_import(self):
+        """Test bulk paper insertion and JSON import/export round trip."""
+        manager = ReadingListManager(db_path=self.db_path)
+        reading_list = manager.create_reading_list("Bulk", "Bulk insert test")
+
+        papers = [
+            Paper(
+                arxiv_id=f"2301.0000{i}",
+                title=f"Paper {i}",
+                authors=["A"],
+                url=f"https://arxiv.org/abs/2301.0000{i}",
+                pdf_url=f"https://arxiv.org/pdf/2301.0000{i}",
+            )
+            for i in range(3)
+        ]
+        assert manager.add_papers_to_list(reading_list.id, papers) == 3
+
+        stored = manager.get_reading_list(reading_list.id)
+        assert [p.arxiv_id for p in stored.papers] == [p.arxiv_id for p in papers]
+
+        export_path = os.path.join(self.temp_dir, "export.json")
+        assert manager.export_reading_list(reading_list.id, export_path)
+        imported_id = manager.import_reading_list(export_path, "Imported")
+        imported = manager.get_reading_list(imported_id)
+        assert [p.arxiv_id for p in imported.papers] == [p.arxiv_id for p in papers]
+        assert [(p.url, p.pdf_url) for p in imported.papers] == [
+            (p.url, p.pdf_url) for p in papers
+        ]
+
+    def test_reading_lists_import_skips_malformed_papers(self):
+        """Malformed entries are skipped; the rest of the import still lands."""
+        manager = ReadingListManager(db_path=self.db_path)
+        import_path = os.path.join(self.temp_dir, "import.json")
+        with open(import_path, "w") as f:
+            json.dump(
+                {
+                    "papers": [
+                        {"arxiv_id": "2301.00001", "title": "Good"},
+                        {"title": "No id"},
+                        {"arxiv_id": "2301.00002", "title": None},
+                        {"arxiv_id": "2301.00003", "title": "Bad authors", "authors": "A"},
+                        "not a paper",
+                        {"arxiv_id": "2301.00004", "title": "Also good"},
+                    ]
+                },
+                f,
+            )
+
+        imported_id = manager.import_reading_list(import_path, "Partial")
+        imported = manager.get_reading_list(imported_id)
+        assert [p.arxiv_id for p in imported.papers] == ["2301.00001", "2301.00004"]
+
+    def test_reading_lists_import_resets_invalid_rating_and_status(self):
+        """Out-of-range values are reset instead of failing the whole import."""
+        manager = ReadingListManager(db_path=self.db_path)
+        import_path = os.path.join(self.temp_dir, "import.json")
+        with open(import_path, "w") as f:
+            json.dump(
+                {
+                    "papers": [
+                        {"arxiv_id": "2301.00001", "title": "Good", "rating": 4,
+                         "read_status": "read"},
+                        {"arxiv_id": "2301.00002", "title": "Bad", "rating": 11,
+                         "read_status": "skimmed"},
+                        {"arxiv_id": "2301.00003", "title": "Also good"},
+                    ]
+                },
+                f,
+            )
+
+        imported_id = manager.import_reading_list(import_path, "Checked")
+        assert imported_id is not None
+        imported = manager.get_reading_list(imported_id)
+        assert [(p.arxiv_id, p.rating, p.read_status) for p in imported.papers] == [
+            ("2301.00001", 4, "read"),
+            ("2301.00002", None, "unread"),
+            ("2301.00003", None, "unread"),
+        ]
+
+    def test_reading_lists_rejects_invalid_status(self):
+        """Unknown statuses raise even when the paper id matches no row."""
+        manager = ReadingListManager(db_path=self.db_path)
+        with pytest.raises(ValueError):
+            manager.update_paper_status("9999.99999", "skimmed")
+        assert manager.update_paper_status("9999.99999", "read")
+
+    def test_reading_lists_failed_import_leaves_no_list(self, monkeypatch):
+        """A failing import rolls back the list row along with its papers."""
+        import arxiv_mcp.utils.reading_lists as reading_lists_module
+
+        manager = ReadingListManager(db_path=self.db_path)
+        import_path = os.path.join(self.temp_dir, "import.json")
+        with open(import_path, "w") as f:
+            json.dump({"papers": [{"arxiv_id": "2301.00001", "title": "Good"}]}, f)
+
+        monkeypatch.setattr(
+            reading_lists_module,
+            "_SQL_IMPORT_LIST_PAPERS_JSON",
+            "INSERT INTO missing VALUES (?, ?)",
+        )
+        assert manager.import_reading_list(import_path, "Broken") is None
+        assert [rl.name for rl in manager.list_reading_lists()] == []
+
+    @pytest.mark.performance
+    def test_reading_lists_lazy_json_fields(self):
+        """Test that list fields of loaded papers are only decoded on access."""
+        manager = ReadingListManager(db_path=self.db_path)
+        reading_list = manager.create_reading_list("Lazy")
+        manager.add_paper_to_list(
+            reading_list.id,
+            Paper(arxiv_id="2301.00001", title="Lazy", authors=["A", "B"], tags=["x"]),
+        )
+
+        paper = manager.get_reading_list(reading_list.id).papers[0]
+        assert paper.title == "Lazy"
+        with pytest.raises(AttributeError):
+            object.__getattribute__(paper, "authors")
+
+        assert paper.authors == ["A", "B"]
+        assert paper.tags == ["x"]
+        assert paper.categories == []
+
+    def test_reading_lists_lazy_papers_copy_and_replace(self):
+        """Loaded papers support dataclasses.replace, copy and pickle like Paper."""
+        import copy
+        import dataclasses
+        import pickle
+
+        manager = ReadingListManager(db_path=self.db_path)
+        reading_list = manager.create_reading_list("Lazy")
+        original = Paper(arxiv_id="2301.00001", title="Lazy", authors=["A"], tags=["x"])
+        manager.add_paper_to_list(reading_list.id, original)
+        paper = manager.get_reading_list(reading_list.id).papers[0]
+
+        replaced = dataclasses.replace(paper, title="Renamed")
+        assert replaced.title == "Renamed"
+        assert replaced.authors == ["A"] and replaced.tags == ["x"]
+
+        for clone in (copy.copy(paper), copy.deepcopy(paper), pickle.loads(pickle.dumps(paper))):
+            assert type(clone) is Paper
+            assert clone == paper
+            assert clone.authors == ["A"]
+
     def test_paper_notifications_initialization(self):
         """Test PaperNotificationSystem class initialization."""
         notifications = PaperNotificationSystem(db_path=self.db_path)
@@ -164,6 +466,78 @@ class TestSmartNewFeatures:
         rules = notifications.get_notification_rules()
         assert isinstance(rules, list)
 
+    def test_notification_rule_conditions_are_independent(self):
+        """Mutating one loaded rule must not leak into other or later loads."""
+        from arxiv_mcp.utils.paper_notifications import NotificationType
+
+        notifications = PaperNotificationSystem(db_path=self.db_path)
+        for name in ("First", "Second"):
+            notifications.create_notification_rule(
+                name=name,
+                notification_type=NotificationType.KEYWORD_MATCH,
+                conditions={"keywords": ["transformers"]},
+            )
+
+        first, second = notifications.get_notification_rules()
+        first.conditions["keywords"].append("mutated")
+
+        assert second.conditions == {"keywords": ["transformers"]}
+        reloaded = notifications.get_notification_rules()
+        assert all(r.conditions == {"keywords": ["transformers"]} for r in reloaded)
+
+    def test_paper_notifications_monitoring_cycle(self):
+        """A monitoring cycle runs its database work off the running loop."""
+        notifications = PaperNotificationSystem(db_path=self.db_path)
+        notifications.add_paper_monitor(
+            "2301.00001", "Monitored", ["A"], check_frequency=timedelta(0)
+        )
+
+        created = asyncio.run(notifications.run_monitoring_cycle())
+        assert isinstance(created, int)
+
+    def test_paper_notifications_cycle_handlers_run_on_loop(self):
+        """Handlers fired by a monitoring cycle run on the event loop thread."""
+        from arxiv_mcp.utils.paper_notifications import NotificationType
+
+        notifications = PaperNotificationSystem(db_path=self.db_path)
+        notifications.add_paper_monitor(
+            "2301.00001", "Monitored", ["A"], check_frequency=timedelta(0)
+        )
+
+        async def cycle():
+            received = asyncio.Queue()
+            notifications.register_handler(
+                NotificationType.AUTHOR_UPDATE,
+                lambda n: received.put_nowait((asyncio.get_running_loop(), n.paper_id)),
+            )
+            created = await notifications.run_monitoring_cycle()
+            return created, asyncio.get_running_loop(), received
+
+        created, loop, received = asyncio.run(cycle())
+        assert created == 1
+        assert received.get_nowait() == (loop, "2301.00001")
+
+    def test_paper_notifications_bulk_mark_read(self):
+        """Test marking several notifications as read in one call."""
+        from arxiv_mcp.utils.paper_notifications import NotificationType
+
+        notifications = PaperNotificationSystem(db_path=self.db_path)
+        created = [
+            notifications._create_notification(
+                paper_id=f"2301.0000{i}",
+                title=f"Paper {i}",
+                notification_type=NotificationType.NEW_VERSION,
+                message="New version available",
+            )
+            for i in range(3)
+        ]
+
+        count = notifications.mark_notifications_read([n.id for n in created[:2]])
+        assert count == 2
+
+        unread = notifications.get_notifications(unread_only=True)
+        assert [n.id for n in unread] == [created[2].id]
+
     def test_trending_analysis_initialization(self):
         """Test TrendingAnalyzer class initialization."""
         analyzer = TrendingAnalyzer(db_path=self.db_path)
@@ -235,6 +609,337 @@ class TestSmartNewFeatures:
         print("✅ All Smart New Features integration test: PASSED")
 
 
+class TestTrendingAnalyzer:
+    """Behaviour of the TrendingAnalyzer storage and query paths."""
+
+    def setup_method(self):
+        """Set up a fresh trending database for each test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "trending.db")
+        self.today = datetime.now().date()
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _analyzer(self, name: str = "trending.db") -> TrendingAnalyzer:
+        return TrendingAnalyzer(db_path=os.path.join(self.temp_dir, name))
+
+    def test_same_day_keyword_observations_accumulate(self):
+        """Recording a keyword twice on one day adds to its frequency."""
+        analyzer = self._analyzer()
+        analyzer.record_keyword_trend("graph neural networks", 3, date=self.today)
+        analyzer.record_keyword_trend("graph neural networks", 4, date=self.today)
+
+        (keyword,) = analyzer.analyze_keyword_trends(limit=5, days=7)
+        assert keyword.frequency == 7
+        assert keyword.trend_score == analyzer._calculate_keyword_trend_score(
+            "graph neural networks", 7
+        )
+        analyzer.close()
+
+    def test_keyword_bulk_recorder_matches_single_calls(self):
+        """record_keyword_trend_bulk stores what repeated single calls store."""
+        items = [
+            (f"topic {i % 4}", 2 + i, ["related"], ["cs.LG"], self.today - timedelta(days=i % 3))
+            for i in range(12)
+        ]
+        single, bulk = self._analyzer("single.db"), self._analyzer("bulk.db")
+        for item in items:
+            single.record_keyword_trend(*item)
+        assert bulk.record_keyword_trend_bulk(items) == len(items)
+
+        assert single.analyze_keyword_trends(limit=10, days=7) == bulk.analyze_keyword_trends(
+            limit=10, days=7
+        )
+        single.close()
+        bulk.close()
+
+    def test_metric_bulk_recorder_matches_single_calls(self):
+        """Bulk (vectorised when NumPy is present) scoring matches scalar scoring."""
+        from arxiv_mcp.utils import trending_analysis
+
+        entries = [
+            (
+                f"2301.{paper:05d}",
+                {
+                    "downloads": (paper * 37 + day * 11) % 500,
+                    "citations": (paper + day) % 7,
+                    "views": (paper * 13) % 900,
+                    "social": day % 4,
+                },
+                self.today - timedelta(days=day),
+            )
+            for paper in range(20)
+            for day in range(5)
+        ]
+        assert len(entries) >= trending_analysis.VECTORIZE_MIN_BATCH
+
+        single, bulk = self._analyzer("single.db"), self._analyzer("bulk.db")
+        for entry in entries:
+            single.record_paper_metrics(*entry)
+        assert bulk.record_paper_metrics_bulk(entries) == len(entries)
+
+        def summary(analyzer):
+            return [
+                (p.arxiv_id, p.trend_score, p.velocity, p.rank_change, p.download_count)
+                for p in analyzer.get_trending_papers(limit=50, days=7)
+            ]
+
+        assert summary(single) == summary(bulk)
+        for arxiv_id in ("2301.00000", "2301.00007", "2301.00019"):
+            assert single.get_historical_trends(arxiv_id, 7) == bulk.get_historical_trends(
+                arxiv_id, 7
+            )
+        single.close()
+        bulk.close()
+
+    def _record_sample_metrics(self, analyzer: TrendingAnalyzer, papers: int = 12) -> None:
+        analyzer.record_paper_metrics_bulk(
+            (
+                f"2301.{paper:05d}",
+                {"downloads": 10 * paper + day, "views": paper * day},
+                self.today - timedelta(days=day),
+            )
+            for paper in range(papers)
+            for day in range(4)
+        )
+
+    def test_query_cache_sees_later_writes(self):
+        """Cached trending results are dropped when new data is recorded."""
+        analyzer = self._analyzer()
+        self._record_sample_metrics(analyzer)
+        analyzer.record_keyword_trend("diffusion models", 9, date=self.today)
+
+        assert analyzer.get_trending_papers(limit=5, days=7)[0].arxiv_id == "2301.00011"
+        assert analyzer.analyze_keyword_trends(limit=5, days=7)[0].keyword == "diffusion models"
+
+        analyzer.record_paper_metrics(
+            "2301.99999", {"downloads": 100_000, "citations": 500}, self.today
+        )
+        analyzer.record_keyword_trend("sparse autoencoders", 400, date=self.today)
+
+        assert analyzer.get_trending_papers(limit=5, days=7)[0].arxiv_id == "2301.99999"
+        keywords = analyzer.analyze_keyword_trends(limit=5, days=7)
+        assert keywords[0].keyword == "sparse autoencoders"
+        analyzer.close()
+
+    def test_query_cache_sees_writes_from_other_instances(self):
+        """Writes committed through another connection invalidate cached results."""
+        reader = self._analyzer()
+        writer = self._analyzer()
+        reader.record_paper_metrics("2301.00001", {"downloads": 10}, self.today)
+        assert [p.arxiv_id for p in reader.get_trending_papers(limit=5, days=7)] == [
+            "2301.00001"
+        ]
+
+        writer.record_paper_metrics("2301.00002", {"downloads": 10_000}, self.today)
+        assert [p.arxiv_id for p in reader.get_trending_papers(limit=5, days=7)] == [
+            "2301.00002",
+            "2301.00001",
+        ]
+        reader.close()
+        writer.close()
+
+    def test_query_cache_prefix_matches_uncached_query(self):
+        """A smaller limit served from a cached wider query matches a fresh query."""
+        analyzer = self._analyzer()
+        self._record_sample_metrics(analyzer)
+
+        def summary(papers):
+            return [(p.arxiv_id, p.trend_score, p.velocity, p.rank_change) for p in papers]
+
+        analyzer.get_trending_papers(limit=10, days=7)
+        from_cache = summary(analyzer.get_trending_papers(limit=3, days=7))
+        analyzer._query_cache.clear()
+        assert from_cache == summary(analyzer.get_trending_papers(limit=3, days=7))
+        analyzer.close()
+
+    def test_legacy_text_dates_are_migrated(self):
+        """Databases with ISO TEXT dates are converted to day numbers on open."""
+        yesterday = self.today - timedelta(days=1)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE paper_metrics (
+                    arxiv_id TEXT, date DATE, download_count INTEGER DEFAULT 0,
+                    citation_count INTEGER DEFAULT 0, view_count INTEGER DEFAULT 0,
+                    social_mentions INTEGER DEFAULT 0, trend_score REAL DEFAULT 0.0,
+                    rank_position INTEGER, PRIMARY KEY (arxiv_id, date)
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE keyword_trends (
+                    keyword TEXT, date DATE, frequency INTEGER DEFAULT 0,
+                    papers_count INTEGER DEFAULT 0, trend_score REAL DEFAULT 0.0,
+                    related_terms TEXT, categories TEXT, PRIMARY KEY (keyword, date)
+                )
+            """
+            )
+            conn.executemany(
+                "INSERT INTO paper_metrics (arxiv_id, date, download_count, trend_score)"
+                " VALUES (?, ?, ?, ?)",
+                [
+                    ("2301.00001", yesterday.isoformat(), 10, 0.4),
+                    # datetime.isoformat() values were stored by older callers too
+                    ("2301.00001", f"{self.today.isoformat()}T09:30:00", 20, 0.6),
+                ],
+            )
+            conn.execute(
+                "INSERT INTO keyword_trends VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ("world models", self.today.isoformat(), 8, 8, 0.2, "[]", "[]"),
+            )
+
+        analyzer = self._analyzer()
+        assert analyzer.get_historical_trends("2301.00001", 7) == [
+            (yesterday, 0.4),
+            (self.today, 0.6),
+        ]
+        assert [k.keyword for k in analyzer.analyze_keyword_trends(days=7)] == ["world models"]
+        analyzer.close()
+
+        with sqlite3.connect(self.db_path) as conn:
+            for table in ("paper_metrics", "keyword_trends"):
+                types = conn.execute(f"SELECT DISTINCT typeof(date) FROM {table}").fetchall()
+                assert types == [("integer",)]
+                assert not conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = ?", (f"{table}_legacy",)
+                ).fetchone()
+
+    def _record_viral_sample(self, analyzer: TrendingAnalyzer) -> None:
+        """Steady background papers plus a few whose metrics explode recently."""
+        entries = [
+            (
+                f"2301.{paper:05d}",
+                {"downloads": 1 + paper % 3, "views": 2},
+                self.today - timedelta(days=day),
+            )
+            for paper in range(30)
+            for day in range(7)
+        ]
+        entries += [
+            (
+                f"2302.{paper:05d}",
+                {"downloads": 10 ** (6 - day) if day < 4 else 1, "citations": 50 * max(0, 4 - day)},
+                self.today - timedelta(days=day),
+            )
+            for paper in range(3)
+            for day in range(7)
+        ]
+        analyzer.record_paper_metrics_bulk(entries)
+
+    def test_viral_papers_match_full_scan(self):
+        """The early-exit viral scan returns what a full filter would."""
+        import statistics
+
+        analyzer = self._analyzer()
+        self._record_viral_sample(analyzer)
+
+        papers = analyzer.get_trending_papers(limit=100, days=7)
+        threshold = statistics.mean(p.trend_score for p in papers) * 1.1
+        expected = sorted(
+            (p for p in papers if p.trend_score > threshold and p.velocity > 0.5),
+            key=lambda p: (p.trend_score, p.velocity),
+            reverse=True,
+        )
+
+        viral = analyzer.identify_viral_papers(threshold_multiplier=1.1, days=7)
+        assert [p.arxiv_id for p in viral] == [p.arxiv_id for p in expected]
+        assert {p.arxiv_id[:4] for p in viral} == {"2302"}
+        analyzer.close()
+
+    def test_parallel_report_matches_direct_calls(self):
+        """Report branches run on worker threads but return the direct results."""
+        analyzer = self._analyzer()
+        self._record_viral_sample(analyzer)
+        analyzer.record_keyword_trend_bulk(
+            (f"topic {k}", 3 + k, None, ["cs.LG"], self.today - timedelta(days=day))
+            for k in range(8)
+            for day in range(0, 14, 2)
+        )
+
+        report = analyzer.generate_trending_report(days=7)
+        assert analyzer._report_pool is not None
+        assert report.viral_papers
+
+        assert [p.arxiv_id for p in report.viral_papers] == [
+            p.arxiv_id for p in analyzer.identify_viral_papers(days=7)
+        ]
+        assert report.emerging_topics == analyzer.detect_emerging_topics(days=7)
+        assert report.top_keywords == analyzer.analyze_keyword_trends(limit=15, days=7)
+        assert report.total_papers_analyzed == len(analyzer.get_trending_papers(limit=20, days=7))
+
+        analyzer.close()
+        assert analyzer._report_pool is None
+
+    def test_compare_papers_statistics(self):
+        """Float reductions in compare_papers agree with the statistics module."""
+        import statistics
+
+        analyzer = self._analyzer()
+        self._record_sample_metrics(analyzer)
+        ids = ["2301.00003", "2301.00010", "2309.99999"]
+
+        comparison = analyzer.compare_papers(ids, days=7)
+        for arxiv_id in ids[:2]:
+            scores = [score for _, score in analyzer.get_historical_trends(arxiv_id, 7)]
+            stats = comparison[arxiv_id]
+            assert stats["average_score"] == pytest.approx(statistics.mean(scores))
+            assert stats["volatility"] == pytest.approx(statistics.stdev(scores))
+            assert stats["peak_score"] == max(scores)
+            assert stats["current_score"] == scores[-1]
+        assert comparison["2309.99999"]["average_score"] == 0
+        analyzer.close()
+
+    def test_export_round_trip(self):
+        """JSON and CSV exports carry the report's keywords and viral papers."""
+        import csv
+
+        analyzer = self._analyzer()
+        self._record_viral_sample(analyzer)
+        analyzer.record_keyword_trend("state space models", 12, date=self.today)
+        report = analyzer.generate_trending_report(days=30)
+
+        json_path = os.path.join(self.temp_dir, "trending.json")
+        assert analyzer.export_trending_data(json_path, format="json")
+        with open(json_path) as f:
+            exported = json.load(f)
+        assert [kw["keyword"] for kw in exported["top_keywords"]] == ["state space models"]
+        assert [p["arxiv_id"] for p in exported["viral_papers"]] == [
+            p.arxiv_id for p in report.viral_papers
+        ]
+
+        csv_path = os.path.join(self.temp_dir, "trending.csv")
+        assert analyzer.export_trending_data(csv_path, format="csv")
+        with open(csv_path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["Type", "Name", "Score", "Frequency", "Additional"]
+        assert ["Keyword", "state space models"] == rows[-1][:2]
+        assert len(rows) == 1 + len(report.top_categories) + len(report.top_keywords)
+
+        assert not analyzer.export_trending_data(csv_path, format="xml")
+        analyzer.close()
+
+    def test_shared_analyzer_is_reused(self, monkeypatch):
+        """get_trending_analyzer hands every caller the same instance."""
+        from arxiv_mcp.utils import trending_analysis
+
+        monkeypatch.chdir(self.temp_dir)
+        monkeypatch.setattr(trending_analysis, "_analyzer_instance", None)
+
+        analyzer = trending_analysis.get_trending_analyzer()
+        assert trending_analysis.get_trending_analyzer() is analyzer
+
+        analyzer.record_paper_metrics("2301.00001", {"downloads": 40}, self.today)
+        expected = analyzer.get_historical_trends("2301.00001", 7)[-1][1]
+        assert trending_analysis.quick_trending_check("2301.00001") == expected
+        analyzer.close()
+
+
 class TestSmartNewFeaturesEdgeCases:
     """Test edge cases and error handling for Smart New Features."""
 